@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,10 +11,12 @@ from app.database.models import (
     UserType,
     ProviderType,
     Service,
-    Provider,
     Owner,
 )
+from app.core.principal import Principal
 from app.core.security import decode_access_token
+from app.core.settings import settings
+from app.repositories.job_repo import JobRepository
 from app.repositories.user_repo import UserRepository
 from app.services.user_service import UserService
 
@@ -21,11 +25,11 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> User:
+) -> Principal:
     token_data = decode_access_token(token)
     user_service = UserService(repository=UserRepository(db=db))
 
-    user = await user_service.user_by_id(int(token_data.sub))
+    user = await user_service.principal_by_id(int(token_data.sub))
 
     if not user:
         raise HTTPException(
@@ -36,8 +40,8 @@ async def get_current_user(
 
 
 async def get_current_active_owner(
-    current_user: User = Depends(get_current_user),
-) -> Owner:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if current_user.role != UserType.owner:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -48,8 +52,8 @@ async def get_current_active_owner(
 
 
 async def get_current_active_provider(
-    current_user: User = Depends(get_current_user),
-) -> Provider:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if current_user.role != UserType.provider:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -57,8 +61,8 @@ async def get_current_active_provider(
         )
 
     if (
-        current_user.provider.provider_type == ProviderType.vet
-        and not current_user.provider.is_verified
+        current_user.provider_type == ProviderType.vet
+        and not current_user.is_verified
     ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -68,9 +72,29 @@ async def get_current_active_provider(
     return current_user
 
 
+async def get_current_admin(
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
+    if current_user.role != UserType.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Пользователь не является администратором",
+        )
+
+    return current_user
+
+
+async def get_job_queue(
+    db: AsyncSession = Depends(get_db),
+) -> Optional[JobRepository]:
+    # With no worker running queued jobs would never run, so services get
+    # no queue and do the work inline.
+    return JobRepository(db) if settings.jobs_enabled else None
+
+
 async def validate_service_group(
     service_id: int,
-    current_provider: Provider = Depends(get_current_active_provider),
+    current_provider: Principal = Depends(get_current_active_provider),
     db: AsyncSession = Depends(get_db),
 ) -> Service:
 
@@ -79,12 +103,13 @@ async def validate_service_group(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Сервис не найден"
         )
-    if service.group != current_provider.service_type:
+    if service.service_type != current_provider.provider_type:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=(
-                f"Услуга '{service.name}' ({service.group}) не доступна "
-                f"для данного поставщика услуг {current_provider.service_type}"
+                f"Услуга '{service.name}' ({service.service_type.value}) не "
+                "доступна для данного поставщика услуг "
+                f"{current_provider.provider_type.value}"
             ),
         )
     return service
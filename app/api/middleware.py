@@ -0,0 +1,72 @@
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.database.metrics import RequestDBStats, request_db_stats
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing(stats: RequestDBStats) -> bytes:
+    return (
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.statements} queries", '
+        f"db-slowest;dur={stats.slowest_time * 1000:.2f}"
+    ).encode()
+
+
+class DBStatsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = request_db_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"x-db-statements", str(stats.statements).encode())
+                )
+                headers.append(
+                    (b"x-db-transactions", str(stats.transactions).encode())
+                )
+                headers.append((b"server-timing", server_timing(stats)))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            request_db_stats.reset(token)
+            self._report(scope, stats)
+
+    @staticmethod
+    def _report(scope: Scope, stats: RequestDBStats) -> None:
+        threshold = settings.db_n_plus_one_threshold
+        if threshold:
+            for statement, count in stats.repeated(threshold):
+                logger.warning(
+                    "Возможный N+1 в %s %s: запрос выполнен %d раз: %s",
+                    scope["method"],
+                    scope["path"],
+                    count,
+                    " ".join(statement.split())[:300],
+                )
+
+        if (
+            stats.slowest_statement is not None
+            and stats.slowest_time * 1000 >= settings.db_slow_statement_ms
+        ):
+            logger.warning(
+                "Медленный запрос в %s %s (%.1f мс): %s",
+                scope["method"],
+                scope["path"],
+                stats.slowest_time * 1000,
+                " ".join(stats.slowest_statement.split())[:300],
+            )
@@ -0,0 +1,115 @@
+import csv
+import io
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    Sequence,
+)
+
+import orjson
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import RowMapping
+
+from app.core.response_cache import CachedResponse, etag_matches
+from app.core.serialization import type_adapter
+
+
+class PydanticResponse(Response):
+    media_type = "application/json"
+
+    def __init__(self, tp: Any, content: Any, status_code: int = 200):
+        # Returning a Response skips FastAPI's response_model round trip
+        # (validate, jsonable_encoder, json.dumps): ORM objects are validated
+        # once and dumped to bytes by pydantic-core.
+        adapter = type_adapter(tp)
+        body = adapter.dump_json(
+            adapter.validate_python(content, from_attributes=True)
+        )
+        super().__init__(body, status_code=status_code)
+
+
+def cached_response(
+    cached: CachedResponse, if_none_match: Optional[str] = None
+) -> Response:
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
+
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def encode_csv(
+    chunks: AsyncIterator[Sequence[RowMapping]],
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header = True
+    async for rows in chunks:
+        if header and rows:
+            writer.writerow(rows[0].keys())
+            header = False
+        for row in rows:
+            writer.writerow([_csv_value(value) for value in row.values()])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+async def encode_ndjson(
+    chunks: AsyncIterator[Sequence[RowMapping]],
+) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        yield b"".join(
+            orjson.dumps(dict(row), default=_json_default) + b"\n"
+            for row in rows
+        )
+
+
+def export_response(
+    chunks: AsyncIterator[Sequence[RowMapping]],
+    fmt: ExportFormat,
+    filename: str,
+    close: Optional[Callable[[], Awaitable[None]]] = None,
+) -> StreamingResponse:
+    encode = encode_csv if fmt == "csv" else encode_ndjson
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in encode(chunks):
+                yield chunk
+        finally:
+            if close is not None:
+                await close()
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{fmt}"'
+        },
+    )
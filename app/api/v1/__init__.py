@@ -1,5 +1,7 @@
 from .auth import router as users_router
 from .booking import router as booking_router
+from .internal import router as internal_router
+from .search import router as search_router
 from .service import router as service_router
 from .owner.pet import router as pet_router
 from .provider.slot import router as slot_router
@@ -7,6 +9,8 @@ from .provider.slot import router as slot_router
 __all__ = [
     "users_router",
     "booking_router",
+    "internal_router",
+    "search_router",
     "service_router",
     "pet_router",
     "slot_router",
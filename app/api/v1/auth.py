@@ -1,23 +1,29 @@
+from typing import List, Optional
+
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token
-from app.database.models import User
-from app.services import UserService
-from app.repositories import UserRepository
-from app.repositories import ServiceRepository
+from app.core.principal import Principal
+from app.core.security import keyring, revoke_access_token
+from app.core.sessions import session_cache
+from app.services import SessionService, UserService
+from app.services.session_service import RefreshTokenReused
+from app.repositories import SessionRepository, UserRepository
+from app.repositories import JobRepository, ServiceRepository
 from app.database.connection import get_db
 from app.schemas import (
     UserOut,
     UserAuth,
     Token,
+    RefreshRequest,
+    SessionOut,
     OwnerCreate,
     ProviderCreate,
     OwnerOut,
     ProviderOut,
 )
-from app.api.depends import get_current_user
+from app.api.depends import get_current_user, get_job_queue, oauth2_scheme
 
 router = APIRouter()
 
@@ -32,10 +38,14 @@ async def register_owner(
 
 @router.post("/register/provider", response_model=ProviderOut)
 async def register_provider(
-    provider_in: ProviderCreate, db: AsyncSession = Depends(get_db)
+    provider_in: ProviderCreate,
+    db: AsyncSession = Depends(get_db),
+    jobs: Optional[JobRepository] = Depends(get_job_queue),
 ):
     service = UserService(
-        repository=UserRepository(db), service_repository=ServiceRepository(db)
+        repository=UserRepository(db),
+        service_repository=ServiceRepository(db),
+        jobs=jobs,
     )
 
     return await service.register_provider(provider_in)
@@ -44,6 +54,7 @@ async def register_provider(
 @router.post("/login", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
+    user_agent: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ):
     user_auth = UserAuth(email=form_data.username, password=form_data.password)
@@ -57,21 +68,94 @@ async def login_for_access_token(
             detail="Неверный логин или пароль",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = create_access_token(
-        subject=str(auth_user.id),
-        role=auth_user.role.value,
+    sessions = SessionService(
+        repository=SessionRepository(db), cache=session_cache
     )
+    return await sessions.login(auth_user, user_agent)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    data: RefreshRequest, db: AsyncSession = Depends(get_db)
+):
+    sessions = SessionService(
+        repository=SessionRepository(db), cache=session_cache
+    )
+    try:
+        return await sessions.refresh(data.refresh_token)
+    except RefreshTokenReused:
+        # The request fails, and get_db would roll the revocation back.
+        await db.commit()
+        raise
+
+
+@router.post("/logout")
+async def logout(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+):
+    """Revokes the access token and ends its session.
+
+    The refresh token stops working everywhere at once. The access token is
+    revoked only in this worker process; other workers accept it until it
+    expires (ACCESS_TOKEN_EXPIRE_MINUTES).
+    """
+    token_data = revoke_access_token(token)
+    if token_data.sid is not None:
+        sessions = SessionService(
+            repository=SessionRepository(db), cache=session_cache
+        )
+        await sessions.revoke_session(
+            int(token_data.sub), token_data.sid, missing_ok=True
+        )
+    return {"detail": "Токен отозван"}
+
+
+@router.get("/sessions", response_model=List[SessionOut])
+async def list_sessions(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    sessions = SessionService(
+        repository=SessionRepository(db), cache=session_cache
+    )
+    return await sessions.list_sessions(current_user.id)
+
+
+@router.delete("/sessions/{session_id}")
+async def revoke_session(
+    session_id: str,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ends the session; see ``logout`` for how far its access tokens reach."""
+    sessions = SessionService(
+        repository=SessionRepository(db), cache=session_cache
+    )
+    await sessions.revoke_session(current_user.id, session_id)
+    return {"detail": "Сессия завершена"}
+
+
+@router.delete("/sessions")
+async def revoke_all_sessions(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ends every session; see ``logout`` for how far access tokens reach."""
+    sessions = SessionService(
+        repository=SessionRepository(db), cache=session_cache
+    )
+    revoked = await sessions.revoke_all(current_user.id)
+    return {"detail": f"Завершено сессий: {revoked}"}
+
 
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "role": auth_user.role.value,
-    }
+@router.get("/jwks")
+async def get_jwks():
+    return keyring.jwks()
 
 
 @router.get("/profile", response_model=UserOut)
-async def get_profile(current_user: User = Depends(get_current_user)):
-    return UserOut.from_orm(current_user)
+async def get_profile(current_user: Principal = Depends(get_current_user)):
+    return UserOut.model_validate(current_user)
 
 
 @router.get("/profile/{user_id}", response_model=UserOut)
@@ -1,14 +1,30 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import date
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.api.depends import get_current_active_owner
-from app.database.models import User, Pet
-from app.repositories import BookingRepository
-from app.schemas import BookingCreate, BookingOut
+from app.api.depends import (
+    get_current_active_owner,
+    get_current_active_provider,
+    get_current_user,
+)
+from app.api.responses import PydanticResponse, ExportFormat, export_response
+from app.core.principal import Principal
+from app.database.models import Pet
+from app.database.types import BookingStatus
+from app.repositories import BookingRepository, SlotRepository
+from app.schemas import (
+    BookingCreate,
+    BookingOut,
+    BookingPage,
+    BookingDayStats,
+    OwnerBookingPage,
+)
 
 
-from app.database.connection import get_db
+from app.database.connection import get_db, get_stream_db
 from app.services import BookingService
 
 router = APIRouter()
@@ -18,9 +34,11 @@ router = APIRouter()
 async def create_booking(
     booking_in: BookingCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
-    service = BookingService(repository=BookingRepository(db))
+    service = BookingService(
+        repository=BookingRepository(db), slot_repository=SlotRepository(db)
+    )
 
     pet = await db.get(Pet, booking_in.pet_id)
     if not pet or pet.owner_id != current_user.id:
@@ -36,7 +54,88 @@ async def create_booking(
 async def cancel_booking(
     booking_id: int,
     db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ):
-    service = BookingService(repository=BookingRepository(db))
-    await service.delete_booking(booking_id)
+    service = BookingService(
+        repository=BookingRepository(db), slot_repository=SlotRepository(db)
+    )
+    await service.delete_booking(booking_id, current_user.id)
     return {"detail": "Бронирование отменено"}
+
+
+@router.get("/provider/feed", response_model=BookingPage)
+async def provider_booking_feed(
+    booking_status: Optional[BookingStatus] = Query(
+        default=None, alias="status"
+    ),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = BookingService(repository=BookingRepository(db))
+
+    page = await service.provider_feed(
+        current_provider.id,
+        booking_status,
+        date_from,
+        date_to,
+        cursor,
+        limit,
+        with_total,
+    )
+    return PydanticResponse(BookingPage, page)
+
+
+@router.get("/provider/stats", response_model=List[BookingDayStats])
+async def provider_booking_stats(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = BookingService(repository=BookingRepository(db))
+
+    return await service.provider_stats(current_provider.id, date_from, date_to)
+
+
+@router.get("/provider/export")
+async def export_provider_bookings(
+    fmt: ExportFormat = Query(default="csv", alias="format"),
+    booking_status: Optional[BookingStatus] = Query(
+        default=None, alias="status"
+    ),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_stream_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = BookingService(repository=BookingRepository(db))
+
+    chunks = service.export_provider_bookings(
+        current_provider.id, booking_status, date_from, date_to
+    )
+    return export_response(chunks, fmt, "bookings", close=db.close)
+
+
+@router.get("/owner/timeline", response_model=OwnerBookingPage)
+async def owner_booking_timeline(
+    period: Literal["upcoming", "past"] = "upcoming",
+    booking_status: Optional[BookingStatus] = Query(
+        default=None, alias="status"
+    ),
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_owner),
+):
+    service = BookingService(repository=BookingRepository(db))
+
+    page = await service.list_of_owner_booking(
+        current_user.id, period, booking_status, cursor, limit, with_total
+    )
+    return PydanticResponse(OwnerBookingPage, page)
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.depends import get_current_admin
+from app.database.connection import get_db, get_pool_metrics
+from app.repositories import JobRepository
+
+# Pool internals, boot timings and queue state are for operators only.
+router = APIRouter(dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/pool")
+async def pool_status():
+    return get_pool_metrics()
+
+
+@router.get("/startup")
+async def startup_timings(request: Request):
+    return request.app.state.startup
+
+
+@router.get("/jobs")
+async def job_status(request: Request, db: AsyncSession = Depends(get_db)):
+    worker = getattr(request.app.state, "jobs", None)
+    return {
+        "worker": worker.snapshot() if worker is not None else None,
+        "queue": await JobRepository(db).stats(datetime.utcnow()),
+    }
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.depends import get_current_active_owner
-from app.database.models import Owner
+from app.api.responses import PydanticResponse, ExportFormat, export_response
+from app.core.principal import Principal
 from app.repositories import MedicalRecordRepo
 from app.services import PetService, MedRecordService
 from app.repositories import PetRepository
@@ -14,30 +15,50 @@ from app.schemas import (
     PetUpdate,
     MedicalRecordBase,
     MedicalRecordOut,
+    MedicalRecordPage,
+    PetPage,
 )
-from app.database.connection import get_db
+from app.database.connection import get_db, get_stream_db
 
 
 router = APIRouter()
 
 
-@router.post("/list_pets", response_model=List[PetOut])
+@router.post("/list_pets", response_model=List[PetOut], deprecated=True)
 async def get_pets(
     db: AsyncSession = Depends(get_db),
-    current_user: Owner = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
+    """Unbounded list; use the paged ``GET /list_pets`` instead."""
     pet_service = PetService(pet_repository=PetRepository(db=db))
 
     list_pets = await pet_service.list_pets_by_owner(owner_id=current_user.id)
     if list_pets is None:
         raise HTTPException(status_code=400, detail="У вас нет ни одного питомца")
-    return list_pets
+    return PydanticResponse(List[PetOut], list_pets)
+
+@router.get("/list_pets", response_model=PetPage)
+async def get_pet_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    summary: bool = False,
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_owner),
+):
+    pet_service = PetService(pet_repository=PetRepository(db=db))
+
+    page = await pet_service.list_pets_page(
+        current_user.id, cursor, limit, summary, with_total
+    )
+    return PydanticResponse(PetPage, page)
+
 
 @router.post("/register", response_model=PetOut)
 async def register_pet(
     pet_in: PetCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Owner = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
     pet_service = PetService(pet_repository=PetRepository(db=db))
 
@@ -77,7 +98,7 @@ async def create_med_rec(
     med_rec_data: MedicalRecordBase,
     pet_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Owner = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
     service = MedRecordService(repository=MedicalRecordRepo(db=db),pet_repo=PetRepository(db=db))
 
@@ -89,11 +110,43 @@ async def create_med_rec(
 
     return created_med_rec
 
+@router.get("/{pet_id}/medical", response_model=MedicalRecordPage)
+async def get_med_records(
+    pet_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_owner),
+):
+    service = MedRecordService(
+        repository=MedicalRecordRepo(db=db), pet_repo=PetRepository(db=db)
+    )
+
+    page = await service.list_records(
+        current_user.id, pet_id, cursor, limit, with_total
+    )
+    return PydanticResponse(MedicalRecordPage, page)
+
+
+@router.get("/medical/export")
+async def export_medical_history(
+    pet_id: Optional[int] = None,
+    fmt: ExportFormat = Query(default="csv", alias="format"),
+    db: AsyncSession = Depends(get_stream_db),
+    current_user: Principal = Depends(get_current_active_owner),
+):
+    service = MedRecordService(repository=MedicalRecordRepo(db=db))
+
+    chunks = service.export_history(current_user.id, pet_id)
+    return export_response(chunks, fmt, "medical_history", close=db.close)
+
+
 @router.delete("medical/delete/{med_rec_id}", status_code=204)
 async def delete_med_rec(
     med_rec_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Owner = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
     service = MedRecordService(repository=MedicalRecordRepo(db=db))
 
@@ -109,7 +162,7 @@ async def update_med_rec_for_pet(
     med_rec_id: int,
     med_rec_data: MedicalRecordBase,
     db: AsyncSession = Depends(get_db),
-    current_user: Owner = Depends(get_current_active_owner),
+    current_user: Principal = Depends(get_current_active_owner),
 ):
     service = MedRecordService(repository=MedicalRecordRepo(db=db))
 
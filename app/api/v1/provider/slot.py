@@ -1,13 +1,21 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.depends import get_current_active_provider
-from app.database.models import Provider
+from app.api.responses import PydanticResponse
+from app.core.principal import Principal
 from app.repositories import SlotRepository
 from app.repositories import UserRepository
-from app.schemas import SlotOut
+from app.schemas import (
+    SlotOut,
+    SlotPage,
+    SlotBulkCreate,
+    SlotSchedule,
+    SlotBatchSummary,
+)
 
 from app.database.connection import get_db
 from app.schemas import SlotCreate
@@ -20,7 +28,7 @@ router = APIRouter()
 async def create_slot(
     slot_in: SlotCreate,
     db: AsyncSession = Depends(get_db),
-    current_provider: Provider = Depends(get_current_active_provider),
+    current_provider: Principal = Depends(get_current_active_provider),
 ):
     service = SlotService(
         slot_repository=SlotRepository(db), user_repository=UserRepository(db)
@@ -29,13 +37,57 @@ async def create_slot(
     return await service.create_slot(slot_in, current_provider.id)
 
 
-@router.post("/list", response_model=List[SlotOut])
+@router.post("/create/bulk", response_model=SlotBatchSummary)
+async def create_slots_bulk(
+    slots_in: SlotBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = SlotService(slot_repository=SlotRepository(db))
+
+    return await service.create_slots(slots_in.slots, current_provider.id)
+
+
+@router.post("/create/schedule", response_model=SlotBatchSummary)
+async def create_slot_schedule(
+    schedule: SlotSchedule,
+    db: AsyncSession = Depends(get_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = SlotService(slot_repository=SlotRepository(db))
+
+    return await service.create_schedule(schedule, current_provider.id)
+
+
+@router.post("/list", response_model=List[SlotOut], deprecated=True)
 async def get_provider_slots(
     db: AsyncSession = Depends(get_db),
-    current_provider: Provider = Depends(get_current_active_provider),
+    current_provider: Principal = Depends(get_current_active_provider),
 ):
+    """Unbounded list; use the paged ``GET /list`` instead."""
     service = SlotService(
         slot_repository=SlotRepository(db), user_repository=UserRepository(db)
     )
 
-    return await service.get_list_slots(current_provider.id)
+    slots = await service.get_list_slots(current_provider.id)
+    return PydanticResponse(List[SlotOut], slots)
+
+
+@router.get("/list", response_model=SlotPage)
+async def get_provider_slot_page(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_provider: Principal = Depends(get_current_active_provider),
+):
+    service = SlotService(
+        slot_repository=SlotRepository(db), user_repository=UserRepository(db)
+    )
+
+    page = await service.get_slot_page(
+        current_provider.id, date_from, date_to, cursor, limit, with_total
+    )
+    return PydanticResponse(SlotPage, page)
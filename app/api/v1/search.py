@@ -0,0 +1,85 @@
+from datetime import date, time
+from decimal import Decimal
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.depends import get_current_active_owner
+from app.api.responses import PydanticResponse
+from app.core.principal import Principal
+from app.core.settings import settings
+from app.database.connection import get_db
+from app.database.types import ProviderType, AnimalType
+from app.repositories import (
+    ProviderRepository,
+    SlotRepository,
+    UserRepository,
+)
+from app.schemas import SlotSearchResult, ProviderNearbyOut
+from app.services import DiscoveryService, SlotService
+
+router = APIRouter()
+
+
+@router.get("/slots", response_model=List[SlotSearchResult])
+async def search_slots(
+    provider_type: Optional[ProviderType] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    time_from: Optional[time] = None,
+    time_to: Optional[time] = None,
+    min_duration: Optional[int] = Query(default=None, ge=1),
+    max_price: Optional[Decimal] = Query(default=None, ge=0),
+    animal_type: Optional[AnimalType] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    service = SlotService(slot_repository=SlotRepository(db))
+
+    slots = await service.search_available_slots(
+        provider_type=provider_type,
+        date_from=date_from,
+        date_to=date_to,
+        time_from=time_from,
+        time_to=time_to,
+        min_duration=min_duration,
+        max_price=max_price,
+        animal_type=animal_type,
+        limit=limit,
+    )
+    return PydanticResponse(List[SlotSearchResult], slots)
+
+
+@router.get("/providers/nearest", response_model=List[ProviderNearbyOut])
+async def nearest_providers(
+    latitude: float = Query(ge=-90, le=90),
+    longitude: float = Query(ge=-180, le=180),
+    provider_type: Optional[ProviderType] = None,
+    limit: int = Query(default=10, ge=1, le=100),
+    max_distance_km: Optional[float] = Query(
+        default=None, gt=0, le=settings.geo_nearest_max_distance_km
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    service = DiscoveryService(provider_repository=ProviderRepository(db))
+
+    return await service.nearest_providers(
+        latitude, longitude, limit, provider_type, max_distance_km
+    )
+
+
+@router.get("/providers/covering", response_model=List[ProviderNearbyOut])
+async def providers_covering_owner(
+    provider_type: Optional[ProviderType] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_owner),
+):
+    service = DiscoveryService(
+        provider_repository=ProviderRepository(db),
+        user_repository=UserRepository(db),
+    )
+
+    return await service.providers_covering_owner(
+        current_user.id, provider_type
+    )
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.depends import get_current_active_provider
+from app.api.depends import get_current_active_provider, get_job_queue
+from app.api.responses import PydanticResponse, cached_response
+from app.core.principal import Principal
+from app.core.response_cache import response_cache
 from app.database.connection import get_db
-from app.database.models import Provider
-from app.repositories import ServiceRepository
+from app.repositories import JobRepository, ServiceRepository
 from app.services import ServiceService
 from app.schemas import (
     VeterinaryServiceCreate,
@@ -15,6 +19,7 @@ from app.schemas import (
     SittingServiceOut,
     ProviderServiceUpdate,
     ProviderServiceOut,
+    ProviderServicePage,
 )
 
 router = APIRouter()
@@ -24,8 +29,11 @@ router = APIRouter()
 async def create_vet_service(
     data: VeterinaryServiceCreate,
     db: AsyncSession = Depends(get_db),
+    jobs: Optional[JobRepository] = Depends(get_job_queue),
 ):
-    service = ServiceService(repository=ServiceRepository(db))
+    service = ServiceService(
+        repository=ServiceRepository(db), jobs=jobs, cache=response_cache
+    )
     return await service.create_vet_service(data)
 
 
@@ -33,8 +41,11 @@ async def create_vet_service(
 async def create_grooming_service(
     data: GroomingServiceCreate,
     db: AsyncSession = Depends(get_db),
+    jobs: Optional[JobRepository] = Depends(get_job_queue),
 ):
-    service = ServiceService(repository=ServiceRepository(db))
+    service = ServiceService(
+        repository=ServiceRepository(db), jobs=jobs, cache=response_cache
+    )
     return await service.create_grooming_service(data)
 
 
@@ -42,28 +53,58 @@ async def create_grooming_service(
 async def create_sitting_service(
     data: SittingServiceCreate,
     db: AsyncSession = Depends(get_db),
+    jobs: Optional[JobRepository] = Depends(get_job_queue),
 ):
-    service = ServiceService(repository=ServiceRepository(db))
+    service = ServiceService(
+        repository=ServiceRepository(db), jobs=jobs, cache=response_cache
+    )
     return await service.create_sitter_service(data)
 
 
-@router.get("/get/{provider_id}", response_model=list[ProviderServiceOut])
+@router.get(
+    "/get/{provider_id}",
+    response_model=list[ProviderServiceOut],
+    deprecated=True,
+)
 async def get_provider_services(
     provider_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Unbounded list; use the paged ``GET /list/{provider_id}`` instead."""
+    service = ServiceService(
+        repository=ServiceRepository(db), cache=response_cache
+    )
+    cached = await service.cached_services(provider_id)
+    return cached_response(cached, if_none_match)
+
+
+@router.get("/list/{provider_id}", response_model=ProviderServicePage)
+async def get_provider_service_page(
+    provider_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    with_total: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
     service = ServiceService(repository=ServiceRepository(db))
-    return await service.list_services(provider_id)
+
+    page = await service.list_services_page(
+        provider_id, cursor, limit, with_total
+    )
+    return PydanticResponse(ProviderServicePage, page)
 
 
 @router.put("/update/{provider_service_id}", response_model=ProviderServiceOut)
 async def update_provider_service(
     provider_service_id: int,
     update_data: ProviderServiceUpdate,
-    current_provider: Provider = Depends(get_current_active_provider),
+    current_provider: Principal = Depends(get_current_active_provider),
     db: AsyncSession = Depends(get_db),
 ):
-    service = ServiceService(repository=ServiceRepository(db))
+    service = ServiceService(
+        repository=ServiceRepository(db), cache=response_cache
+    )
     return await service.update_service(
         current_provider.id, provider_service_id, update_data
     )
@@ -72,9 +113,11 @@ async def update_provider_service(
 @router.delete("delete/{provider_service_id}")
 async def delete_provider_service(
     provider_service_id: int,
-    current_provider: Provider = Depends(get_current_active_provider),
+    current_provider: Principal = Depends(get_current_active_provider),
     db: AsyncSession = Depends(get_db),
 ):
-    service = ServiceService(repository=ServiceRepository(db))
+    service = ServiceService(
+        repository=ServiceRepository(db), cache=response_cache
+    )
     await service.delete_service(current_provider.id, provider_service_id)
     return {"detail": "Связь с услугой удалена"}
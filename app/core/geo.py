@@ -0,0 +1,73 @@
+import math
+
+# providers.geo_cell is stored from this value: changing it needs a
+# migration that recomputes the column, or lookups miss existing rows.
+CELL_SIZE_DEG = 0.1
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+# Great-circle paths bow towards the pole, so a point within the radius can
+# sit slightly further away in longitude than the parallel arc suggests.
+RADIUS_SLACK = 1.01
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _grid_columns() -> int:
+    return math.ceil(360 / CELL_SIZE_DEG)
+
+
+def _grid_row(lat: float) -> int:
+    rows = math.ceil(180 / CELL_SIZE_DEG)
+    return min(int((lat + 90) // CELL_SIZE_DEG), rows - 1)
+
+
+def _grid_col(lon: float) -> int:
+    columns = _grid_columns()
+    return int(((lon + 180) % 360) // CELL_SIZE_DEG) % columns
+
+
+def grid_cell(lat: float, lon: float) -> int:
+    return _grid_row(lat) * _grid_columns() + _grid_col(lon)
+
+
+def degree_window(lat: float, radius_km: float) -> tuple[float, float]:
+    radius_km *= RADIUS_SLACK
+    d_lat = radius_km / KM_PER_DEGREE
+    edge_lat = min(abs(lat) + d_lat, 90)
+    cos_lat = max(math.cos(math.radians(edge_lat)), 1e-6)
+    return d_lat, min(radius_km / (KM_PER_DEGREE * cos_lat), 180)
+
+
+def cell_ranges(
+    lat: float, lon: float, radius_km: float
+) -> list[tuple[int, int]]:
+    columns = _grid_columns()
+    d_lat, d_lon = degree_window(lat, radius_km)
+
+    row_min = _grid_row(max(lat - d_lat, -90))
+    row_max = _grid_row(min(lat + d_lat, 90))
+    col_min = _grid_col(lon - d_lon)
+    col_max = _grid_col(lon + d_lon)
+
+    if d_lon >= 180:
+        col_spans = [(0, columns - 1)]
+    elif col_min <= col_max:
+        col_spans = [(col_min, col_max)]
+    else:
+        col_spans = [(col_min, columns - 1), (0, col_max)]
+
+    return [
+        (row * columns + start, row * columns + end)
+        for row in range(row_min, row_max + 1)
+        for start, end in col_spans
+    ]
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+from app.database.models import User, ProviderDocument
+from app.database.types import UserType, ProviderType
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    email: str
+    first_name: Optional[str]
+    surname: Optional[str]
+    patronymic: Optional[str]
+    role: UserType
+    provider_type: Optional[ProviderType] = None
+    is_verified: bool = False
+
+
+principal_cache: TTLCache[int, Principal] = TTLCache(
+    maxsize=settings.principal_cache_size,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+
+
+PENDING_KEY = "principal_cache:pending"
+
+
+def invalidate_principal(user_id: Optional[int]) -> None:
+    if user_id is not None:
+        principal_cache.invalidate(user_id)
+
+
+def _defer_invalidation(target, user_id: Optional[int]) -> None:
+    # Flush-time events fire before commit; dropping the entry now would
+    # let a concurrent request re-cache the old row until the TTL expires.
+    session = object_session(target)
+    if session is None:
+        invalidate_principal(user_id)
+    elif user_id is not None:
+        session.info.setdefault(PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(User, "after_update", propagate=True)
+@event.listens_for(User, "after_delete", propagate=True)
+def _invalidate_user(mapper, connection, target: User) -> None:
+    _defer_invalidation(target, target.id)
+
+
+@event.listens_for(ProviderDocument, "after_insert")
+@event.listens_for(ProviderDocument, "after_update")
+@event.listens_for(ProviderDocument, "after_delete")
+def _invalidate_provider_document(
+    mapper, connection, target: ProviderDocument
+) -> None:
+    _defer_invalidation(target, target.provider_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(PENDING_KEY, ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,138 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int, ttl: float):
+        self._data: TTLCache[str, bytes] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+        return self._data.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.invalidate(key)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._counters.clear()
+
+
+class RedisBackend:
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(key, value, ex=max(int(ttl), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
+
+
+class ResponseCache:
+    def __init__(
+        self, backend: CacheBackend, ttl: float, namespace: str = "petcare"
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.backend.get(self._key(key))
+        if raw is None:
+            return None
+        etag, _, body = raw.partition(b"\n")
+        return CachedResponse(body=body, etag=etag.decode())
+
+    async def set(self, key: str, body: bytes) -> CachedResponse:
+        cached = CachedResponse(body=body, etag=make_etag(body))
+        await self.backend.set(
+            self._key(key), cached.etag.encode() + b"\n" + body, self.ttl
+        )
+        return cached
+
+    async def delete(self, key: str) -> None:
+        await self.backend.delete(self._key(key))
+
+    async def generation(self, key: str) -> int:
+        raw = await self.backend.get(self._key(key))
+        return int(raw) if raw is not None else 0
+
+    async def bump(self, key: str) -> int:
+        return await self.backend.incr(self._key(key))
+
+    def clear(self) -> None:
+        if isinstance(self.backend, MemoryBackend):
+            self.backend.clear()
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+def build_response_cache() -> ResponseCache:
+    if settings.response_cache_backend == "redis":
+        from redis import asyncio as redis
+
+        backend = RedisBackend(
+            redis.from_url(settings.response_cache_url or "redis://")
+        )
+    else:
+        backend = MemoryBackend(
+            maxsize=settings.response_cache_size,
+            ttl=settings.response_cache_ttl_seconds,
+        )
+    return ResponseCache(backend, ttl=settings.response_cache_ttl_seconds)
+
+
+response_cache = build_response_cache()
@@ -1,3 +1,11 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timedelta
 from typing import Optional
 import jwt
@@ -6,13 +14,28 @@ from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.schemas import TokenData
+from app.core.cache import TTLCache
 from app.core.settings import settings
+from app.core.tokens import Keyring, RevocationList, token_digest
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+_hash_executor: Optional[Executor] = None
+_hash_pending = 0
+
+keyring = Keyring.from_settings(settings)
+revoked_tokens = RevocationList()
+token_cache: TTLCache[bytes, TokenData] = TTLCache(
+    maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl_seconds
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -22,22 +45,105 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        if settings.password_hash_executor == "process":
+            _hash_executor = ProcessPoolExecutor(
+                max_workers=settings.password_hash_workers
+            )
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=settings.password_hash_workers,
+                thread_name_prefix="password-hash",
+            )
+    return _hash_executor
+
+
+async def _run_in_hash_pool(func, *args):
+    global _hash_pending
+    if _hash_pending >= settings.password_hash_max_pending:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Сервер перегружен, повторите попытку позже",
+            headers={"Retry-After": "1"},
+        )
+
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await _run_in_hash_pool(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return await _run_in_hash_pool(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
 def create_access_token(
-    subject: str, role: str, expires_delta: Optional[timedelta] = None
+    subject: str,
+    role: str,
+    expires_delta: Optional[timedelta] = None,
+    session_id: Optional[str] = None,
 ) -> str:
     expire = datetime.utcnow() + (
         expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
     )
-    to_encode = {"sub": subject, "role": role, "exp": expire}
+    to_encode = {
+        "sub": subject,
+        "role": role,
+        "exp": expire,
+        "jti": uuid.uuid4().hex,
+    }
+    if session_id is not None:
+        to_encode["sid"] = session_id
+    key = keyring.active
     return jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
+        to_encode,
+        key.signing_key,
+        algorithm=key.algorithm,
+        headers={"kid": key.kid},
     )
 
 
-def decode_access_token(token: str) -> TokenData:
+def _verify(token: str) -> TokenData:
     try:
+        key = keyring.get(jwt.get_unverified_header(token).get("kid"))
         payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
+            token,
+            key.verifying_key,
+            algorithms=[key.algorithm],
+            options={"require": ["exp"]},
         )
         return TokenData(**payload)
     except jwt.PyJWTError as e:
@@ -45,3 +151,44 @@ def decode_access_token(token: str) -> TokenData:
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Ошибка валидации токена: {str(e)}",
         )
+
+
+def decode_access_token(token: str) -> TokenData:
+    digest = token_digest(token)
+    token_data = token_cache.get(digest)
+    if token_data is None:
+        token_data = _verify(token)
+        # A cached token must not outlive its exp.
+        ttl = min(token_data.exp - time.time(), token_cache.ttl)
+        if ttl > 0:
+            token_cache.set(digest, token_data, ttl=ttl)
+
+    if revoked_tokens.is_revoked(
+        _revocation_id(token_data, digest), token_data.sid
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Токен отозван",
+        )
+    return token_data
+
+
+def _revocation_id(token_data: TokenData, digest: bytes) -> str:
+    # Tokens issued before jti was added are revoked by their digest.
+    return token_data.jti or digest.hex()
+
+
+def revoke_access_token(token: str) -> TokenData:
+    token_data = decode_access_token(token)
+    digest = token_digest(token)
+    revoked_tokens.revoke(_revocation_id(token_data, digest), token_data.exp)
+    token_cache.invalidate(digest)
+    return token_data
+
+
+def revoke_session_tokens(session_id: str) -> None:
+    # Access tokens of a session outlive it by at most their own lifetime.
+    revoked_tokens.revoke(
+        session_id,
+        time.time() + settings.access_token_expire_minutes * 60,
+    )
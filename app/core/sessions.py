@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class SessionState:
+    user_id: int
+    expires_at: datetime
+    revoked: bool = False
+
+
+# Written through on every session write; lets refresh reject revoked and
+# expired sessions without a query. The table stays the source of truth.
+session_cache: TTLCache[str, SessionState] = TTLCache(
+    maxsize=settings.session_cache_size,
+    ttl=settings.session_cache_ttl_seconds,
+)
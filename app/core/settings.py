@@ -1,6 +1,48 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class EngineProfile(BaseModel):
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    pool_use_lifo: bool = False
+    use_null_pool: bool = False
+    query_cache_size: int = 500
+    statement_cache_size: Optional[int] = None
+    prepared_statement_cache_size: Optional[int] = None
+
+
+DEFAULT_ENGINE_PROFILES = {
+    "web": EngineProfile(
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=10,
+        pool_use_lifo=True,
+        prepared_statement_cache_size=500,
+    ),
+    "worker": EngineProfile(
+        pool_size=2,
+        max_overflow=2,
+        pool_timeout=60,
+        pool_recycle=600,
+    ),
+    "test": EngineProfile(use_null_pool=True, pool_pre_ping=False),
+}
+
+
+class JWTKeyConfig(BaseModel):
+    kid: str
+    algorithm: str
+    secret: Optional[str] = None
+    private_key: Optional[str] = None
+    public_key: Optional[str] = None
+
+
 class Settings(BaseSettings):
     database_url: str
     secret_key: str
@@ -8,6 +50,55 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int
     test_database_url: str
 
+    db_engine_profile: str = "web"
+    db_engine_profiles: dict[str, EngineProfile] = DEFAULT_ENGINE_PROFILES
+    db_request_metrics: bool = True
+    db_n_plus_one_threshold: int = 10
+    db_slow_statement_ms: float = 500
+    db_verify_revision: bool = True
+    db_pool_warmup: Optional[int] = None
+
+    jwt_keys: list[JWTKeyConfig] = []
+    jwt_active_kid: Optional[str] = None
+    token_cache_size: int = 10_000
+    token_cache_ttl_seconds: int = 300
+    refresh_token_expire_days: int = 30
+    session_cache_size: int = 10_000
+    session_cache_ttl_seconds: int = 300
+
+    principal_cache_size: int = 10_000
+    principal_cache_ttl_seconds: int = 60
+
+    response_cache_backend: Literal["memory", "redis"] = "memory"
+    response_cache_url: Optional[str] = None
+    response_cache_size: int = 10_000
+    response_cache_ttl_seconds: int = 300
+
+    bcrypt_rounds: int = 12
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+
+    ps_fanout_background_threshold: int = 5_000
+
+    jobs_run_in_process: bool = True
+    jobs_external_worker: bool = False
+    jobs_concurrency: int = 4
+    jobs_poll_interval_seconds: float = 1.0
+    jobs_lease_seconds: int = 300
+    jobs_max_attempts: int = 5
+    jobs_retry_base_seconds: float = 5
+    jobs_retry_max_seconds: float = 900
+    jobs_retention_hours: int = 24
+    jobs_shutdown_timeout_seconds: float = 10
+
+    slot_batch_max: int = 5_000
+
+    export_chunk_size: int = 1_000
+
+    geo_max_service_radius_km: int = 100
+    geo_nearest_max_distance_km: float = 200
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -15,5 +106,13 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @property
+    def engine_profile(self) -> EngineProfile:
+        return self.db_engine_profiles[self.db_engine_profile]
+
+    @property
+    def jobs_enabled(self) -> bool:
+        return self.jobs_run_in_process or self.jobs_external_worker
+
 
 settings = Settings()
@@ -0,0 +1,127 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+
+from app.core.settings import Settings
+
+# Tokens issued without a kid header are verified with settings.secret_key.
+LEGACY_KID = "default"
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    verifying_key: Any
+    signing_key: Any = None
+
+    @property
+    def symmetric(self) -> bool:
+        return self.algorithm.startswith("HS")
+
+    @classmethod
+    def load(
+        cls,
+        kid: str,
+        algorithm: str,
+        secret: Optional[str] = None,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+    ) -> "SigningKey":
+        # Keys are parsed once here, not from PEM on every jwt call.
+        algo = get_default_algorithms()[algorithm]
+        if secret is not None:
+            prepared = algo.prepare_key(secret)
+            return cls(kid, algorithm, prepared, prepared)
+        if private_key is not None:
+            private = algo.prepare_key(private_key)
+            return cls(kid, algorithm, private.public_key(), private)
+        if public_key is not None:
+            return cls(kid, algorithm, algo.prepare_key(public_key))
+        raise ValueError(f"Для ключа {kid} не задан секрет")
+
+
+class Keyring:
+    def __init__(self, keys: Iterable[SigningKey], active_kid: str):
+        self._keys = {key.kid: key for key in keys}
+        active = self._keys.get(active_kid)
+        if active is None or active.signing_key is None:
+            raise ValueError(f"Нет ключа подписи {active_kid}")
+        self.active = active
+
+    def get(self, kid: Optional[str]) -> SigningKey:
+        key = self._keys.get(LEGACY_KID if kid is None else kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Неизвестный ключ {kid}")
+        return key
+
+    def jwks(self) -> dict:
+        keys = []
+        for key in self._keys.values():
+            if key.symmetric:
+                continue
+            algo = get_default_algorithms()[key.algorithm]
+            jwk = algo.to_jwk(key.verifying_key, as_dict=True)
+            jwk.update(kid=key.kid, alg=key.algorithm, use="sig")
+            keys.append(jwk)
+        return {"keys": keys}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "Keyring":
+        keys = [
+            SigningKey.load(LEGACY_KID, settings.algorithm, settings.secret_key)
+        ]
+        keys += [
+            SigningKey.load(
+                config.kid,
+                config.algorithm,
+                config.secret,
+                config.private_key,
+                config.public_key,
+            )
+            for config in settings.jwt_keys
+            if config.kid != LEGACY_KID
+        ]
+        return cls(keys, settings.jwt_active_kid or LEGACY_KID)
+
+
+class RevocationList:
+    """Revoked token ids, kept until the token would have expired anyway.
+
+    The list lives in process memory: a revocation is not seen by other
+    workers, which keep accepting the token until it expires.
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+        if len(self._revoked) % 1024 == 0:
+            self.purge()
+
+    def is_revoked(self, *ids: Optional[str]) -> bool:
+        now = time.time()
+        return any(self._revoked.get(jti, 0) > now for jti in ids)
+
+    def purge(self) -> None:
+        now = time.time()
+        self._revoked = {
+            jti: expires_at
+            for jti, expires_at in self._revoked.items()
+            if expires_at > now
+        }
+
+    def clear(self) -> None:
+        self._revoked.clear()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
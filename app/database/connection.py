@@ -1,24 +1,101 @@
+import logging
+from typing import Awaitable, Callable
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
 )
-from app.core.settings import settings
+from sqlalchemy.pool import NullPool
+
+from app.core.settings import settings, EngineProfile
+from app.database.metrics import instrument_engine
+from app.database.pool import InstrumentedAsyncQueuePool, pool_metrics
+
+logger = logging.getLogger(__name__)
+
+AFTER_COMMIT_KEY = "after_commit"
+
 
-engine = create_async_engine(
-    settings.database_url,
+def create_engine_from_profile(url: str, profile: EngineProfile) -> AsyncEngine:
+    kwargs = {
+        "pool_pre_ping": profile.pool_pre_ping,
+        "query_cache_size": profile.query_cache_size,
+    }
+    if profile.use_null_pool:
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle,
+            pool_use_lifo=profile.pool_use_lifo,
+        )
+
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = {}
+        if profile.statement_cache_size is not None:
+            connect_args["statement_cache_size"] = profile.statement_cache_size
+        if profile.prepared_statement_cache_size is not None:
+            connect_args["prepared_statement_cache_size"] = (
+                profile.prepared_statement_cache_size
+            )
+        kwargs["connect_args"] = connect_args
+
+    return create_async_engine(url, **kwargs)
+
+
+engine = create_engine_from_profile(
+    settings.database_url, settings.engine_profile
 )
+if settings.db_request_metrics:
+    instrument_engine(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
 
+def get_pool_metrics() -> dict:
+    return {
+        "profile": settings.db_engine_profile,
+        **pool_metrics(engine.pool),
+    }
+
+
+def after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    # Cache invalidation must wait for the commit: run earlier, a concurrent
+    # reader can re-cache the old rows for the whole TTL.
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Ошибка в обработчике после коммита")
+
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
         except Exception:
+            session.info.pop(AFTER_COMMIT_KEY, None)
             await session.rollback()
             raise
+        await run_after_commit(session)
+
+
+async def get_stream_db() -> AsyncSession:
+    # Streaming bodies are sent after dependencies have exited, so this
+    # session is handed over to the response, which closes it when done.
+    return AsyncSessionLocal()
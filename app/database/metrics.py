@@ -0,0 +1,79 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class RequestDBStats:
+    statements: int = 0
+    transactions: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    shapes: dict[str, int] = field(default_factory=dict)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.shapes.items()
+            if count > threshold
+        ]
+
+
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def _on_begin(conn) -> None:
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.transactions += 1
+
+
+def _on_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        # Parameters are bound, so an N+1 loop repeats the same SQL text.
+        stats.shapes[statement] = stats.shapes.get(statement, 0) + 1
+        if conn is not None:
+            conn.info.setdefault("query_started", []).append(
+                time.perf_counter()
+            )
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = request_db_stats.get()
+    if stats is None or conn is None:
+        return
+    started = conn.info.get("query_started")
+    if not started:
+        return
+
+    elapsed = time.perf_counter() - started.pop()
+    stats.db_time += elapsed
+    if elapsed > stats.slowest_time:
+        stats.slowest_time = elapsed
+        stats.slowest_statement = statement
+
+
+def _on_handle_error(context) -> None:
+    conn = context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "begin", _on_begin)
+    event.listen(engine, "before_cursor_execute", _on_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _on_handle_error)
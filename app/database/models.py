@@ -13,9 +13,17 @@ from sqlalchemy import (
     Time,
     Boolean,
     Numeric,
+    Index,
+    text,
+    BigInteger,
+    event,
+    inspect,
+    JSON,
 )
 from sqlalchemy.orm import relationship, declarative_base
 
+from app.core.geo import grid_cell
+
 from app.database.types import (
     UserType,
     ProviderType,
@@ -24,6 +32,7 @@ from app.database.types import (
     DocumentType,
     DocumentStatus,
     BookingStatus,
+    JobStatus,
 )
 
 Base = declarative_base()
@@ -52,6 +61,29 @@ class User(Base):
         return f"{self.surname} {self.first_name} {self.patronymic or ''}"
 
 
+class UserSession(Base):
+    __tablename__ = "user_sessions"
+    id = Column(String(32), primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    refresh_hash = Column(String(64), nullable=False)
+    # Bumped on every rotation; refresh tokens carry the generation they
+    # were issued for, so a replay of any older one is recognised.
+    generation = Column(Integer, nullable=False, default=0, server_default="0")
+    # Hash of the last token issued before generations existed, whose
+    # random secret cannot be re-derived.
+    previous_hash = Column(String(64))
+    user_agent = Column(String(200))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime)
+
+
 class Owner(User):
     __tablename__ = "owners"
     id = Column(
@@ -59,6 +91,8 @@ class Owner(User):
     )
     phone = Column(String(20), unique=True)
     address = Column(String(200))
+    latitude = Column(Float)
+    longitude = Column(Float)
 
     pets = relationship(
         "Pet", back_populates="owner", cascade="all, delete-orphan"
@@ -91,7 +125,7 @@ class Service(Base):
         back_populates="services",
     )
 
-    __mapper_args__ = {"polymorphic_on": service_type, "with_polymorphic": "*"}
+    __mapper_args__ = {"polymorphic_on": service_type}
 
 
 class VeterinaryService(Service):
@@ -133,10 +167,13 @@ class Provider(User):
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
     company_name = Column(String(100))
-    provider_type = Column(SAEnum(ProviderType), nullable=False)
+    provider_type = Column(SAEnum(ProviderType), nullable=False, index=True)
     service_radius_km = Column(Integer, default=10)
     hourly_rate = Column(Float(precision=2))
     is_verified = Column(Boolean, nullable=False, default=False)
+    latitude = Column(Float)
+    longitude = Column(Float)
+    geo_cell = Column(BigInteger, index=True)
 
     user = relationship("User", back_populates="provider")
 
@@ -156,13 +193,13 @@ class Provider(User):
         secondary="provider_services",
         viewonly=True,
         back_populates="providers",
-        lazy="selectin",
+        lazy="raise",
     )
     slots = relationship(
         "AvailableSlot",
         back_populates="provider",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
     __mapper_args__ = {
@@ -183,7 +220,10 @@ class ProviderService(Base):
         Integer, ForeignKey("providers.id", ondelete="CASCADE"), nullable=False
     )
     service_id = Column(
-        Integer, ForeignKey("services.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("services.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     custom_price = Column(Numeric(10, 2), nullable=False)
@@ -198,7 +238,9 @@ class ProviderService(Base):
 class Pet(Base):
     __tablename__ = "pets"
     id = Column(Integer, primary_key=True)
-    owner_id = Column(Integer, ForeignKey("owners.id", ondelete="CASCADE"))
+    owner_id = Column(
+        Integer, ForeignKey("owners.id", ondelete="CASCADE"), index=True
+    )
     name = Column(String(50), nullable=False)
     animal_type = Column(SAEnum(AnimalType), nullable=False)
     breed = Column(String(50))
@@ -218,6 +260,7 @@ class Pet(Base):
 
 class MedicalRecord(Base):
     __tablename__ = "medical_records"
+    __table_args__ = (Index("ix_medical_records_pet_date", "pet_id", "date"),)
     id = Column(Integer, primary_key=True)
     pet_id = Column(Integer, ForeignKey("pets.id", ondelete="CASCADE"))
     record_type = Column(SAEnum(RecordType), nullable=False)
@@ -252,6 +295,13 @@ class AvailableSlot(Base):
         UniqueConstraint(
             "provider_id", "date", "start_time", name="uq_slot_provider_time"
         ),
+        Index(
+            "ix_available_slots_open",
+            "date",
+            "start_time",
+            "provider_id",
+            postgresql_where=text("is_available"),
+        ),
     )
 
     id = Column(Integer, primary_key=True)
@@ -262,8 +312,14 @@ class AvailableSlot(Base):
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     is_available = Column(Boolean, default=True)
+    booked_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Capacity the slot was filled to when bookings closed it; NULL while
+    # it is open or when the provider closed it by hand.
+    filled_capacity = Column(Integer)
 
-    provider = relationship("Provider", back_populates="slots", lazy="selectin")
+    provider = relationship("Provider", back_populates="slots", lazy="raise")
     bookings = relationship("Booking", back_populates="slot")
 
 
@@ -277,12 +333,18 @@ class Booking(Base):
             "service_id",
             name="uq_booking_pet_slot_service",
         ),
+        Index(
+            "ix_bookings_active_slot_status",
+            "slot_id",
+            "status",
+            postgresql_where=text("status <> 'completed'"),
+        ),
     )
 
     id = Column(Integer, primary_key=True)
     pet_id = Column(Integer, ForeignKey("pets.id"), nullable=False)
     slot_id = Column(Integer, ForeignKey("available_slots.id"))
-    service_id = Column(ForeignKey("services.id"), nullable=False)
+    service_id = Column(ForeignKey("services.id"), nullable=False, index=True)
     status = Column(SAEnum(BookingStatus), default=BookingStatus.pending)
     notes = Column(Text, nullable=True)
 
@@ -291,3 +353,54 @@ class Booking(Base):
         "AvailableSlot", back_populates="bookings", lazy="selectin"
     )
     service = relationship("Service", lazy="selectin")
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_queued_run_at",
+            "run_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_jobs_running_locked_at",
+            "locked_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+        Index(
+            "ix_jobs_done_finished_at",
+            "finished_at",
+            postgresql_where=text("status = 'done'"),
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(SAEnum(JobStatus), nullable=False, default=JobStatus.queued)
+    idempotency_key = Column(String(200), unique=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime)
+    locked_by = Column(String(100))
+    last_error = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+
+@event.listens_for(Provider, "before_insert")
+@event.listens_for(Provider, "before_update")
+def _set_provider_geo_cell(mapper, connection, target: Provider) -> None:
+    state = inspect(target)
+    if state.persistent and not (
+        state.attrs.latitude.history.has_changes()
+        or state.attrs.longitude.history.has_changes()
+    ):
+        return
+
+    if target.latitude is None or target.longitude is None:
+        target.geo_cell = None
+    else:
+        target.geo_cell = grid_cell(target.latitude, target.longitude)
@@ -0,0 +1,76 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+
+@dataclass
+class PoolWaitStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    connects: int = 0
+    total_connect_seconds: float = 0.0
+
+    def observe(self, waited: float, connected: float = 0.0) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        if connected:
+            self.connects += 1
+            self.total_connect_seconds += connected
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        record._connect_seconds = time.perf_counter() - started
+        return record
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        # Opening a new connection is not time spent waiting for the pool
+        connected = record.__dict__.pop("_connect_seconds", 0.0)
+        self.wait_stats.observe(
+            time.perf_counter() - started - connected, connected
+        )
+        return record
+
+
+def pool_metrics(pool: Pool) -> dict:
+    if isinstance(pool, NullPool) or not hasattr(pool, "size"):
+        return {"pool_class": type(pool).__name__}
+
+    stats = getattr(pool, "wait_stats", PoolWaitStats())
+    avg_wait = (
+        stats.total_wait_seconds / stats.checkouts if stats.checkouts else 0.0
+    )
+    avg_connect = (
+        stats.total_connect_seconds / stats.connects if stats.connects else 0.0
+    )
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "avg_wait_ms": round(avg_wait * 1000, 3),
+        "max_wait_ms": round(stats.max_wait_seconds * 1000, 3),
+        "connects": stats.connects,
+        "avg_connect_ms": round(avg_connect * 1000, 3),
+    }
@@ -47,3 +47,11 @@ class BookingStatus(str, Enum):
     pending = "pending"
     confirmed = "confirmed"
     completed = "completed"
+
+
+@unique
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
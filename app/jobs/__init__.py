@@ -0,0 +1,10 @@
+from .registry import job_handler, get_handler
+from .worker import JobMetrics, Worker, retry_delay
+
+__all__ = [
+    "job_handler",
+    "get_handler",
+    "JobMetrics",
+    "Worker",
+    "retry_delay",
+]
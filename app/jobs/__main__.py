@@ -0,0 +1,8 @@
+import asyncio
+import logging
+
+from app.jobs.worker import serve
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve())
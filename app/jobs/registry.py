@@ -0,0 +1,29 @@
+from typing import Awaitable, Callable, Dict
+
+Handler = Callable[..., Awaitable[None]]
+
+_handlers: Dict[str, Handler] = {}
+
+
+def job_handler(kind: str) -> Callable[[Handler], Handler]:
+    """Register ``handler(db, **payload)`` for jobs of ``kind``.
+
+    A job may run more than once (retries, expired leases), so handlers
+    must be idempotent.
+    """
+
+    def register(handler: Handler) -> Handler:
+        registered = _handlers.get(kind)
+        if registered is not None and registered is not handler:
+            raise ValueError(f"Обработчик задач {kind} уже зарегистрирован")
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def get_handler(kind: str) -> Handler:
+    handler = _handlers.get(kind)
+    if handler is None:
+        raise LookupError(f"Нет обработчика задач {kind}")
+    return handler
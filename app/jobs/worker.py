@@ -0,0 +1,270 @@
+"""
+Runs queued jobs, either inside the web process (see app.main) or as a
+separate process:
+
+    DB_ENGINE_PROFILE=worker python -m app.jobs
+"""
+
+import asyncio
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import settings
+from app.database.connection import (
+    AsyncSessionLocal,
+    engine,
+    run_after_commit,
+)
+from app.jobs.registry import get_handler
+from app.repositories import JobRepository
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    jitter: Callable[[], float] = random.random,
+) -> float:
+    # Jobs that failed on the same outage should not all return at once.
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + delay / 2 * jitter()
+
+
+@dataclass(slots=True)
+class KindMetrics:
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    seconds_total: float = 0.0
+    seconds_max: float = 0.0
+
+
+class JobMetrics:
+    def __init__(self):
+        self.claimed = 0
+        self.kinds: dict[str, KindMetrics] = {}
+
+    def record(self, kind: str, outcome: str, elapsed: float) -> None:
+        metrics = self.kinds.setdefault(kind, KindMetrics())
+        setattr(metrics, outcome, getattr(metrics, outcome) + 1)
+        metrics.seconds_total += elapsed
+        metrics.seconds_max = max(metrics.seconds_max, elapsed)
+
+    def snapshot(self) -> dict:
+        kinds = {}
+        for kind, metrics in self.kinds.items():
+            runs = metrics.done + metrics.retried + metrics.failed
+            kinds[kind] = {
+                "done": metrics.done,
+                "retried": metrics.retried,
+                "failed": metrics.failed,
+                "avg_ms": round(metrics.seconds_total / runs * 1000, 2),
+                "max_ms": round(metrics.seconds_max * 1000, 2),
+            }
+        return {"claimed": self.claimed, "kinds": kinds}
+
+
+class Worker:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        worker_id: Optional[str] = None,
+        repository_factory: Callable[[AsyncSession], JobRepository] = (
+            JobRepository
+        ),
+    ):
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.concurrency = concurrency or settings.jobs_concurrency
+        self.poll_interval = (
+            poll_interval or settings.jobs_poll_interval_seconds
+        )
+        self.lease = timedelta(seconds=settings.jobs_lease_seconds)
+        self.retention = timedelta(hours=settings.jobs_retention_hours)
+        self.shutdown_timeout = settings.jobs_shutdown_timeout_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.metrics = JobMetrics()
+        self._active: set[asyncio.Task] = set()
+        self._maintain_after = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "running": len(self._active),
+            **self.metrics.snapshot(),
+        }
+
+    async def run_once(self) -> int:
+        jobs = await self._claim(self.concurrency)
+        await asyncio.gather(*(self._execute(job) for job in jobs))
+        return len(jobs)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        stopping = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                try:
+                    await self._maintain()
+                    free = self.concurrency - len(self._active)
+                    jobs = await self._claim(free) if free else []
+                    for job in jobs:
+                        task = asyncio.create_task(self._execute(job))
+                        self._active.add(task)
+                        task.add_done_callback(self._active.discard)
+                except Exception:
+                    logger.exception("Не удалось получить задачи из очереди")
+                # Wakes up early when a slot frees, so a backlog drains
+                # without waiting out the poll interval.
+                await asyncio.wait(
+                    {stopping, *self._active},
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            stopping.cancel()
+            await self._drain()
+
+    async def _drain(self) -> None:
+        if not self._active:
+            return
+        _, pending = await asyncio.wait(
+            self._active, timeout=self.shutdown_timeout
+        )
+        # Cancelled jobs keep their lease and are requeued once it expires.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.warning("Прервано задач при остановке: %s", len(pending))
+
+    async def _claim(self, limit: int) -> list[Row]:
+        async with self.session_factory() as db:
+            jobs = await self.repository_factory(db).claim(
+                self.worker_id, limit, datetime.utcnow()
+            )
+            await db.commit()
+        self.metrics.claimed += len(jobs)
+        return jobs
+
+    async def _maintain(self) -> None:
+        if time.monotonic() < self._maintain_after:
+            return
+        self._maintain_after = time.monotonic() + self.lease.total_seconds() / 2
+
+        now = datetime.utcnow()
+        async with self.session_factory() as db:
+            repository = self.repository_factory(db)
+            requeued = await repository.requeue_stale(now - self.lease)
+            await repository.purge_finished(now - self.retention)
+            await db.commit()
+        if requeued:
+            logger.warning(
+                "Вернули в очередь %s задач с истекшей арендой", requeued
+            )
+
+    async def _execute(self, job: Row) -> None:
+        started = time.perf_counter()
+        try:
+            handler = get_handler(job.kind)
+            async with self.session_factory() as db:
+                heartbeat = asyncio.create_task(self._heartbeat(job.id))
+                try:
+                    await handler(db, **job.payload)
+                finally:
+                    heartbeat.cancel()
+                await self.repository_factory(db).complete(
+                    job.id, self.worker_id, datetime.utcnow()
+                )
+                await db.commit()
+                await run_after_commit(db)
+        except Exception as exc:
+            await self._failed(job, exc, time.perf_counter() - started)
+        else:
+            self.metrics.record(job.kind, "done", time.perf_counter() - started)
+
+    async def _heartbeat(self, job_id: int) -> None:
+        # Without it a handler outliving the lease is requeued by _maintain
+        # and runs a second time next to itself.
+        while True:
+            await asyncio.sleep(self.lease.total_seconds() / 3)
+            try:
+                async with self.session_factory() as db:
+                    renewed = await self.repository_factory(db).heartbeat(
+                        job_id, self.worker_id, datetime.utcnow()
+                    )
+                    await db.commit()
+            except Exception:
+                logger.exception("Не удалось продлить аренду задачи %s", job_id)
+                continue
+            if not renewed:
+                logger.warning("Аренда задачи %s потеряна", job_id)
+                return
+
+    async def _failed(self, job: Row, exc: Exception, elapsed: float) -> None:
+        error = f"{type(exc).__name__}: {exc}"[:2000]
+        final = job.attempts >= job.max_attempts
+        now = datetime.utcnow()
+        try:
+            async with self.session_factory() as db:
+                repository = self.repository_factory(db)
+                if final:
+                    await repository.fail(job.id, self.worker_id, now, error)
+                else:
+                    delay = retry_delay(
+                        job.attempts,
+                        settings.jobs_retry_base_seconds,
+                        settings.jobs_retry_max_seconds,
+                    )
+                    await repository.retry(
+                        job.id,
+                        self.worker_id,
+                        now + timedelta(seconds=delay),
+                        error,
+                    )
+                await db.commit()
+        except Exception:
+            # The lease runs out and the job is requeued by _maintain.
+            logger.exception("Не удалось сохранить ошибку задачи %s", job.id)
+
+        logger.log(
+            logging.ERROR if final else logging.WARNING,
+            "Задача %s (%s), попытка %s/%s: %s",
+            job.id,
+            job.kind,
+            job.attempts,
+            job.max_attempts,
+            error,
+            exc_info=exc if final else None,
+        )
+        self.metrics.record(job.kind, "failed" if final else "retried", elapsed)
+
+
+async def serve() -> None:
+    # Handlers are registered by the service modules that own them.
+    import app.services  # noqa: F401
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker = Worker()
+    logger.info("Воркер %s запущен", worker.worker_id)
+    try:
+        await worker.run(stop)
+    finally:
+        await engine.dispose()
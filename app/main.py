@@ -1,31 +1,55 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
 import logging
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database.models import Base
+from app.api.middleware import DBStatsMiddleware
+from app.core.security import shutdown_hash_executor
+from app.core.settings import settings
 from app.database.connection import engine
+from app.database.startup import fast_boot
+from app.jobs import Worker
 from app.api.v1 import (
     users_router,
     service_router,
     booking_router,
+    internal_router,
     pet_router,
+    search_router,
     slot_router,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    app.state.startup = await fast_boot(engine)
+    app.state.jobs = None
+    if settings.jobs_run_in_process:
+        stop_jobs = asyncio.Event()
+        app.state.jobs = Worker()
+        jobs_task = asyncio.create_task(app.state.jobs.run(stop_jobs))
     yield
+    if app.state.jobs is not None:
+        stop_jobs.set()
+        await jobs_task
+    shutdown_hash_executor()
     await engine.dispose()
 
 
-app = FastAPI(title="PetCare", lifespan=lifespan, version="1.0.0")
+app = FastAPI(
+    title="PetCare",
+    lifespan=lifespan,
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+if settings.db_request_metrics:
+    app.add_middleware(DBStatsMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -42,6 +66,13 @@ app.include_router(pet_router, prefix=f"{API_V1}/pet", tags=["pet"])
 app.include_router(service_router, prefix=f"{API_V1}/service", tags=["service"])
 app.include_router(booking_router, prefix=f"{API_V1}/booking", tags=["booking"])
 app.include_router(slot_router, prefix=f"{API_V1}/slot", tags=["slot"])
+app.include_router(search_router, prefix=f"{API_V1}/search", tags=["search"])
+app.include_router(
+    internal_router,
+    prefix=f"{API_V1}/internal",
+    tags=["internal"],
+    include_in_schema=False,
+)
 
 
 if __name__ == "__main__":
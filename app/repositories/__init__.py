@@ -1,16 +1,22 @@
 from .booking_repo import BookingRepository
+from .job_repo import JobRepository
 from .pet_repo import PetRepository
+from .provider_repo import ProviderRepository
 from .service_repo import ServiceRepository
 from .medical_repo import MedicalRecordRepo
+from .session_repo import SessionRepository
 from .slot_repo import SlotRepository
 from .user_repo import UserRepository
 
 
 __all__ = [
     "BookingRepository",
+    "JobRepository",
     "PetRepository",
+    "ProviderRepository",
     "ServiceRepository",
     "MedicalRecordRepo",
+    "SessionRepository",
     "SlotRepository",
     "UserRepository",
 ]
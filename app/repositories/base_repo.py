@@ -1,12 +1,92 @@
-from typing import Type, TypeVar, Generic, List, Optional
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import (
+    Any,
+    AsyncIterator,
+    Type,
+    TypeVar,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+)
 
 from pydantic import BaseModel
+from sqlalchemy import (
+    inspect,
+    tuple_,
+    ColumnElement,
+    Executable,
+    Insert,
+    RowMapping,
+    Select,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.future import select
 from sqlalchemy import delete
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.expression import ClauseElement
 
 T = TypeVar("T")
 
+FORWARD = ">"
+BACKWARD = "<"
+
+
+def encode_cursor(values: Sequence[Any], backward: bool = False) -> str:
+    raw = json.dumps(
+        [BACKWARD if backward else FORWARD, *(str(value) for value in values)]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[bool, list[str]]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Некорректный курсор") from e
+    if not isinstance(values, list) or not values:
+        raise ValueError("Некорректный курсор")
+    # Tokens issued before backward paging carry no direction marker.
+    if values[0] in (FORWARD, BACKWARD):
+        return values[0] == BACKWARD, values[1:]
+    return False, values
+
+
+def _parse_key(column: ColumnElement, raw: Any) -> Any:
+    python_type = column.type.python_type
+    try:
+        if python_type in (date, datetime, time):
+            return python_type.fromisoformat(raw)
+        return python_type(raw)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        raise ValueError("Некорректный курсор") from e
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 
 class AbstractRepository(Generic[T]):
     def __init__(self, db: AsyncSession, model: Type[T]):
@@ -17,18 +97,105 @@ class AbstractRepository(Generic[T]):
         result = await self.db.get(self.model, id)
         return result
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        with_total: bool = False,
+    ) -> Page[T]:
+        return await self.paginate(
+            select(self.model),
+            (self.model.id,),
+            cursor,
+            limit,
+            with_total=with_total,
+        )
+
+    async def paginate(
+        self,
+        query: Select,
+        keys: Sequence[ColumnElement],
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        descending: bool = False,
+        with_total: bool = False,
+    ) -> Page[T]:
+        """Keyset page of a single-entity query ordered by ``keys``.
+
+        ``keys`` must be unique together and not nullable; all of them are
+        sorted in the same direction so the seek is one row comparison the
+        index can serve. The key values are selected next to the entity, so
+        they may come from joined tables.
+        """
+        backward = False
+        page_query = query
+        if cursor is not None:
+            backward, raw = decode_cursor(cursor)
+            if len(raw) != len(keys):
+                raise ValueError("Некорректный курсор")
+            bound = tuple_(
+                *(_parse_key(key, value) for key, value in zip(keys, raw))
+            )
+            key = tuple_(*keys)
+            page_query = page_query.where(
+                key < bound if backward != descending else key > bound
+            )
+
+        reverse = backward != descending
         result = await self.db.execute(
-            select(self.model).offset(skip).limit(limit)
+            page_query.add_columns(*keys)
+            .order_by(*(key.desc() if reverse else key for key in keys))
+            .limit(limit + 1)
+        )
+        rows = list(result.all())
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if backward:
+            rows.reverse()
+
+        # Paging backward starts from a row that is still ahead of us.
+        has_next = backward or has_more
+        has_prev = has_more if backward else cursor is not None
+        next_cursor = prev_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(rows[-1][1:])
+        if rows and has_prev:
+            prev_cursor = encode_cursor(rows[0][1:], backward=True)
+
+        total = await self.estimate_count(query) if with_total else None
+        return Page(
+            items=[row[0] for row in rows],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            total_estimate=total,
         )
-        return list(result.scalars().all())
 
-    async def create(self, obj_in: T) -> T:
+    async def estimate_count(self, query: Select) -> Optional[int]:
+        # The planner's row estimate comes from pg_class.reltuples scaled by
+        # the pg_statistic selectivity of the filters: no rows are counted.
+        if self.db.get_bind().dialect.name != "postgresql":
+            return None
+        result = await self.db.execute(_Explain(query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def create(self, obj_in: T, load: Sequence[str] = ()) -> T:
         self.db.add(obj_in)
-        await self.db.commit()
-        await self.db.refresh(obj_in)
+        await self.db.flush()
+        self._init_empty_collections(obj_in)
+        if load:
+            await self.db.refresh(obj_in, attribute_names=list(load))
         return obj_in
 
+    async def create_many(self, objs_in: Sequence[T]) -> Sequence[T]:
+        self.db.add_all(objs_in)
+        await self.db.flush()
+        for obj in objs_in:
+            self._init_empty_collections(obj)
+        return objs_in
+
     async def update(self, db_obj: T, obj_in: BaseModel | dict) -> T:
         if not db_obj:
             raise ValueError("Объект для обновления не существует")
@@ -45,10 +212,62 @@ class AbstractRepository(Generic[T]):
         for field, value in obj_data.items():
             setattr(db_obj, field, value)
 
-        await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.flush()
         return db_obj
 
+    def _insert_ignore(self, conflict_on: Sequence[str]) -> Insert:
+        dialect = self.db.get_bind().dialect.name
+        if dialect != "postgresql":
+            raise NotImplementedError(
+                f"INSERT ... ON CONFLICT не поддерживается для {dialect}"
+            )
+        return postgresql.insert(self.model).on_conflict_do_nothing(
+            index_elements=conflict_on
+        )
+
+    async def insert_from_select(
+        self,
+        columns: Sequence[str],
+        select_stmt: Select,
+        conflict_on: Sequence[str],
+    ) -> int:
+        stmt = self._insert_ignore(conflict_on).from_select(
+            columns, select_stmt
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def insert_ignore(
+        self, rows: Sequence[dict], conflict_on: Sequence[str]
+    ) -> int:
+        if not rows:
+            return 0
+        result = await self.db.execute(
+            self._insert_ignore(conflict_on).values(list(rows))
+        )
+        return result.rowcount
+
+    async def stream(
+        self, query: Select, chunk_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        # Server-side cursor: only chunk_size rows are held at a time.
+        result = await self.db.stream(
+            query.execution_options(yield_per=chunk_size)
+        )
+        try:
+            async for rows in result.mappings().partitions(chunk_size):
+                yield rows
+        finally:
+            await result.close()
+
     async def delete(self, id: int) -> None:
         await self.db.execute(delete(self.model).where(self.model.id == id))
-        await self.db.commit()
+
+    @staticmethod
+    def _init_empty_collections(obj: T) -> None:
+        # A row that was just inserted cannot have children yet, so mark
+        # untouched collections as loaded instead of lazy-loading them.
+        state = inspect(obj)
+        for rel in state.mapper.relationships:
+            if rel.uselist and rel.key not in state.dict:
+                set_committed_value(obj, rel.key, [])
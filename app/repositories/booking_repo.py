@@ -1,24 +1,262 @@
-from typing import List
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    select,
+    delete,
+    func,
+    and_,
+    or_,
+    tuple_,
+    Row,
+    RowMapping,
+    Select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, contains_eager
 
-from app.database.models import Booking, AvailableSlot
-from app.repositories.base_repo import AbstractRepository
+from app.database.models import (
+    Booking,
+    AvailableSlot,
+    Pet,
+    ProviderService,
+    Service,
+)
+from app.database.types import BookingStatus
+from app.repositories.base_repo import AbstractRepository, Page
+
+BOOKING_OUT_OPTIONS = (
+    selectinload(Booking.pet).selectinload(Pet.medical_records),
+    selectinload(Booking.slot).selectinload(AvailableSlot.provider),
+    selectinload(Booking.service),
+)
 
 
 class BookingRepository(AbstractRepository[Booking]):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Booking)
 
+    async def get_with_details(self, booking_id: int) -> Booking | None:
+        result = await self.db.execute(
+            select(Booking)
+            .options(*BOOKING_OUT_OPTIONS)
+            .where(Booking.id == booking_id)
+            .execution_options(populate_existing=True)
+        )
+
+        return result.scalar_one_or_none()
+
+    async def cancel(self, booking_id: int, user_id: int) -> Optional[Row]:
+        # The row lock of the DELETE serialises concurrent cancels: only the
+        # one that removed the booking gets a row back and frees the slot.
+        result = await self.db.execute(
+            delete(Booking)
+            .where(
+                Booking.id == booking_id,
+                Booking.status != BookingStatus.completed,
+                or_(
+                    Booking.pet_id.in_(
+                        select(Pet.id).where(Pet.owner_id == user_id)
+                    ),
+                    Booking.slot_id.in_(
+                        select(AvailableSlot.id).where(
+                            AvailableSlot.provider_id == user_id
+                        )
+                    ),
+                ),
+            )
+            .returning(Booking.slot_id)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.one_or_none()
+
     async def list(self, provider_id: int) -> List[Booking] | None:
         result = await self.db.execute(
             select(Booking)
+            .join(Booking.slot)
+            .options(*BOOKING_OUT_OPTIONS)
+            .where(AvailableSlot.provider_id == provider_id)
+        )
+
+        return list(result.scalars().all())
+
+    async def provider_feed(
+        self,
+        provider_id: int,
+        status: Optional[BookingStatus] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[Booking]:
+        query = self._feed_query().where(
+            AvailableSlot.provider_id == provider_id
+        )
+        if status is not None:
+            query = query.where(Booking.status == status)
+        if date_from is not None:
+            query = query.where(AvailableSlot.date >= date_from)
+        if date_to is not None:
+            query = query.where(AvailableSlot.date <= date_to)
+
+        return await self._page(query, cursor, limit, with_total=with_total)
+
+    async def owner_timeline(
+        self,
+        owner_id: int,
+        now: datetime,
+        upcoming: bool = True,
+        status: Optional[BookingStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[Booking]:
+        starts_at = tuple_(AvailableSlot.date, AvailableSlot.start_time)
+        moment = tuple_(now.date(), now.time())
+        query = (
+            self._feed_query()
             .options(
-                selectinload(Booking.slot).selectinload(AvailableSlot.provider)
+                contains_eager(Booking.slot).selectinload(
+                    AvailableSlot.provider
+                )
+            )
+            .where(
+                Pet.owner_id == owner_id,
+                starts_at >= moment if upcoming else starts_at < moment,
             )
-            .where(Booking.slot.has(provider_id=provider_id))
         )
+        if status is not None:
+            query = query.where(Booking.status == status)
 
-        return list(result.scalars().all())
+        return await self._page(
+            query,
+            cursor,
+            limit,
+            descending=not upcoming,
+            with_total=with_total,
+        )
+
+    @staticmethod
+    def _feed_query() -> Select:
+        return (
+            select(Booking)
+            .join(Booking.slot)
+            .join(Booking.pet)
+            .options(
+                contains_eager(Booking.slot),
+                contains_eager(Booking.pet).raiseload(Pet.medical_records),
+                selectinload(Booking.service),
+            )
+        )
+
+    async def _page(
+        self,
+        query: Select,
+        cursor: Optional[str],
+        limit: int,
+        descending: bool = False,
+        with_total: bool = False,
+    ) -> Page[Booking]:
+        return await self.paginate(
+            query,
+            (AvailableSlot.date, AvailableSlot.start_time, Booking.id),
+            cursor,
+            limit,
+            descending=descending,
+            with_total=with_total,
+        )
+
+    async def provider_stats(
+        self,
+        provider_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Row]:
+        bookings = Booking.__table__
+        slots = AvailableSlot.__table__
+        provider_services = ProviderService.__table__
+
+        query = (
+            select(
+                slots.c.date,
+                bookings.c.status,
+                func.count(bookings.c.id).label("bookings"),
+                func.coalesce(
+                    func.sum(provider_services.c.custom_price), 0
+                ).label("revenue"),
+            )
+            .select_from(
+                bookings.join(
+                    slots, slots.c.id == bookings.c.slot_id
+                ).outerjoin(
+                    provider_services,
+                    and_(
+                        provider_services.c.provider_id == slots.c.provider_id,
+                        provider_services.c.service_id == bookings.c.service_id,
+                    ),
+                )
+            )
+            .where(slots.c.provider_id == provider_id)
+            .group_by(slots.c.date, bookings.c.status)
+            .order_by(slots.c.date, bookings.c.status)
+        )
+        if date_from is not None:
+            query = query.where(slots.c.date >= date_from)
+        if date_to is not None:
+            query = query.where(slots.c.date <= date_to)
+
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    def stream_provider_bookings(
+        self,
+        provider_id: int,
+        status: Optional[BookingStatus] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        bookings = Booking.__table__
+        slots = AvailableSlot.__table__
+        pets = Pet.__table__
+        services = Service.__table__
+        provider_services = ProviderService.__table__
+
+        query = (
+            select(
+                bookings.c.id,
+                bookings.c.status,
+                slots.c.date,
+                slots.c.start_time,
+                slots.c.end_time,
+                pets.c.id.label("pet_id"),
+                pets.c.name.label("pet_name"),
+                pets.c.animal_type,
+                services.c.name.label("service_name"),
+                provider_services.c.custom_price.label("price"),
+                bookings.c.notes,
+            )
+            .select_from(
+                bookings.join(slots, slots.c.id == bookings.c.slot_id)
+                .join(pets, pets.c.id == bookings.c.pet_id)
+                .join(services, services.c.id == bookings.c.service_id)
+                .outerjoin(
+                    provider_services,
+                    and_(
+                        provider_services.c.provider_id == slots.c.provider_id,
+                        provider_services.c.service_id == bookings.c.service_id,
+                    ),
+                )
+            )
+            .where(slots.c.provider_id == provider_id)
+            .order_by(slots.c.date, slots.c.start_time, bookings.c.id)
+        )
+        if status is not None:
+            query = query.where(bookings.c.status == status)
+        if date_from is not None:
+            query = query.where(slots.c.date >= date_from)
+        if date_to is not None:
+            query = query.where(slots.c.date <= date_to)
+
+        return self.stream(query, chunk_size)
@@ -0,0 +1,186 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import case, delete, func, literal, select, update, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
+from app.database.models import Job
+from app.database.types import JobStatus
+from app.repositories.base_repo import AbstractRepository
+
+
+class JobRepository(AbstractRepository[Job]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Job)
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
+        run_at: Optional[datetime] = None,
+        max_attempts: Optional[int] = None,
+    ) -> bool:
+        # Runs in the caller's transaction, so the job exists exactly when
+        # the writes it follows up on were committed.
+        now = datetime.utcnow()
+        inserted = await self.insert_ignore(
+            [
+                {
+                    "kind": kind,
+                    "payload": payload or {},
+                    "status": JobStatus.queued,
+                    "idempotency_key": idempotency_key,
+                    "attempts": 0,
+                    "max_attempts": max_attempts or settings.jobs_max_attempts,
+                    "run_at": run_at or now,
+                    "created_at": now,
+                }
+            ],
+            conflict_on=("idempotency_key",),
+        )
+        return inserted > 0
+
+    async def claim(
+        self, worker_id: str, limit: int, now: datetime
+    ) -> List[Row]:
+        # SKIP LOCKED lets concurrent workers take disjoint batches instead
+        # of queueing up behind each other's row locks.
+        jobs = Job.__table__
+        candidates = (
+            select(jobs.c.id)
+            .where(jobs.c.status == JobStatus.queued, jobs.c.run_at <= now)
+            .order_by(jobs.c.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(jobs)
+            .where(jobs.c.id.in_(candidates))
+            .values(
+                status=JobStatus.running,
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=jobs.c.attempts + 1,
+            )
+            .returning(
+                jobs.c.id,
+                jobs.c.kind,
+                jobs.c.payload,
+                jobs.c.attempts,
+                jobs.c.max_attempts,
+            )
+        )
+        return list(result.all())
+
+    async def heartbeat(
+        self, job_id: int, worker_id: str, now: datetime
+    ) -> bool:
+        jobs = Job.__table__
+        result = await self.db.execute(
+            update(jobs)
+            .where(
+                jobs.c.id == job_id,
+                jobs.c.status == JobStatus.running,
+                jobs.c.locked_by == worker_id,
+            )
+            .values(locked_at=now)
+        )
+        return result.rowcount > 0
+
+    async def complete(
+        self, job_id: int, worker_id: str, now: datetime
+    ) -> None:
+        await self._release(
+            job_id, worker_id, status=JobStatus.done, finished_at=now
+        )
+
+    async def retry(
+        self, job_id: int, worker_id: str, run_at: datetime, error: str
+    ) -> None:
+        await self._release(
+            job_id,
+            worker_id,
+            status=JobStatus.queued,
+            run_at=run_at,
+            locked_at=None,
+            last_error=error,
+        )
+
+    async def fail(
+        self, job_id: int, worker_id: str, now: datetime, error: str
+    ) -> None:
+        await self._release(
+            job_id,
+            worker_id,
+            status=JobStatus.failed,
+            finished_at=now,
+            last_error=error,
+        )
+
+    async def _release(self, job_id: int, worker_id: str, **values) -> None:
+        # A worker whose lease was taken over must not overwrite the result.
+        jobs = Job.__table__
+        await self.db.execute(
+            update(jobs)
+            .where(
+                jobs.c.id == job_id,
+                jobs.c.status == JobStatus.running,
+                jobs.c.locked_by == worker_id,
+            )
+            .values(**values)
+        )
+
+    async def requeue_stale(self, cutoff: datetime) -> int:
+        # Jobs of a crashed worker go back to the queue; one that keeps
+        # killing its worker fails once its attempts are used up.
+        jobs = Job.__table__
+        result = await self.db.execute(
+            update(jobs)
+            .where(
+                jobs.c.status == JobStatus.running, jobs.c.locked_at < cutoff
+            )
+            .values(
+                status=case(
+                    (
+                        jobs.c.attempts >= jobs.c.max_attempts,
+                        literal(JobStatus.failed, jobs.c.status.type),
+                    ),
+                    else_=literal(JobStatus.queued, jobs.c.status.type),
+                ),
+                locked_at=None,
+                last_error="lease expired",
+            )
+        )
+        return result.rowcount
+
+    async def purge_finished(self, before: datetime) -> int:
+        jobs = Job.__table__
+        result = await self.db.execute(
+            delete(jobs).where(
+                jobs.c.status == JobStatus.done, jobs.c.finished_at < before
+            )
+        )
+        return result.rowcount
+
+    async def stats(self, now: datetime) -> dict:
+        jobs = Job.__table__
+        result = await self.db.execute(
+            select(
+                jobs.c.status, func.count(), func.min(jobs.c.run_at)
+            ).group_by(jobs.c.status)
+        )
+        counts = {status.value: 0 for status in JobStatus}
+        oldest_queued = None
+        for status, count, oldest in result.all():
+            counts[status.value] = count
+            if status == JobStatus.queued:
+                oldest_queued = oldest
+        lag = (
+            max((now - oldest_queued).total_seconds(), 0.0)
+            if oldest_queued is not None
+            else 0.0
+        )
+        return {**counts, "oldest_queued_seconds": lag}
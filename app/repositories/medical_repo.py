@@ -1,9 +1,11 @@
-from sqlalchemy import select
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import select, RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database.models import MedicalRecord, Pet
-from app.repositories.base_repo import AbstractRepository
+from app.repositories.base_repo import AbstractRepository, Page
 
 
 class MedicalRecordRepo(AbstractRepository[MedicalRecord]):
@@ -18,3 +20,47 @@ class MedicalRecordRepo(AbstractRepository[MedicalRecord]):
             .options(selectinload(Pet.medical_records))
         )
         return result.scalar_one_or_none()
+
+    async def list_page(
+        self,
+        pet_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[MedicalRecord]:
+        return await self.paginate(
+            select(MedicalRecord).where(MedicalRecord.pet_id == pet_id),
+            (MedicalRecord.id,),
+            cursor,
+            limit,
+            descending=True,
+            with_total=with_total,
+        )
+
+    def stream_history(
+        self,
+        owner_id: int,
+        pet_id: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        records = MedicalRecord.__table__
+        pets = Pet.__table__
+
+        query = (
+            select(
+                records.c.id,
+                records.c.pet_id,
+                pets.c.name.label("pet_name"),
+                records.c.record_type,
+                records.c.date,
+                records.c.description,
+                records.c.document_url,
+            )
+            .join(pets, pets.c.id == records.c.pet_id)
+            .where(pets.c.owner_id == owner_id)
+            .order_by(records.c.pet_id, records.c.date, records.c.id)
+        )
+        if pet_id is not None:
+            query = query.where(records.c.pet_id == pet_id)
+
+        return self.stream(query, chunk_size)
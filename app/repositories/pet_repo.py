@@ -1,11 +1,11 @@
-from typing import List
+from typing import List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 
-from app.database.models import Pet
-from app.repositories.base_repo import AbstractRepository
+from app.database.models import Pet, MedicalRecord
+from app.repositories.base_repo import AbstractRepository, Page
 
 
 class PetRepository(AbstractRepository[Pet]):
@@ -28,3 +28,58 @@ class PetRepository(AbstractRepository[Pet]):
         )
 
         return list(result.scalars().all())
+
+    async def get_owner_id(self, pet_id: int) -> Optional[int]:
+        result = await self.db.execute(
+            select(Pet.owner_id).where(Pet.id == pet_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_page(
+        self,
+        owner_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[Pet]:
+        query = (
+            select(Pet)
+            .where(Pet.owner_id == owner_id)
+            .options(raiseload(Pet.medical_records))
+        )
+        return await self.paginate(
+            query, (Pet.id,), cursor, limit, with_total=with_total
+        )
+
+    async def medical_summary(self, pet_ids: Sequence[int]) -> List[Row]:
+        records = MedicalRecord.__table__
+        ranked = (
+            select(
+                records.c.id,
+                records.c.pet_id,
+                records.c.record_type,
+                records.c.description,
+                records.c.document_url,
+                records.c.date,
+                func.count()
+                .over(partition_by=records.c.pet_id)
+                .label("records_count"),
+                func.row_number()
+                .over(
+                    partition_by=(records.c.pet_id, records.c.record_type),
+                    order_by=(
+                        records.c.date.desc().nulls_last(),
+                        records.c.id.desc(),
+                    ),
+                )
+                .label("position"),
+            )
+            .where(records.c.pet_id.in_(pet_ids))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ranked)
+            .where(ranked.c.position == 1)
+            .order_by(ranked.c.pet_id, ranked.c.record_type)
+        )
+        return list(result.all())
@@ -0,0 +1,74 @@
+from typing import List, Optional
+
+from sqlalchemy import select, or_, func, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.geo import (
+    cell_ranges,
+    degree_window,
+    KM_PER_DEGREE,
+    RADIUS_SLACK,
+)
+from app.database.models import Provider
+from app.database.types import ProviderType
+from app.repositories.base_repo import AbstractRepository
+
+
+class ProviderRepository(AbstractRepository[Provider]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Provider)
+
+    async def list_in_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        provider_type: Optional[ProviderType] = None,
+        within_service_radius: bool = False,
+    ) -> List[Row]:
+        providers = Provider.__table__
+        ranges = cell_ranges(latitude, longitude, radius_km)
+        query = select(
+            providers.c.id,
+            providers.c.company_name,
+            providers.c.provider_type,
+            providers.c.service_radius_km,
+            providers.c.latitude,
+            providers.c.longitude,
+        ).where(
+            or_(
+                *(
+                    providers.c.geo_cell.between(start, end)
+                    for start, end in ranges
+                )
+            )
+        )
+        if provider_type is not None:
+            query = query.where(providers.c.provider_type == provider_type)
+        if within_service_radius:
+            query = query.where(
+                *self._service_radius_window(latitude, longitude, radius_km)
+            )
+
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    @staticmethod
+    def _service_radius_window(
+        latitude: float, longitude: float, radius_km: float
+    ) -> list:
+        # Cheap per-row bounding box on each provider's own radius, so only
+        # plausible candidates leave the database.
+        providers = Provider.__table__
+        d_lat, d_lon = degree_window(latitude, radius_km)
+        per_km_lat = RADIUS_SLACK / KM_PER_DEGREE
+        clauses = [
+            func.abs(providers.c.latitude - latitude)
+            <= providers.c.service_radius_km * per_km_lat
+        ]
+        if abs(longitude) + d_lon < 180:
+            clauses.append(
+                func.abs(providers.c.longitude - longitude)
+                <= providers.c.service_radius_km * (d_lon / radius_km)
+            )
+        return clauses
@@ -1,12 +1,19 @@
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, func, literal, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
 from app.database.models import ProviderService, Service, Provider
 from app.database.types import ProviderType
-from app.repositories.base_repo import AbstractRepository
+from app.repositories.base_repo import AbstractRepository, Page
+
+PS_FANOUT_COLUMNS = (
+    "provider_id",
+    "service_id",
+    "custom_price",
+    "custom_duration",
+)
 
 
 class ServiceRepository(AbstractRepository[ProviderService]):
@@ -22,6 +29,22 @@ class ServiceRepository(AbstractRepository[ProviderService]):
 
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        provider_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[ProviderService]:
+        query = (
+            select(ProviderService)
+            .options(selectinload(ProviderService.service))
+            .where(ProviderService.provider_id == provider_id)
+        )
+        return await self.paginate(
+            query, (ProviderService.id,), cursor, limit, with_total=with_total
+        )
+
     async def get_by_provider_and_id(
         self, provider_id: int, ps_id: int
     ) -> ProviderService | None:
@@ -34,36 +57,45 @@ class ServiceRepository(AbstractRepository[ProviderService]):
 
         return result.scalar_one_or_none()
 
-    async def create_ps_for_owner(
-        self, created_provider: Provider, provider_type: ProviderType
-    ) -> None:
-        services = await self.db.execute(
-            select(Service).where(Service.service_type == provider_type)
+    async def count_providers(self, provider_type: ProviderType) -> int:
+        providers = Provider.__table__
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(providers)
+            .where(providers.c.provider_type == provider_type)
         )
-        services = services.scalars().all()
-
-        for service in services:
-            ps = ProviderService(
-                provider_id=created_provider.id,
-                service_id=service.id,
-                custom_price=service.base_price,
-                custom_duration=service.duration_min,
-            )
-            await self.create(ps)
+        return result.scalar_one()
 
-    async def create_ps_for_service(
-        self, provider_type: ProviderType, created_service
-    ) -> None:
-        result = await self.db.execute(
-            select(Provider.id).where(Provider.provider_type == provider_type)
+    async def create_ps_for_owner(
+        self, provider_id: int, provider_type: ProviderType
+    ) -> int:
+        services = Service.__table__
+        return await self.insert_from_select(
+            PS_FANOUT_COLUMNS,
+            select(
+                literal(provider_id),
+                services.c.id,
+                services.c.base_price,
+                services.c.duration_min,
+            ).where(services.c.service_type == provider_type),
+            conflict_on=("provider_id", "service_id"),
         )
-        provider_ids = result.scalars().all()
 
-        for provider_id in provider_ids:
-            ps = ProviderService(
-                provider_id=provider_id,
-                service_id=created_service.id,
-                custom_price=created_service.base_price,
-                custom_duration=created_service.duration_min,
+    async def create_ps_for_service(
+        self, provider_type: ProviderType, service_id: int
+    ) -> int:
+        providers = Provider.__table__
+        services = Service.__table__
+        return await self.insert_from_select(
+            PS_FANOUT_COLUMNS,
+            select(
+                providers.c.id,
+                services.c.id,
+                services.c.base_price,
+                services.c.duration_min,
             )
-            await self.create(ps)
+            .select_from(providers.join(services, true()))
+            .where(providers.c.provider_type == provider_type)
+            .where(services.c.id == service_id),
+            conflict_on=("provider_id", "service_id"),
+        )
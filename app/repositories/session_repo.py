@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import select, update, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import User, UserSession
+from app.repositories.base_repo import AbstractRepository
+
+
+class SessionRepository(AbstractRepository[UserSession]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, UserSession)
+
+    async def rotate(
+        self,
+        session_id: str,
+        generation: int,
+        refresh_hash: str,
+        new_hash: str,
+        now: datetime,
+    ) -> Optional[Row]:
+        # One primary-key UPDATE both checks and rotates the token; the
+        # users join only supplies the role for the new access token.
+        sessions = UserSession.__table__
+        users = User.__table__
+        result = await self.db.execute(
+            update(sessions)
+            .where(
+                sessions.c.id == session_id,
+                sessions.c.generation == generation,
+                sessions.c.refresh_hash == refresh_hash,
+                sessions.c.revoked_at.is_(None),
+                sessions.c.expires_at > now,
+                users.c.id == sessions.c.user_id,
+            )
+            .values(
+                refresh_hash=new_hash,
+                generation=generation + 1,
+                last_used_at=now,
+                **({"previous_hash": refresh_hash} if generation == 0 else {}),
+            )
+            .returning(sessions.c.user_id, users.c.role, sessions.c.expires_at)
+        )
+        return result.one_or_none()
+
+    async def list_active(
+        self, user_id: int, now: datetime
+    ) -> List[UserSession]:
+        result = await self.db.execute(
+            select(UserSession)
+            .where(
+                UserSession.user_id == user_id,
+                UserSession.revoked_at.is_(None),
+                UserSession.expires_at > now,
+            )
+            .order_by(UserSession.created_at.desc())
+        )
+        return list(result.scalars().all())
+
+    async def revoke(
+        self,
+        now: datetime,
+        user_id: int,
+        session_id: Optional[str] = None,
+    ) -> List[str]:
+        sessions = UserSession.__table__
+        query = update(sessions).where(
+            sessions.c.user_id == user_id, sessions.c.revoked_at.is_(None)
+        )
+        if session_id is not None:
+            query = query.where(sessions.c.id == session_id)
+        result = await self.db.execute(
+            query.values(revoked_at=now).returning(sessions.c.id)
+        )
+        return list(result.scalars().all())
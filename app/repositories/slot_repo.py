@@ -1,10 +1,32 @@
-from typing import List
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import (
+    select,
+    update,
+    func,
+    literal,
+    or_,
+    case,
+    exists,
+    true,
+    Interval,
+    Row,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.database.models import AvailableSlot
-from app.repositories.base_repo import AbstractRepository
+from app.database.models import (
+    AvailableSlot,
+    Provider,
+    ProviderService,
+    Service,
+    SittingService,
+    VeterinaryService,
+)
+from app.database.types import ProviderType, AnimalType
+from app.repositories.base_repo import AbstractRepository, Page
 
 
 class SlotRepository(AbstractRepository[AvailableSlot]):
@@ -13,9 +35,175 @@ class SlotRepository(AbstractRepository[AvailableSlot]):
 
     async def list(self, provider_id: int) -> List[AvailableSlot]:
         result = await self.db.execute(
-            select(AvailableSlot).where(
-                AvailableSlot.provider_id == provider_id
-            )
+            select(AvailableSlot)
+            .options(selectinload(AvailableSlot.provider))
+            .where(AvailableSlot.provider_id == provider_id)
         )
 
         return list(result.scalars().all())
+
+    async def create_many_ignore(self, rows: List[dict]) -> int:
+        return await self.insert_ignore(
+            rows, conflict_on=("provider_id", "date", "start_time")
+        )
+
+    @staticmethod
+    def _capacity(service_id: int):
+        return func.coalesce(
+            select(SittingService.max_pets)
+            .where(SittingService.id == service_id)
+            .scalar_subquery(),
+            1,
+        )
+
+    async def reserve(self, slot_id: int, service_id: int) -> bool:
+        # A single conditional UPDATE: the row lock it takes serializes
+        # bookings of this slot only, and the WHERE is re-checked after
+        # waiting on the lock, so capacity can never be exceeded.
+        slots = AvailableSlot.__table__
+        capacity = self._capacity(service_id)
+        offered = exists().where(
+            ProviderService.provider_id == slots.c.provider_id,
+            ProviderService.service_id == service_id,
+        )
+        filled = slots.c.booked_count + 1 >= capacity
+        result = await self.db.execute(
+            update(slots)
+            .where(
+                slots.c.id == slot_id,
+                slots.c.is_available,
+                slots.c.booked_count < capacity,
+                offered,
+            )
+            .values(
+                booked_count=slots.c.booked_count + 1,
+                is_available=~filled,
+                filled_capacity=case((filled, capacity), else_=None),
+            )
+            .returning(slots.c.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def release(self, slot_id: int) -> None:
+        # Any cancellation frees room in a slot that bookings filled, even
+        # if the cancelled booking's service allows more guests than the
+        # one that filled it; slots closed by hand stay closed.
+        slots = AvailableSlot.__table__
+        filled = slots.c.filled_capacity.is_not(None)
+        await self.db.execute(
+            update(slots)
+            .where(slots.c.id == slot_id, slots.c.booked_count > 0)
+            .values(
+                booked_count=slots.c.booked_count - 1,
+                is_available=case((filled, True), else_=slots.c.is_available),
+                filled_capacity=None,
+            )
+        )
+
+    async def list_page(
+        self,
+        provider_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> Page[AvailableSlot]:
+        query = select(AvailableSlot).where(
+            AvailableSlot.provider_id == provider_id
+        )
+        if date_from is not None:
+            query = query.where(AvailableSlot.date >= date_from)
+        if date_to is not None:
+            query = query.where(AvailableSlot.date <= date_to)
+
+        return await self.paginate(
+            query,
+            (AvailableSlot.date, AvailableSlot.start_time, AvailableSlot.id),
+            cursor,
+            limit,
+            with_total=with_total,
+        )
+
+    async def search_available(
+        self,
+        provider_type: Optional[ProviderType] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        time_from: Optional[time] = None,
+        time_to: Optional[time] = None,
+        min_duration: Optional[int] = None,
+        max_price: Optional[Decimal] = None,
+        animal_type: Optional[AnimalType] = None,
+        limit: int = 50,
+    ) -> List[Row]:
+        slots = AvailableSlot.__table__
+        providers = Provider.__table__
+        provider_services = ProviderService.__table__
+        services = Service.__table__
+        vet_services = VeterinaryService.__table__
+
+        # Cheapest matching service, looked up per candidate provider only
+        prices = (
+            select(
+                func.min(provider_services.c.custom_price).label("min_price"),
+            )
+            .join(services, services.c.id == provider_services.c.service_id)
+            .where(provider_services.c.provider_id == providers.c.id)
+            .group_by(provider_services.c.provider_id)
+        )
+        if max_price is not None:
+            prices = prices.where(provider_services.c.custom_price <= max_price)
+        if provider_type is not None:
+            prices = prices.where(services.c.service_type == provider_type)
+        if animal_type is not None:
+            prices = prices.outerjoin(
+                vet_services, vet_services.c.id == services.c.id
+            ).where(
+                or_(
+                    vet_services.c.animal_type.is_(None),
+                    vet_services.c.animal_type == animal_type.value,
+                )
+            )
+        prices = prices.lateral()
+
+        query = (
+            select(
+                slots.c.id,
+                slots.c.date,
+                slots.c.start_time,
+                slots.c.end_time,
+                slots.c.provider_id,
+                providers.c.company_name,
+                providers.c.provider_type,
+                prices.c.min_price,
+            )
+            .join(providers, providers.c.id == slots.c.provider_id)
+            .join(prices, true())
+            .where(slots.c.is_available)
+        )
+        if provider_type is not None:
+            query = query.where(providers.c.provider_type == provider_type)
+        if date_from is not None:
+            query = query.where(slots.c.date >= date_from)
+        if date_to is not None:
+            query = query.where(slots.c.date <= date_to)
+        if time_from is not None:
+            query = query.where(slots.c.start_time >= time_from)
+        if time_to is not None:
+            query = query.where(slots.c.end_time <= time_to)
+        if min_duration is not None:
+            query = query.where(
+                slots.c.end_time - slots.c.start_time
+                >= literal(timedelta(minutes=min_duration), Interval)
+            )
+
+        result = await self.db.execute(
+            query.order_by(
+                slots.c.date,
+                slots.c.start_time,
+                prices.c.min_price,
+                slots.c.id,
+            ).limit(limit)
+        )
+        return list(result.all())
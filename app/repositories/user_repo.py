@@ -1,8 +1,9 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import with_polymorphic
 
-from app.database.models import User, Provider
+from app.core.principal import Principal
+from app.database.models import User, Owner, Provider
 from app.repositories.base_repo import AbstractRepository
 
 
@@ -15,9 +16,39 @@ class UserRepository(AbstractRepository[User]):
         return result.scalar_one_or_none()
 
     async def get_by_id(self, id: int) -> User | None:
+        user = with_polymorphic(User, [Owner, Provider])
+        result = await self.db.execute(select(user).where(user.id == id))
+        return result.scalar_one_or_none()
+
+    async def get_principal(self, id: int) -> Principal | None:
+        users = User.__table__
+        providers = Provider.__table__
         result = await self.db.execute(
-            select(User)
-            .where(User.id == id)
-            .options(selectinload(User.provider).selectinload(Provider.documents), selectinload(User.owner))
+            select(
+                users.c.id,
+                users.c.email,
+                users.c.first_name,
+                users.c.surname,
+                users.c.patronymic,
+                users.c.role,
+                providers.c.provider_type,
+                providers.c.is_verified,
+            )
+            .select_from(
+                users.outerjoin(providers, providers.c.id == users.c.id)
+            )
+            .where(users.c.id == id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return Principal(
+            id=row.id,
+            email=row.email,
+            first_name=row.first_name,
+            surname=row.surname,
+            patronymic=row.patronymic,
+            role=row.role,
+            provider_type=row.provider_type,
+            is_verified=bool(row.is_verified),
         )
-        return result.unique().scalar_one_or_none()
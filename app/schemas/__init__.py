@@ -1,11 +1,35 @@
-from .booking import BookingCreate, BookingOut, BookingBase
-from .pet import PetOut, PetBase, PetCreate, MedicalRecordBase, MedicalRecordOut, PetUpdate
+from .booking import (
+    BookingCreate,
+    BookingOut,
+    BookingBase,
+    BookingItem,
+    BookingPage,
+    BookingDayStats,
+    OwnerBookingItem,
+    OwnerBookingPage,
+)
+from .page import CursorPage
+from .pet import (
+    PetOut,
+    PetBase,
+    PetCreate,
+    MedicalRecordBase,
+    MedicalRecordOut,
+    MedicalRecordItem,
+    MedicalRecordPage,
+    MedicalSummary,
+    PetUpdate,
+    PetItem,
+    PetListItem,
+    PetPage,
+)
 from .service import (
     ServiceBase,
     SittingServiceCreate,
     ProviderServiceBase,
     ProviderServiceUpdate,
     ProviderServiceOut,
+    ProviderServicePage,
     SittingServiceOut,
     GroomingServiceOut,
     GroomingServiceCreate,
@@ -13,7 +37,17 @@ from .service import (
     VeterinaryServiceOut,
 )
 
-from .slot import SlotOut, SlotBase, SlotCreate
+from .slot import (
+    SlotOut,
+    SlotBase,
+    SlotCreate,
+    SlotBulkCreate,
+    SlotSchedule,
+    SlotBatchSummary,
+    SlotItem,
+    SlotPage,
+    SlotSearchResult,
+)
 from .user import (
     UserOut,
     UserAuth,
@@ -21,10 +55,14 @@ from .user import (
     ProviderOut,
     ProviderCreate,
     ProviderDoc,
+    ProviderNearbyOut,
+    Location,
     OwnerOut,
     OwnerCreate,
     TokenData,
     Token,
+    RefreshRequest,
+    SessionOut,
 )
 
 
@@ -32,17 +70,30 @@ __all__ = [
     "BookingCreate",
     "BookingOut",
     "BookingBase",
+    "BookingItem",
+    "BookingPage",
+    "BookingDayStats",
+    "OwnerBookingItem",
+    "OwnerBookingPage",
+    "CursorPage",
     "PetOut",
     "PetBase",
     "PetCreate",
     "PetUpdate",
+    "PetItem",
+    "PetListItem",
+    "PetPage",
     "MedicalRecordBase",
     "MedicalRecordOut",
+    "MedicalRecordItem",
+    "MedicalRecordPage",
+    "MedicalSummary",
     "ServiceBase",
     "SittingServiceCreate",
     "ProviderServiceBase",
     "ProviderServiceUpdate",
     "ProviderServiceOut",
+    "ProviderServicePage",
     "SittingServiceOut",
     "GroomingServiceOut",
     "GroomingServiceCreate",
@@ -51,16 +102,26 @@ __all__ = [
     "SlotOut",
     "SlotBase",
     "SlotCreate",
+    "SlotBulkCreate",
+    "SlotSchedule",
+    "SlotBatchSummary",
+    "SlotItem",
+    "SlotPage",
+    "SlotSearchResult",
     "UserOut",
     "UserAuth",
     "UserCreate",
     "ProviderOut",
     "ProviderCreate",
     "ProviderDoc",
+    "ProviderNearbyOut",
+    "Location",
     "OwnerOut",
     "OwnerCreate",
     "TokenData",
     "Token",
+    "RefreshRequest",
+    "SessionOut",
 ]
 
 
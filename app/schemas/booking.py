@@ -1,9 +1,12 @@
-from typing import Optional
+from datetime import date
+from typing import List, Optional
 from pydantic import BaseModel
 
-from app.schemas.pet import PetOut
+from app.database.types import BookingStatus, ProviderType
+from app.schemas.page import CursorPage
+from app.schemas.pet import PetOut, PetItem
 from app.schemas.service import ServiceBase
-from app.schemas.slot import SlotOut
+from app.schemas.slot import SlotOut, SlotItem
 
 
 class BookingBase(BaseModel):
@@ -26,3 +29,52 @@ class BookingOut(BookingBase):
 
     class Config:
         from_attributes = True
+
+
+class BookingItem(BaseModel):
+    id: int
+    status: Optional[BookingStatus] = None
+    notes: Optional[str] = None
+    service_id: int
+
+    pet: PetItem
+    slot: SlotItem
+    service: ServiceBase
+
+    class Config:
+        from_attributes = True
+
+
+class BookingPage(CursorPage):
+    items: List[BookingItem]
+
+
+class BookingProvider(BaseModel):
+    id: int
+    company_name: Optional[str] = None
+    provider_type: ProviderType
+
+    class Config:
+        from_attributes = True
+
+
+class OwnerBookingSlot(SlotItem):
+    provider: BookingProvider
+
+
+class OwnerBookingItem(BookingItem):
+    slot: OwnerBookingSlot
+
+
+class OwnerBookingPage(CursorPage):
+    items: List[OwnerBookingItem]
+
+
+class BookingDayStats(BaseModel):
+    date: date
+    status: Optional[BookingStatus] = None
+    bookings: int
+    revenue: float
+
+    class Config:
+        from_attributes = True
@@ -1,8 +1,9 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
 from app.database.types import AnimalType, RecordType
+from app.schemas.page import CursorPage
 
 
 class MedicalRecordBase(BaseModel):
@@ -19,6 +20,14 @@ class MedicalRecordOut(MedicalRecordBase):
     pet_id: int
 
 
+class MedicalRecordItem(MedicalRecordOut):
+    date: Optional[datetime] = None
+
+
+class MedicalRecordPage(CursorPage):
+    items: List[MedicalRecordItem]
+
+
 class PetBase(BaseModel):
     name: str = Field(max_length=50)
     animal_type: AnimalType
@@ -46,4 +55,24 @@ class PetOut(PetBase):
         from_attributes = True
 
 
+class PetItem(PetBase):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+
+class MedicalSummary(BaseModel):
+    records_count: int = 0
+    latest: List[MedicalRecordItem] = []
+
+
+class PetListItem(PetItem):
+    medical_summary: Optional[MedicalSummary] = None
+
+
+class PetPage(CursorPage):
+    items: List[PetListItem]
+
+
 PetOut.model_rebuild()
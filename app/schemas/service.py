@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+
+from app.schemas.page import CursorPage
 
 
 class ServiceBase(BaseModel):
@@ -67,3 +69,7 @@ class ProviderServiceOut(BaseModel):
 
 class ProviderServiceUpdate(ProviderServiceBase):
     pass
+
+
+class ProviderServicePage(CursorPage):
+    items: List[ProviderServiceOut]
@@ -1,6 +1,10 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
 from datetime import date, time
 
+from app.database.types import ProviderType
+from app.schemas.page import CursorPage
 from app.schemas.user import ProviderOut
 
 
@@ -15,6 +19,27 @@ class SlotCreate(SlotBase):
     pass
 
 
+class SlotBulkCreate(BaseModel):
+    slots: List[SlotCreate] = Field(min_length=1)
+
+
+class SlotSchedule(BaseModel):
+    weekdays: List[int] = Field(min_length=1, max_length=7)
+    start_time: time
+    end_time: time
+    slot_minutes: int = Field(default=30, ge=5, le=720)
+    date_from: date
+    weeks: int = Field(default=1, ge=1, le=52)
+
+
+class SlotBatchSummary(BaseModel):
+    requested: int
+    created: int
+    skipped: int
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+
 class SlotOut(SlotBase):
     id: int
 
@@ -22,3 +47,29 @@ class SlotOut(SlotBase):
 
     class Config:
         from_attributes = True
+
+
+class SlotItem(SlotBase):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+
+class SlotPage(CursorPage):
+    provider: ProviderOut
+    items: List[SlotItem]
+
+
+class SlotSearchResult(BaseModel):
+    id: int
+    date: date
+    start_time: time
+    end_time: time
+    provider_id: int
+    company_name: Optional[str] = None
+    provider_type: ProviderType
+    min_price: float
+
+    class Config:
+        from_attributes = True
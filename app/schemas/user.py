@@ -1,8 +1,10 @@
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
+from app.core.settings import settings
 from app.database.models import UserType
 from app.database.types import ProviderType, DocumentType, DocumentStatus
 
@@ -18,17 +20,22 @@ class UserCreate(UserBase):
     password_hash: str = Field(min_length=8)
 
 
-class OwnerCreate(UserCreate):
+class Location(BaseModel):
+    latitude: float | None = Field(default=None, ge=-90, le=90)
+    longitude: float | None = Field(default=None, ge=-180, le=180)
+
+
+class OwnerCreate(UserCreate, Location):
     phone: PhoneNumber
     address: str | None = Field(default=None, min_length=3, max_length=150)
     role: UserType = Field(default=UserType.owner.value)
 
 
-class ProviderCreate(UserCreate):
+class ProviderCreate(UserCreate, Location):
     company_name: str = Field(min_length=3, max_length=150)
     provider_type: ProviderType
     service_radius_km: int = Field(
-        default=10,
+        default=10, ge=1, le=settings.geo_max_service_radius_km
     )
     hourly_rate: float
     role: UserType = Field(default=UserType.provider.value)
@@ -40,6 +47,7 @@ class UserAuth(BaseModel):
 
 
 class UserOut(UserBase):
+    email: str
     id: int
     role: UserType
 
@@ -47,12 +55,12 @@ class UserOut(UserBase):
         from_attributes = True
 
 
-class OwnerOut(UserOut):
+class OwnerOut(UserOut, Location):
     phone: PhoneNumber
     address: str | None = Field(default=None, min_length=3, max_length=150)
 
 
-class ProviderOut(UserOut):
+class ProviderOut(UserOut, Location):
     id: int
     company_name: str = Field(min_length=3, max_length=150)
     provider_type: ProviderType
@@ -62,6 +70,16 @@ class ProviderOut(UserOut):
     hourly_rate: float
 
 
+class ProviderNearbyOut(BaseModel):
+    id: int
+    company_name: str | None = None
+    provider_type: ProviderType
+    service_radius_km: int | None = None
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
 class ProviderDoc(BaseModel):
     document_type: DocumentType
     file_url: str
@@ -72,8 +90,27 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     role: Optional[str] = None
+    refresh_token: Optional[str] = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
+class SessionOut(BaseModel):
+    id: str
+    user_agent: Optional[str] = None
+    created_at: Optional[datetime] = None
+    last_used_at: Optional[datetime] = None
+    expires_at: datetime
+
+    class Config:
+        from_attributes = True
 
 
 class TokenData(BaseModel):
     sub: Optional[str] = None
     role: Optional[UserType] = None
+    jti: Optional[str] = None
+    exp: Optional[int] = None
+    sid: Optional[str] = None
@@ -1,16 +1,20 @@
 from .booking_service import BookingService
+from .discovery_service import DiscoveryService
 from .medical_service import MedRecordService
 from .pet_service import PetService
 from .service_service import ServiceService
+from .session_service import SessionService
 from .slot_service import SlotService
 from .user_service import UserService
 
 
 __all__ = [
     "BookingService",
+    "DiscoveryService",
     "MedRecordService",
     "PetService",
     "ServiceService",
+    "SessionService",
     "SlotService",
     "UserService",
 ]
@@ -1,33 +1,53 @@
 from dataclasses import dataclass
-from typing import List
+from datetime import date, datetime
+from typing import AsyncIterator, List, Literal, Optional, Sequence
 
 from fastapi import HTTPException
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 
+from app.core.settings import settings
+
 from app.database.models import Booking
 from app.database.types import BookingStatus
-from app.repositories import BookingRepository
-from app.schemas import BookingBase
+from app.repositories import BookingRepository, SlotRepository
+from app.schemas import (
+    BookingBase,
+    BookingPage,
+    BookingDayStats,
+    OwnerBookingPage,
+)
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class BookingService:
     repository: BookingRepository
+    slot_repository: Optional[SlotRepository] = None
 
     async def create_booking(
         self,
         booking_data: BookingBase,
     ) -> Booking:
+        reserved = await self.slot_repository.reserve(
+            booking_data.slot_id, booking_data.service_id
+        )
+        if not reserved:
+            raise HTTPException(
+                status_code=400,
+                detail="Слот недоступен для бронирования этой услуги",
+            )
         try:
             booking = Booking(**booking_data.model_dump(exclude_unset=True))
 
-            return await self.repository.create(booking)
+            booking = await self.repository.create(booking)
         except IntegrityError:
             raise HTTPException(
                 status_code=400,
                 detail="Слот занят или услуга уже забронирована. Возможно выбранного сервиса не существует",
             )
 
+        return await self.repository.get_with_details(booking.id)
+
     async def get_booking_by_id(self, booking_id: int) -> Booking | None:
         booking = await self.repository.get_by_id(booking_id)
         if not booking:
@@ -36,21 +56,110 @@ class BookingService:
             )
         return booking
 
-    async def delete_booking(self, booking_id: int) -> None:
-        booking = await self.repository.get_by_id(booking_id)
-        if not booking:
+    async def delete_booking(self, booking_id: int, user_id: int) -> None:
+        deleted = await self.repository.cancel(booking_id, user_id)
+        if deleted is None:
+            booking = await self.repository.get_by_id(booking_id)
+            if not booking:
+                raise HTTPException(
+                    status_code=400, detail="Бронирование не найдено"
+                )
+            if booking.status == BookingStatus.completed:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Бронирование уже выполнено, его нельзя удалить",
+                )
             raise HTTPException(
-                status_code=400, detail="Бронирование не найдено"
-            )
-        if booking.status == BookingStatus.completed:
-            raise HTTPException(
-                status_code=400,
-                detail="Бронирование уже выполнено, его нельзя удалить",
+                status_code=403,
+                detail="Бронирование не принадлежит текущему пользователю",
             )
-        await self.repository.delete(booking_id)
+        if deleted.slot_id is not None:
+            await self.slot_repository.release(deleted.slot_id)
 
     async def list_of_provider_booking(self, provider_id: int) -> List[Booking]:
         return await self.repository.list(provider_id)
 
-    async def list_of_owner_booking(self, provider_id: int) -> List[Booking]:
-        return await self.repository.list(provider_id)
+    async def provider_feed(
+        self,
+        provider_id: int,
+        status: Optional[BookingStatus] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> BookingPage:
+        self._check_period(date_from, date_to)
+        try:
+            page = await self.repository.provider_feed(
+                provider_id,
+                status,
+                date_from,
+                date_to,
+                cursor,
+                limit,
+                with_total,
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        return BookingPage.model_validate(page, from_attributes=True)
+
+    async def provider_stats(
+        self,
+        provider_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[BookingDayStats]:
+        self._check_period(date_from, date_to)
+        rows = await self.repository.provider_stats(
+            provider_id, date_from, date_to
+        )
+        return [BookingDayStats.model_validate(row) for row in rows]
+
+    def export_provider_bookings(
+        self,
+        provider_id: int,
+        status: Optional[BookingStatus] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        self._check_period(date_from, date_to)
+        return self.repository.stream_provider_bookings(
+            provider_id,
+            status,
+            date_from,
+            date_to,
+            chunk_size=settings.export_chunk_size,
+        )
+
+    @staticmethod
+    def _check_period(date_from: Optional[date], date_to: Optional[date]):
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from не может быть позже date_to"
+            )
+
+    async def list_of_owner_booking(
+        self,
+        owner_id: int,
+        period: Literal["upcoming", "past"] = "upcoming",
+        status: Optional[BookingStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> OwnerBookingPage:
+        try:
+            page = await self.repository.owner_timeline(
+                owner_id,
+                datetime.now(),
+                upcoming=period == "upcoming",
+                status=status,
+                cursor=cursor,
+                limit=limit,
+                with_total=with_total,
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        return OwnerBookingPage.model_validate(page, from_attributes=True)
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+from app.core.geo import haversine_km, CELL_SIZE_DEG, KM_PER_DEGREE
+from app.core.settings import settings
+from app.database.types import ProviderType
+from app.repositories import ProviderRepository, UserRepository
+from app.schemas import ProviderNearbyOut
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DiscoveryService:
+    provider_repository: ProviderRepository
+    user_repository: Optional[UserRepository] = None
+
+    async def _within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        provider_type: Optional[ProviderType],
+        within_service_radius: bool = False,
+    ) -> List[ProviderNearbyOut]:
+        rows = await self.provider_repository.list_in_radius(
+            latitude,
+            longitude,
+            radius_km,
+            provider_type,
+            within_service_radius=within_service_radius,
+        )
+        found = []
+        for row in rows:
+            distance = haversine_km(
+                latitude, longitude, row.latitude, row.longitude
+            )
+            limit_km = (
+                min(row.service_radius_km or 0, radius_km)
+                if within_service_radius
+                else radius_km
+            )
+            if distance <= limit_km:
+                found.append(
+                    ProviderNearbyOut(
+                        **row._mapping, distance_km=round(distance, 3)
+                    )
+                )
+        return sorted(found, key=lambda p: (p.distance_km, p.id))
+
+    async def providers_covering_owner(
+        self, owner_id: int, provider_type: Optional[ProviderType] = None
+    ) -> List[ProviderNearbyOut]:
+        owner = await self.user_repository.get_by_id(owner_id)
+        if not owner or owner.latitude is None or owner.longitude is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Укажите координаты в профиле владельца",
+            )
+
+        return await self.providers_covering_point(
+            owner.latitude, owner.longitude, provider_type
+        )
+
+    async def providers_covering_point(
+        self,
+        latitude: float,
+        longitude: float,
+        provider_type: Optional[ProviderType] = None,
+    ) -> List[ProviderNearbyOut]:
+        return await self._within(
+            latitude,
+            longitude,
+            settings.geo_max_service_radius_km,
+            provider_type,
+            within_service_radius=True,
+        )
+
+    async def nearest_providers(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int = 10,
+        provider_type: Optional[ProviderType] = None,
+        max_distance_km: Optional[float] = None,
+    ) -> List[ProviderNearbyOut]:
+        max_distance = min(
+            max_distance_km or settings.geo_nearest_max_distance_km,
+            settings.geo_nearest_max_distance_km,
+        )
+        radius = min(CELL_SIZE_DEG * KM_PER_DEGREE, max_distance)
+
+        while True:
+            found = await self._within(
+                latitude, longitude, radius, provider_type
+            )
+            if len(found) >= limit or radius >= max_distance:
+                return found[:limit]
+            radius = min(radius * 2, max_distance)
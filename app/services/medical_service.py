@@ -1,12 +1,15 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional, Sequence
 
 from fastapi import HTTPException
+from sqlalchemy import RowMapping
+
+from app.core.settings import settings
 
 from app.database.models import MedicalRecord
 from app.repositories import MedicalRecordRepo, PetRepository
 
-from app.schemas import MedicalRecordBase
+from app.schemas import MedicalRecordBase, MedicalRecordPage
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -32,6 +35,39 @@ class MedRecordService:
 
         return await self.repository.create(med_record)
 
+    async def list_records(
+        self,
+        owner_id: int,
+        pet_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> MedicalRecordPage:
+        pet_owner_id = await self.pet_repo.get_owner_id(pet_id)
+        if pet_owner_id is None:
+            raise HTTPException(status_code=400, detail="Питомец не найден")
+        if pet_owner_id != owner_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Вы не являетесь владельцем данного питомца",
+            )
+
+        try:
+            page = await self.repository.list_page(
+                pet_id, cursor, limit, with_total
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        return MedicalRecordPage.model_validate(page, from_attributes=True)
+
+    def export_history(
+        self, owner_id: int, pet_id: Optional[int] = None
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        return self.repository.stream_history(
+            owner_id, pet_id, chunk_size=settings.export_chunk_size
+        )
+
     async def delete_med_record(self, owner_id: int, med_rec_id: int) -> None:
         med_rec = await self.repository.get_by_id(med_rec_id)
         if not med_rec:
@@ -1,11 +1,18 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, replace
+from typing import List, Optional
 
 from fastapi import HTTPException
 
 from app.database.models import Pet
 from app.repositories import PetRepository
-from app.schemas import PetCreate, PetUpdate
+from app.schemas import (
+    MedicalRecordItem,
+    MedicalSummary,
+    PetCreate,
+    PetListItem,
+    PetPage,
+    PetUpdate,
+)
 
 
 
@@ -30,6 +37,36 @@ class PetService:
     async def list_pets_by_owner(self, owner_id: int) -> List[Pet] | None:
         return await self.pet_repository.list(owner_id)
 
+    async def list_pets_page(
+        self,
+        owner_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        summary: bool = False,
+        with_total: bool = False,
+    ) -> PetPage:
+        try:
+            page = await self.pet_repository.list_page(
+                owner_id, cursor, limit, with_total
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        items = [PetListItem.model_validate(pet) for pet in page.items]
+        if summary and items:
+            summaries = {item.id: MedicalSummary() for item in items}
+            rows = await self.pet_repository.medical_summary(list(summaries))
+            for row in rows:
+                entry = summaries[row.pet_id]
+                entry.records_count = row.records_count
+                entry.latest.append(MedicalRecordItem.model_validate(row))
+            for item in items:
+                item.medical_summary = summaries[item.id]
+
+        return PetPage.model_validate(
+            replace(page, items=items), from_attributes=True
+        )
+
     async def update_pet(self, pet_id: int, pet_data: PetUpdate) -> Pet:
         pet = await self.get_pet_by_id(pet_id)
         if not pet:
@@ -1,28 +1,62 @@
 from dataclasses import dataclass
-from typing import List, TypeVar, Type
+from functools import partial
+from typing import List, TypeVar, Type, Optional
 
 from fastapi import HTTPException
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    make_etag,
+    response_cache,
+)
+from app.core.serialization import type_adapter
+from app.core.settings import settings
+from app.database.connection import after_commit
 
 from app.database.models import (
-    Service,
     VeterinaryService,
     SittingService,
     GroomingService,
     ProviderType,
 )
-from app.repositories import ServiceRepository
+from app.jobs import job_handler
+from app.repositories import JobRepository, ServiceRepository
 from app.schemas import (
     VeterinaryServiceCreate,
     SittingServiceCreate,
     GroomingServiceCreate,
     ProviderServiceOut,
+    ProviderServicePage,
 )
 
+CATALOG_GENERATION_KEY = "service_catalog:generation"
+PS_FANOUT_JOB = "service.fan_out"
+
+
+@job_handler(PS_FANOUT_JOB)
+async def fan_out_provider_services(
+    db: AsyncSession, provider_type: str, service_id: int
+) -> None:
+    repository = ServiceRepository(db)
+    await repository.create_ps_for_service(
+        ProviderType(provider_type), service_id
+    )
+    after_commit(
+        db,
+        ServiceService(
+            repository=repository, cache=response_cache
+        ).invalidate_catalog,
+    )
+
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class ServiceService:
     repository: ServiceRepository
+    jobs: Optional[JobRepository] = None
+    cache: Optional[ResponseCache] = None
     T = TypeVar("T")
 
     async def _create_service(
@@ -37,10 +71,25 @@ class ServiceService:
         )
         created_service = await self.repository.create(service)
 
-        await self.repository.create_ps_for_service(
-            provider_type, created_service
-        )
+        if (
+            self.jobs is not None
+            and await self.repository.count_providers(provider_type)
+            > settings.ps_fanout_background_threshold
+        ):
+            await self.jobs.enqueue(
+                PS_FANOUT_JOB,
+                {
+                    "provider_type": provider_type.value,
+                    "service_id": created_service.id,
+                },
+                idempotency_key=f"{PS_FANOUT_JOB}:{created_service.id}",
+            )
+        else:
+            await self.repository.create_ps_for_service(
+                provider_type, created_service.id
+            )
 
+        after_commit(self.repository.db, self.invalidate_catalog)
         return created_service
 
     async def create_vet_service(
@@ -68,11 +117,56 @@ class ServiceService:
         items = await self.repository.list_by_provider(provider_id)
         return [ProviderServiceOut.model_validate(item) for item in items]
 
-    async def get_by_id(self, service_id: int) -> Service | None:
-        service = await self.repository.get_by_id(service_id)
-        if not service:
-            raise HTTPException(status_code=404, detail="Услуга не найдена")
-        return service
+    async def list_services_page(
+        self,
+        provider_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> ProviderServicePage:
+        try:
+            page = await self.repository.list_page(
+                provider_id, cursor, limit, with_total
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        return ProviderServicePage.model_validate(page, from_attributes=True)
+
+    async def _services_key(self, provider_id: int) -> str:
+        generation = await self.cache.generation(CATALOG_GENERATION_KEY)
+        return f"provider_services:{generation}:{provider_id}"
+
+    async def cached_services(self, provider_id: int) -> CachedResponse:
+        key = None
+        if self.cache is not None:
+            key = await self._services_key(provider_id)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        items = await self.repository.list_by_provider(provider_id)
+        body = self._dump(items)
+        # An empty list is also what unknown ids get; caching it would let
+        # id scans fill the cache and hide a provider registered later.
+        if key is None or not items:
+            return CachedResponse(body=body, etag=make_etag(body))
+        return await self.cache.set(key, body)
+
+    @staticmethod
+    def _dump(items) -> bytes:
+        adapter = type_adapter(List[ProviderServiceOut])
+        return adapter.dump_json(
+            adapter.validate_python(items, from_attributes=True)
+        )
+
+    async def invalidate_provider(self, provider_id: int) -> None:
+        if self.cache is not None:
+            await self.cache.delete(await self._services_key(provider_id))
+
+    async def invalidate_catalog(self) -> None:
+        if self.cache is not None:
+            await self.cache.bump(CATALOG_GENERATION_KEY)
 
     async def update_service(
         self, provider_id: int, ps_id: int, data: BaseModel
@@ -89,10 +183,17 @@ class ServiceService:
                 status_code=400, detail="Нет данных для обновления"
             )
 
-        return await self.repository.update(ps, update_data)
+        updated = await self.repository.update(ps, update_data)
+        after_commit(
+            self.repository.db, partial(self.invalidate_provider, provider_id)
+        )
+        return updated
 
     async def delete_service(self, provider_id: int, ps_id: int) -> None:
         ps = await self.repository.get_by_provider_and_id(provider_id, ps_id)
         if not ps:
             raise HTTPException(status_code=404, detail="Услуга не найдена")
         await self.repository.delete(ps.id)
+        after_commit(
+            self.repository.db, partial(self.invalidate_provider, provider_id)
+        )
@@ -0,0 +1,183 @@
+import base64
+import hashlib
+import hmac
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.cache import TTLCache
+from app.core.security import create_access_token, revoke_session_tokens
+from app.core.sessions import SessionState
+from app.core.settings import settings
+from app.database.models import User, UserSession
+from app.database.types import UserType
+from app.repositories import SessionRepository
+from app.schemas import Token
+
+
+def hash_secret(secret: str) -> str:
+    # Refresh secrets are 256-bit MACs, so a fast hash is enough; no bcrypt.
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def refresh_secret(session_id: str, generation: int) -> str:
+    # Derived instead of random, so a replayed token of any earlier
+    # generation can be told apart from a guess.
+    digest = hmac.new(
+        settings.secret_key.encode(),
+        f"refresh:{session_id}:{generation}".encode(),
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Недействительный refresh-токен",
+    )
+
+
+def _parse_refresh_token(token: str) -> tuple[str, Optional[int], str]:
+    session_id, _, rest = token.partition(".")
+    # Tokens issued before generations existed are "<session>.<secret>".
+    generation, _, secret = rest.rpartition(".")
+    if not session_id or not secret:
+        raise _invalid_refresh_token()
+    if generation and not (generation.isascii() and generation.isdigit()):
+        raise _invalid_refresh_token()
+    return session_id, int(generation) if generation else None, secret
+
+
+class RefreshTokenReused(HTTPException):
+    """The session was revoked; the caller must commit before failing."""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh-токен уже использован, сессия завершена",
+        )
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class SessionService:
+    repository: SessionRepository
+    cache: Optional[TTLCache[str, SessionState]] = None
+
+    async def login(
+        self, user: User, user_agent: Optional[str] = None
+    ) -> Token:
+        now = datetime.utcnow()
+        session_id = uuid.uuid4().hex
+        secret = refresh_secret(session_id, 0)
+        session = UserSession(
+            id=session_id,
+            user_id=user.id,
+            refresh_hash=hash_secret(secret),
+            generation=0,
+            user_agent=user_agent[:200] if user_agent else None,
+            created_at=now,
+            last_used_at=now,
+            expires_at=now + timedelta(days=settings.refresh_token_expire_days),
+        )
+        await self.repository.create(session)
+        self._remember(session.id, SessionState(user.id, session.expires_at))
+        return self._token(session.id, 0, secret, user.id, user.role)
+
+    async def refresh(self, refresh_token: str) -> Token:
+        session_id, generation, secret = _parse_refresh_token(refresh_token)
+
+        now = datetime.utcnow()
+        state = self.cache.get(session_id) if self.cache is not None else None
+        if state is not None and (state.revoked or state.expires_at <= now):
+            raise _invalid_refresh_token()
+
+        # A pre-generation token can only be current if it was never rotated.
+        current = generation or 0
+        presented = hash_secret(secret)
+        new_secret = refresh_secret(session_id, current + 1)
+        row = await self.repository.rotate(
+            session_id, current, presented, hash_secret(new_secret), now
+        )
+        if row is None:
+            if await self._reused(session_id, generation, secret, now):
+                raise RefreshTokenReused()
+            raise _invalid_refresh_token()
+
+        self._remember(session_id, SessionState(row.user_id, row.expires_at))
+        return self._token(
+            session_id, current + 1, new_secret, row.user_id, row.role
+        )
+
+    async def _reused(
+        self,
+        session_id: str,
+        generation: Optional[int],
+        secret: str,
+        now: datetime,
+    ) -> bool:
+        session = await self.repository.get_by_id(session_id)
+        if session is None or session.revoked_at is not None:
+            return False
+        if generation is None:
+            reused = session.generation > 0 and (
+                session.previous_hash == hash_secret(secret)
+            )
+        else:
+            reused = generation < session.generation and hmac.compare_digest(
+                secret, refresh_secret(session_id, generation)
+            )
+        if not reused:
+            return False
+
+        # A rotated-out token came back: whoever holds the current one may
+        # be the thief, so the whole session ends.
+        await self._revoke(session.user_id, session_id, now)
+        return True
+
+    async def list_sessions(self, user_id: int) -> List[UserSession]:
+        return await self.repository.list_active(user_id, datetime.utcnow())
+
+    async def revoke_session(
+        self, user_id: int, session_id: str, missing_ok: bool = False
+    ) -> None:
+        revoked = await self._revoke(user_id, session_id, datetime.utcnow())
+        if not revoked and not missing_ok:
+            raise HTTPException(status_code=404, detail="Сессия не найдена")
+
+    async def revoke_all(self, user_id: int) -> int:
+        revoked = await self._revoke(user_id, None, datetime.utcnow())
+        return len(revoked)
+
+    async def _revoke(
+        self, user_id: int, session_id: Optional[str], now: datetime
+    ) -> List[str]:
+        revoked = await self.repository.revoke(now, user_id, session_id)
+        for revoked_id in revoked:
+            revoke_session_tokens(revoked_id)
+            self._remember(revoked_id, SessionState(user_id, now, revoked=True))
+        return revoked
+
+    def _remember(self, session_id: str, state: SessionState) -> None:
+        if self.cache is not None:
+            self.cache.set(session_id, state)
+
+    @staticmethod
+    def _token(
+        session_id: str,
+        generation: int,
+        secret: str,
+        user_id: int,
+        role: UserType,
+    ) -> Token:
+        return Token(
+            access_token=create_access_token(
+                subject=str(user_id), role=role.value, session_id=session_id
+            ),
+            token_type="bearer",
+            role=role.value,
+            refresh_token=f"{session_id}.{generation}.{secret}",
+        )
@@ -1,12 +1,49 @@
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from typing import List, Optional
 
 from fastapi import HTTPException
 
+from app.core.settings import settings
 from app.database.models import AvailableSlot
 from app.repositories import SlotRepository
 from app.repositories import UserRepository
-from app.schemas import SlotCreate, SlotOut
+from app.database.types import ProviderType, AnimalType
+from app.schemas import (
+    SlotBatchSummary,
+    SlotCreate,
+    SlotOut,
+    SlotPage,
+    SlotSchedule,
+    SlotSearchResult,
+)
+
+
+def expand_schedule(schedule: SlotSchedule) -> List[dict]:
+    step = timedelta(minutes=schedule.slot_minutes)
+    start = datetime.combine(schedule.date_from, schedule.start_time)
+    end = datetime.combine(schedule.date_from, schedule.end_time)
+    times = []
+    while start + step <= end:
+        times.append((start.time(), (start + step).time()))
+        start += step
+
+    weekdays = set(schedule.weekdays)
+    rows = []
+    for offset in range(schedule.weeks * 7):
+        day = schedule.date_from + timedelta(days=offset)
+        if day.weekday() in weekdays:
+            rows.extend(
+                {
+                    "date": day,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "is_available": True,
+                }
+                for start_time, end_time in times
+            )
+    return rows
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -25,7 +62,128 @@ class SlotService:
 
         slot = AvailableSlot(**slot_data.model_dump(), provider_id=provider_id)
 
-        return await self.slot_repository.create(slot)
+        return await self.slot_repository.create(slot, load=("provider",))
+
+    async def create_slots(
+        self, slots: List[SlotCreate], provider_id: int
+    ) -> SlotBatchSummary:
+        return await self._create_batch(
+            [slot.model_dump() for slot in slots], provider_id
+        )
+
+    async def create_schedule(
+        self, schedule: SlotSchedule, provider_id: int
+    ) -> SlotBatchSummary:
+        if any(day < 0 or day > 6 for day in schedule.weekdays):
+            raise HTTPException(
+                status_code=400,
+                detail="Дни недели задаются числами от 0 (пн) до 6 (вс)",
+            )
+        if schedule.start_time >= schedule.end_time:
+            raise HTTPException(
+                status_code=400,
+                detail="start_time должно быть раньше end_time",
+            )
+
+        return await self._create_batch(expand_schedule(schedule), provider_id)
+
+    async def _create_batch(
+        self, rows: List[dict], provider_id: int
+    ) -> SlotBatchSummary:
+        if not rows:
+            raise HTTPException(
+                status_code=400, detail="Расписание не содержит ни одного слота"
+            )
+        if len(rows) > settings.slot_batch_max:
+            raise HTTPException(
+                status_code=400,
+                detail=f"За один запрос можно создать не более "
+                f"{settings.slot_batch_max} слотов",
+            )
+        if any(row["start_time"] >= row["end_time"] for row in rows):
+            raise HTTPException(
+                status_code=400,
+                detail="start_time должно быть раньше end_time",
+            )
+
+        created = await self.slot_repository.create_many_ignore(
+            [{**row, "provider_id": provider_id} for row in rows]
+        )
+        dates = [row["date"] for row in rows]
+        return SlotBatchSummary(
+            requested=len(rows),
+            created=created,
+            skipped=len(rows) - created,
+            date_from=min(dates),
+            date_to=max(dates),
+        )
 
     async def get_list_slots(self, provider_id) -> List[SlotOut]:
         return await self.slot_repository.list(provider_id)
+
+    async def get_slot_page(
+        self,
+        provider_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> SlotPage:
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from не может быть позже date_to"
+            )
+
+        provider = await self.user_repository.get_by_id(provider_id)
+        if not provider:
+            raise HTTPException(status_code=404, detail="Провайдер не найден")
+
+        try:
+            page = await self.slot_repository.list_page(
+                provider_id, date_from, date_to, cursor, limit, with_total
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+        return SlotPage(
+            provider=provider,
+            items=page.items,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+            total_estimate=page.total_estimate,
+        )
+
+    async def search_available_slots(
+        self,
+        provider_type: Optional[ProviderType] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        time_from: Optional[time] = None,
+        time_to: Optional[time] = None,
+        min_duration: Optional[int] = None,
+        max_price: Optional[Decimal] = None,
+        animal_type: Optional[AnimalType] = None,
+        limit: int = 50,
+    ) -> List[SlotSearchResult]:
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from не может быть позже date_to"
+            )
+        if time_from and time_to and time_from >= time_to:
+            raise HTTPException(
+                status_code=400, detail="time_from должно быть раньше time_to"
+            )
+
+        rows = await self.slot_repository.search_available(
+            provider_type=provider_type,
+            date_from=date_from or date.today(),
+            date_to=date_to,
+            time_from=time_from,
+            time_to=time_to,
+            min_duration=min_duration,
+            max_price=max_price,
+            animal_type=animal_type,
+            limit=limit,
+        )
+        return [SlotSearchResult.model_validate(row) for row in rows]
@@ -2,18 +2,37 @@ from dataclasses import dataclass
 from typing import Type, TypeVar, Optional
 from fastapi import HTTPException
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.principal import Principal, principal_cache
+from app.core.security import (
+    get_password_hash_async,
+    verify_and_update_password_async,
+)
 from app.database.models import User, Provider, Owner
-from app.repositories import ServiceRepository
+from app.database.types import ProviderType
+from app.jobs import job_handler
+from app.repositories import JobRepository, ServiceRepository
 from app.repositories import UserRepository
 from app.schemas import UserAuth, ProviderCreate, OwnerCreate
 
+PROVIDER_ONBOARDING_JOB = "provider.onboard"
+
+
+@job_handler(PROVIDER_ONBOARDING_JOB)
+async def onboard_provider(
+    db: AsyncSession, provider_id: int, provider_type: str
+) -> None:
+    await ServiceRepository(db).create_ps_for_owner(
+        provider_id, ProviderType(provider_type)
+    )
+
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class UserService:
     repository: UserRepository
     service_repository: Optional[ServiceRepository] = None
+    jobs: Optional[JobRepository] = None
 
     T = TypeVar("T")
 
@@ -27,7 +46,7 @@ class UserService:
                 status_code=400, detail="Такой пользователь уже существует"
             )
 
-        hashed_password = get_password_hash(user_data.password_hash)
+        hashed_password = await get_password_hash_async(user_data.password_hash)
         updated = user_data.model_copy(
             update={"password_hash": hashed_password}
         )
@@ -41,9 +60,21 @@ class UserService:
     async def register_provider(self, user_data: ProviderCreate) -> Provider:
         created_provider = await self._register_user(user_data, Provider)
 
-        await self.service_repository.create_ps_for_owner(
-            created_provider, created_provider.provider_type
-        )
+        if self.jobs is not None:
+            await self.jobs.enqueue(
+                PROVIDER_ONBOARDING_JOB,
+                {
+                    "provider_id": created_provider.id,
+                    "provider_type": created_provider.provider_type.value,
+                },
+                idempotency_key=(
+                    f"{PROVIDER_ONBOARDING_JOB}:{created_provider.id}"
+                ),
+            )
+        else:
+            await self.service_repository.create_ps_for_owner(
+                created_provider.id, created_provider.provider_type
+            )
 
         return created_provider
 
@@ -53,10 +84,25 @@ class UserService:
             raise HTTPException(
                 status_code=400, detail="Пользователь не найден"
             )
-        if not verify_password(user_data.password, user.password_hash):
+        valid, new_hash = await verify_and_update_password_async(
+            user_data.password, user.password_hash
+        )
+        if not valid:
             return None
+        if new_hash:
+            await self.repository.update(user, {"password_hash": new_hash})
         return user
 
+    async def principal_by_id(self, user_id: int) -> Principal | None:
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+        principal = await self.repository.get_principal(user_id)
+        if principal is not None:
+            principal_cache.set(user_id, principal)
+        return principal
+
     async def user_by_id(self, user_id: id) -> User | None:
         user = await self.repository.get_by_id(user_id)
         if not user:
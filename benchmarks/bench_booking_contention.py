@@ -0,0 +1,176 @@
+"""
+Hundreds of owners booking the same sitter slot at once. Every attempt runs
+in its own session/transaction, like a request; the slot must end up with
+exactly max_pets bookings and no more.
+
+Seeds its rows into DATABASE_URL and removes them afterwards.
+
+    python -m benchmarks.bench_booking_contention --attempts 300 --capacity 3
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, select, func
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import (
+    User,
+    Owner,
+    Provider,
+    Pet,
+    AvailableSlot,
+    Booking,
+    ProviderService,
+    Service,
+    SittingService,
+)
+from app.database.types import AnimalType, ProviderType, UserType
+from app.repositories import BookingRepository, SlotRepository
+from app.schemas import BookingCreate
+from app.services import BookingService
+
+EMAIL_PREFIX = "bench-booking-"
+
+
+async def seed(db, attempts: int, capacity: int) -> tuple[int, int, list[int]]:
+    users = User.__table__
+    result = await db.execute(
+        insert(users).returning(users.c.id),
+        [
+            {
+                "email": f"{EMAIL_PREFIX}{i}@example.com",
+                "password_hash": "x",
+                "role": UserType.owner if i else UserType.provider,
+            }
+            for i in range(2)
+        ],
+    )
+    provider_id, owner_id = result.scalars().all()
+    await db.execute(
+        insert(Provider.__table__),
+        [
+            {
+                "id": provider_id,
+                "company_name": "bench",
+                "provider_type": ProviderType.sitter,
+                "is_verified": True,
+            }
+        ],
+    )
+    await db.execute(insert(Owner.__table__), [{"id": owner_id}])
+
+    service = SittingService(
+        name=f"{EMAIL_PREFIX}service",
+        base_price=100,
+        duration_min=60,
+        max_pets=capacity,
+    )
+    slot = AvailableSlot(
+        provider_id=provider_id,
+        date=datetime.date(2099, 1, 1),
+        start_time=datetime.time(9),
+        end_time=datetime.time(18),
+    )
+    db.add_all([service, slot])
+    await db.flush()
+    db.add(
+        ProviderService(
+            provider_id=provider_id,
+            service_id=service.id,
+            custom_price=100,
+            custom_duration=60,
+        )
+    )
+
+    pets = Pet.__table__
+    result = await db.execute(
+        insert(pets).returning(pets.c.id),
+        [
+            {
+                "owner_id": owner_id,
+                "name": f"pet-{i}",
+                "animal_type": AnimalType.dog,
+            }
+            for i in range(attempts)
+        ],
+    )
+    pet_ids = result.scalars().all()
+    await db.commit()
+    return slot.id, service.id, pet_ids
+
+
+async def book(
+    slot_id: int, service_id: int, pet_id: int
+) -> tuple[bool, float]:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        service = BookingService(
+            repository=BookingRepository(db),
+            slot_repository=SlotRepository(db),
+        )
+        try:
+            await service.create_booking(
+                BookingCreate(
+                    pet_id=pet_id, slot_id=slot_id, service_id=service_id
+                )
+            )
+            await db.commit()
+            booked = True
+        except HTTPException:
+            await db.rollback()
+            booked = False
+    return booked, time.perf_counter() - started
+
+
+async def cleanup(db, slot_id: int, service_id: int) -> None:
+    await db.execute(delete(Booking).where(Booking.slot_id == slot_id))
+    for table in (SittingService.__table__, Service.__table__):
+        await db.execute(delete(table).where(table.c.id == service_id))
+    await db.execute(delete(User).where(User.email.startswith(EMAIL_PREFIX)))
+    await db.commit()
+
+
+async def main(attempts: int, capacity: int) -> None:
+    async with AsyncSessionLocal() as db:
+        slot_id, service_id, pet_ids = await seed(db, attempts, capacity)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(book(slot_id, service_id, pet_id) for pet_id in pet_ids)
+    )
+    elapsed = time.perf_counter() - started
+
+    async with AsyncSessionLocal() as db:
+        booked = await db.scalar(
+            select(func.count())
+            .select_from(Booking)
+            .where(Booking.slot_id == slot_id)
+        )
+        slot = await db.get(AvailableSlot, slot_id)
+        latencies = sorted(latency for _, latency in results)
+        print(f"attempts={attempts} capacity={capacity}")
+        print(f"accepted={sum(ok for ok, _ in results)} rows={booked}")
+        print(
+            f"slot booked_count={slot.booked_count} "
+            f"is_available={slot.is_available}"
+        )
+        print(
+            f"total={elapsed:.3f}s "
+            f"p50={statistics.median(latencies) * 1000:.1f}ms "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f}ms"
+        )
+        await cleanup(db, slot_id, service_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attempts", type=int, default=300)
+    parser.add_argument("--capacity", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.attempts, args.capacity))
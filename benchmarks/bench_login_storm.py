@@ -0,0 +1,73 @@
+"""
+Latency of unrelated work on the event loop while a burst of logins
+verifies bcrypt hashes, with inline hashing vs the bounded worker pool.
+
+    python -m benchmarks.bench_login_storm --logins 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.security import (
+    get_password_hash,
+    verify_password,
+    verify_password_async,
+    shutdown_hash_executor,
+)
+
+PASSWORD = "correct horse battery staple"
+
+
+async def unrelated_endpoint(latencies: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.005)
+        latencies.append(time.perf_counter() - started - 0.005)
+
+
+async def login_inline(hashed: str) -> None:
+    verify_password(PASSWORD, hashed)
+
+
+async def login_pooled(hashed: str) -> None:
+    await verify_password_async(PASSWORD, hashed)
+
+
+async def run(login, hashed: str, logins: int) -> list[float]:
+    latencies: list[float] = []
+    stop = asyncio.Event()
+    probes = [
+        asyncio.create_task(unrelated_endpoint(latencies, stop))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0.05)
+    await asyncio.gather(*(login(hashed) for _ in range(logins)))
+    stop.set()
+    await asyncio.gather(*probes)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered) * 1000
+    p99 = ordered[int(len(ordered) * 0.99) - 1] * 1000
+    print(
+        f"{name:<8} samples={len(ordered):<6} "
+        f"p50={p50:8.2f}ms p99={p99:8.2f}ms"
+    )
+
+
+async def main(logins: int) -> None:
+    hashed = get_password_hash(PASSWORD)
+    report("inline", await run(login_inline, hashed, logins))
+    report("pooled", await run(login_pooled, hashed, logins))
+    shutdown_hash_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
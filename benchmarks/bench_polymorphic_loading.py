@@ -0,0 +1,218 @@
+"""
+Loading Service rows for a provider's price list and booking list: the old
+mapper-wide with_polymorphic="*" (LEFT OUTER JOIN of every subtype table)
+vs base-only loads of the services table.
+
+Runs against DATABASE_URL inside a transaction that is rolled back.
+
+    python -m benchmarks.bench_polymorphic_loading --services 300
+
+PostgreSQL 16.2 over a Unix socket, 1 vCPU, --services 2000 (6000 rows),
+base-only vs with_polymorphic: price list p50 476 vs 574ms (46 vs 76ms in
+SQL), booking list p50 5.0 vs 9.4s (4.1 vs 8.4s in SQL).
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import selectinload, with_polymorphic
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import (
+    User,
+    Owner,
+    Provider,
+    Pet,
+    AvailableSlot,
+    Booking,
+    Service,
+    VeterinaryService,
+    GroomingService,
+    SittingService,
+    ProviderService,
+)
+from app.database.types import AnimalType, ProviderType, UserType
+
+
+async def seed(db, count: int) -> int:
+    users = User.__table__
+    result = await db.execute(
+        insert(users).returning(users.c.id),
+        [
+            {
+                "email": f"bench-poly-{i}@example.com",
+                "password_hash": "x",
+                "role": UserType.owner if i == 0 else UserType.provider,
+            }
+            for i in range(2)
+        ],
+    )
+    owner_id, provider_id = result.scalars().all()
+    await db.execute(insert(Owner.__table__), [{"id": owner_id}])
+    await db.execute(
+        insert(Provider.__table__),
+        [
+            {
+                "id": provider_id,
+                "company_name": "bench",
+                "provider_type": ProviderType.groomer,
+                "is_verified": True,
+            }
+        ],
+    )
+
+    services = []
+    for i in range(count):
+        services += [
+            VeterinaryService(
+                name=f"vet-{i}",
+                base_price=100,
+                duration_min=30,
+                animal_type="dog",
+                emergency_available=False,
+            ),
+            GroomingService(
+                name=f"groom-{i}",
+                base_price=100,
+                duration_min=30,
+                tools_required="scissors",
+                coat_type="long",
+            ),
+            SittingService(
+                name=f"sit-{i}",
+                base_price=100,
+                duration_min=30,
+                max_pets=2,
+                overnight_available=True,
+            ),
+        ]
+    db.add_all(services)
+    await db.flush()
+
+    # Bookings do not check the provider's catalog, so the list below holds
+    # every subtype and the outer joins have something to find.
+    await db.execute(
+        insert(ProviderService.__table__),
+        [
+            {
+                "provider_id": provider_id,
+                "service_id": service.id,
+                "custom_price": 100,
+                "custom_duration": 30,
+            }
+            for service in services
+        ],
+    )
+
+    pet = Pet(owner_id=owner_id, name="bench", animal_type=AnimalType.dog)
+    db.add(pet)
+    await db.flush()
+
+    slots = AvailableSlot.__table__
+    result = await db.execute(
+        insert(slots).returning(slots.c.id),
+        [
+            {
+                "provider_id": provider_id,
+                "date": datetime.date(2030, 1, 1) + datetime.timedelta(days=i),
+                "start_time": datetime.time(9),
+                "end_time": datetime.time(10),
+                "is_available": False,
+                "booked_count": 1,
+            }
+            for i in range(len(services))
+        ],
+    )
+    await db.execute(
+        insert(Booking.__table__),
+        [
+            {"pet_id": pet.id, "slot_id": slot_id, "service_id": service.id}
+            for slot_id, service in zip(result.scalars().all(), services)
+        ],
+    )
+    return provider_id
+
+
+def price_list(provider_id: int, polymorphic: bool):
+    service = ProviderService.service
+    if polymorphic:
+        service = service.of_type(with_polymorphic(Service, "*"))
+    return (
+        select(ProviderService)
+        .options(selectinload(service))
+        .where(ProviderService.provider_id == provider_id)
+    )
+
+
+def booking_list(provider_id: int, polymorphic: bool):
+    service = Booking.service
+    if polymorphic:
+        service = service.of_type(with_polymorphic(Service, "*"))
+    return (
+        select(Booking)
+        .join(Booking.slot)
+        .options(selectinload(service))
+        .where(AvailableSlot.provider_id == provider_id)
+    )
+
+
+async def measure(db, stmt, runs: int) -> tuple[float, float, int]:
+    sql_time = [0.0]
+    cursor_started = []
+
+    def _before(*args):
+        cursor_started.append(time.perf_counter())
+
+    def _after(*args):
+        sql_time[0] += time.perf_counter() - cursor_started.pop()
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after)
+    timings, sql_timings = [], []
+    for _ in range(runs):
+        db.expunge_all()
+        sql_time[0] = 0.0
+        started = time.perf_counter()
+        rows = (await db.execute(stmt)).scalars().all()
+        timings.append(time.perf_counter() - started)
+        sql_timings.append(sql_time[0])
+    event.remove(engine.sync_engine, "before_cursor_execute", _before)
+    event.remove(engine.sync_engine, "after_cursor_execute", _after)
+    return (
+        statistics.median(timings) * 1000,
+        statistics.median(sql_timings) * 1000,
+        len(rows),
+    )
+
+
+async def main(count: int, runs: int) -> None:
+    async with AsyncSessionLocal() as db:
+        provider_id = await seed(db, count)
+        print(f"services={count * 3} bookings={count * 3} runs={runs}")
+        for name, build in (
+            ("price list", price_list),
+            ("booking list", booking_list),
+        ):
+            for polymorphic in (True, False):
+                label = "with_polymorphic=*" if polymorphic else "base only"
+                p50, sql, rows = await measure(
+                    db, build(provider_id, polymorphic), runs
+                )
+                print(
+                    f"{name:<13} {label:<19} p50={p50:8.2f}ms "
+                    f"sql={sql:8.2f}ms rows={rows}"
+                )
+        await db.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--services", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.services, args.runs))
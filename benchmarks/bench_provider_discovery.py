@@ -0,0 +1,135 @@
+"""
+Geo discovery over a large provider table: "providers covering this point"
+and bounded top-k nearest, both served by the geo_cell grid index.
+
+Seeds providers around a city into DATABASE_URL and removes them afterwards.
+
+    python -m benchmarks.bench_provider_discovery --providers 100000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import delete, insert, text
+
+from app.core.geo import grid_cell
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import User, Provider
+from app.database.types import ProviderType, UserType
+from app.repositories import ProviderRepository
+from app.services import DiscoveryService
+
+EMAIL_PREFIX = "bench-geo-"
+CENTER = (55.7558, 37.6173)
+SPREAD_DEG = 1.5
+BATCH = 10_000
+
+
+def random_point(rng: random.Random) -> tuple[float, float]:
+    return (
+        CENTER[0] + rng.uniform(-SPREAD_DEG, SPREAD_DEG),
+        CENTER[1] + rng.uniform(-SPREAD_DEG * 2, SPREAD_DEG * 2),
+    )
+
+
+async def seed(db, count: int, rng: random.Random) -> list[int]:
+    users = User.__table__
+    ids = []
+    for offset in range(0, count, BATCH):
+        result = await db.execute(
+            insert(users).returning(users.c.id),
+            [
+                {
+                    "email": f"{EMAIL_PREFIX}{i}@example.com",
+                    "password_hash": "x",
+                    "role": UserType.provider,
+                }
+                for i in range(offset, min(offset + BATCH, count))
+            ],
+        )
+        batch_ids = list(result.scalars().all())
+        rows = []
+        for provider_id in batch_ids:
+            lat, lon = random_point(rng)
+            rows.append(
+                {
+                    "id": provider_id,
+                    "company_name": f"bench {provider_id}",
+                    "provider_type": rng.choice(list(ProviderType)),
+                    "service_radius_km": rng.randint(1, 25),
+                    "is_verified": True,
+                    "latitude": lat,
+                    "longitude": lon,
+                    "geo_cell": grid_cell(lat, lon),
+                }
+            )
+        await db.execute(insert(Provider.__table__), rows)
+        ids.extend(batch_ids)
+    await db.commit()
+    return ids
+
+
+async def cleanup(db, ids: list[int]) -> None:
+    for offset in range(0, len(ids), BATCH):
+        chunk = ids[offset : offset + BATCH]
+        await db.execute(
+            delete(Provider.__table__).where(Provider.__table__.c.id.in_(chunk))
+        )
+        await db.execute(
+            delete(User.__table__).where(User.__table__.c.id.in_(chunk))
+        )
+    await db.commit()
+
+
+async def timed(fn, runs: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return (
+        statistics.median(timings) * 1000,
+        timings[int(len(timings) * 0.99) - 1] * 1000,
+    )
+
+
+async def main(count: int, runs: int) -> None:
+    rng = random.Random(1)
+    async with AsyncSessionLocal() as db:
+        ids = await seed(db, count, rng)
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(text("ANALYZE providers"))
+
+        service = DiscoveryService(provider_repository=ProviderRepository(db))
+        try:
+
+            async def covering():
+                lat, lon = random_point(rng)
+                return await service.providers_covering_point(lat, lon)
+
+            async def nearest():
+                lat, lon = random_point(rng)
+                return await service.nearest_providers(
+                    lat, lon, limit=10, provider_type=ProviderType.vet
+                )
+
+            print(f"providers={count} runs={runs}")
+            for name, fn in (("covering", covering), ("nearest", nearest)):
+                p50, p99 = await timed(fn, runs)
+                print(f"{name:<9} p50={p50:8.2f}ms p99={p99:8.2f}ms")
+        finally:
+            await db.rollback()
+            await cleanup(db, ids)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--providers", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.providers, args.runs))
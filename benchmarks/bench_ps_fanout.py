@@ -0,0 +1,109 @@
+"""
+Fan-out of a new catalog service to every provider of its type: the old
+per-row INSERT + refresh loop vs a single INSERT ... SELECT.
+
+Runs against DATABASE_URL inside a transaction that is rolled back.
+
+    python -m benchmarks.bench_ps_fanout --providers 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert, select
+
+from app.database.connection import AsyncSessionLocal, engine
+from app.database.models import (
+    User,
+    Provider,
+    ProviderService,
+    GroomingService,
+)
+from app.database.types import ProviderType, UserType
+from app.repositories import ServiceRepository
+
+
+async def seed_providers(db, count: int) -> None:
+    users = User.__table__
+    providers = Provider.__table__
+    result = await db.execute(
+        insert(users).returning(users.c.id),
+        [
+            {
+                "email": f"bench-{i}@example.com",
+                "password_hash": "x",
+                "role": UserType.provider,
+            }
+            for i in range(count)
+        ],
+    )
+    ids = result.scalars().all()
+    await db.execute(
+        insert(providers),
+        [
+            {
+                "id": user_id,
+                "company_name": "bench",
+                "provider_type": ProviderType.groomer,
+                "is_verified": True,
+            }
+            for user_id in ids
+        ],
+    )
+
+
+async def new_service(repo: ServiceRepository, name: str) -> GroomingService:
+    service = GroomingService(
+        name=name,
+        base_price=100,
+        duration_min=60,
+        service_type=ProviderType.groomer,
+    )
+    return await repo.create(service)
+
+
+async def per_row(repo: ServiceRepository) -> float:
+    service = await new_service(repo, "bench-per-row")
+    started = time.perf_counter()
+    result = await repo.db.execute(
+        select(Provider.__table__.c.id).where(
+            Provider.__table__.c.provider_type == ProviderType.groomer
+        )
+    )
+    for provider_id in result.scalars().all():
+        ps = ProviderService(
+            provider_id=provider_id,
+            service_id=service.id,
+            custom_price=service.base_price,
+            custom_duration=service.duration_min,
+        )
+        repo.db.add(ps)
+        await repo.db.flush()
+        await repo.db.refresh(ps)
+    return time.perf_counter() - started
+
+
+async def set_based(repo: ServiceRepository) -> float:
+    service = await new_service(repo, "bench-set-based")
+    started = time.perf_counter()
+    await repo.create_ps_for_service(ProviderType.groomer, service.id)
+    return time.perf_counter() - started
+
+
+async def main(count: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await seed_providers(db, count)
+        repo = ServiceRepository(db)
+        print(f"providers={count}")
+        print(f"per-row    {await per_row(repo):8.3f}s")
+        print(f"set-based  {await set_based(repo):8.3f}s")
+        await db.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--providers", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.providers))
@@ -0,0 +1,146 @@
+"""
+Serialization cost of 1k BookingOut objects built from ORM instances:
+FastAPI's response_model path (validate, jsonable payload, stdlib json) vs
+ORJSONResponse vs PydanticResponse (cached TypeAdapter, bytes straight from
+pydantic-core).
+
+Needs no database.
+
+    python -m benchmarks.bench_serialization --bookings 1000
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import PydanticResponse
+from app.database.models import (
+    AvailableSlot,
+    Booking,
+    GroomingService,
+    MedicalRecord,
+    Pet,
+    Provider,
+)
+from app.database.types import (
+    AnimalType,
+    BookingStatus,
+    ProviderType,
+    RecordType,
+    UserType,
+)
+from app.schemas import BookingOut
+
+
+def make_bookings(count: int) -> list[Booking]:
+    provider = Provider(
+        id=1,
+        email="vet@example.com",
+        first_name="Иван",
+        surname="Иванов",
+        role=UserType.provider,
+        company_name="Груминг",
+        provider_type=ProviderType.groomer,
+        service_radius_km=10,
+        hourly_rate=1000,
+    )
+    service = GroomingService(
+        id=1, name="Стрижка", base_price=1500, duration_min=60
+    )
+    bookings = []
+    for i in range(count):
+        pet = Pet(
+            id=i,
+            owner_id=2,
+            name=f"Рекс {i}",
+            animal_type=AnimalType.dog,
+            breed="Без породы",
+        )
+        pet.medical_records = [
+            MedicalRecord(
+                id=i,
+                pet_id=i,
+                record_type=RecordType.vaccine,
+                description="Прививка",
+            )
+        ]
+        slot = AvailableSlot(
+            id=i,
+            provider_id=1,
+            date=datetime.date(2030, 1, 1) + datetime.timedelta(days=i),
+            start_time=datetime.time(9),
+            end_time=datetime.time(10),
+            is_available=False,
+        )
+        slot.provider = provider
+        bookings.append(
+            Booking(
+                id=i,
+                pet_id=i,
+                slot_id=i,
+                service_id=1,
+                status=BookingStatus.pending,
+                pet=pet,
+                slot=slot,
+                service=service,
+            )
+        )
+    return bookings
+
+
+async def response_model(field, bookings, response_class) -> bytes:
+    content = await serialize_response(field=field, response_content=bookings)
+    return response_class(content).body
+
+
+def timed(run, rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main(count: int, rounds: int) -> None:
+    bookings = make_bookings(count)
+    field = create_model_field(
+        name="Response", type_=List[BookingOut], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    variants = {
+        "response_model+json": lambda: loop.run_until_complete(
+            response_model(field, bookings, JSONResponse)
+        ),
+        "response_model+orjson": lambda: loop.run_until_complete(
+            response_model(field, bookings, ORJSONResponse)
+        ),
+        "type_adapter": lambda: PydanticResponse(
+            List[BookingOut], bookings
+        ).body,
+    }
+    print(f"bookings={count} rounds={rounds}")
+    for name, run in variants.items():
+        run()
+        samples = timed(run, rounds)
+        print(
+            f"{name:24} p50={statistics.median(samples) * 1000:8.2f}ms "
+            f"min={min(samples) * 1000:8.2f}ms"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+    main(args.bookings, args.rounds)
@@ -0,0 +1,86 @@
+"""slot capacity, provider lookups and geo grid
+
+Revision ID: 3d9b2c4e8f10
+Revises: a1c3e5f70b21
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3d9b2c4e8f10"
+down_revision: Union[str, None] = "a1c3e5f70b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("owners", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column("owners", sa.Column("longitude", sa.Float(), nullable=True))
+    op.add_column("providers", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column(
+        "providers", sa.Column("longitude", sa.Float(), nullable=True)
+    )
+    op.add_column(
+        "providers", sa.Column("geo_cell", sa.BigInteger(), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_providers_geo_cell"), "providers", ["geo_cell"], unique=False
+    )
+    op.create_index(
+        op.f("ix_providers_provider_type"),
+        "providers",
+        ["provider_type"],
+        unique=False,
+    )
+
+    op.add_column(
+        "available_slots",
+        sa.Column(
+            "booked_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    # Slots that are already full are closed as well, or search keeps
+    # offering them. A slot is full once it holds as many bookings as the
+    # roomiest of its services allows.
+    op.execute("""
+        UPDATE available_slots
+        SET booked_count = booked.count,
+            is_available = available_slots.is_available
+                AND booked.count < booked.capacity
+        FROM (
+            SELECT bookings.slot_id,
+                   count(*) AS count,
+                   max(coalesce(sitting_services.max_pets, 1)) AS capacity
+            FROM bookings
+            LEFT JOIN sitting_services
+                ON sitting_services.id = bookings.service_id
+            GROUP BY bookings.slot_id
+        ) AS booked
+        WHERE booked.slot_id = available_slots.id
+        """)
+    op.create_index(
+        "ix_available_slots_open",
+        "available_slots",
+        ["date", "start_time", "provider_id"],
+        unique=False,
+        postgresql_where=sa.text("is_available"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_available_slots_open", table_name="available_slots")
+    op.drop_column("available_slots", "booked_count")
+    op.drop_index(op.f("ix_providers_provider_type"), table_name="providers")
+    op.drop_index(op.f("ix_providers_geo_cell"), table_name="providers")
+    op.drop_column("providers", "geo_cell")
+    op.drop_column("providers", "longitude")
+    op.drop_column("providers", "latitude")
+    op.drop_column("owners", "longitude")
+    op.drop_column("owners", "latitude")
@@ -0,0 +1,66 @@
+"""indexes for foreign-key lookup paths
+
+Revision ID: 8f41a6d2c7e3
+Revises: 3d9b2c4e8f10
+Create Date: 2026-10-18 12:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8f41a6d2c7e3"
+down_revision: Union[str, None] = "3d9b2c4e8f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# bookings.slot_id, bookings.pet_id, provider_services.provider_id and
+# provider_documents.provider_id already lead a unique constraint index.
+INDEXES = (
+    ("ix_pets_owner_id", "pets", ["owner_id"], {}),
+    ("ix_medical_records_pet_date", "medical_records", ["pet_id", "date"], {}),
+    (
+        "ix_provider_services_service_id",
+        "provider_services",
+        ["service_id"],
+        {},
+    ),
+    ("ix_bookings_service_id", "bookings", ["service_id"], {}),
+    (
+        "ix_bookings_active_slot_status",
+        "bookings",
+        ["slot_id", "status"],
+        {"postgresql_where": sa.text("status <> 'completed'")},
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built without locking writes on live tables.
+    with op.get_context().autocommit_block():
+        for name, table, columns, kw in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kw,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,257 @@
+"""initial schema
+
+Revision ID: a1c3e5f70b21
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70b21"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENUMS = (
+    "usertype",
+    "providertype",
+    "animaltype",
+    "recordtype",
+    "documenttype",
+    "documentstatus",
+    "bookingstatus",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "services",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column(
+            "base_price", sa.Numeric(precision=10, scale=2), nullable=True
+        ),
+        sa.Column("duration_min", sa.Integer(), nullable=True),
+        sa.Column(
+            "service_type",
+            sa.Enum("vet", "groomer", "sitter", name="providertype"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=120), nullable=False),
+        sa.Column("password_hash", sa.String(length=128), nullable=False),
+        sa.Column("first_name", sa.String(length=80), nullable=True),
+        sa.Column("surname", sa.String(length=80), nullable=True),
+        sa.Column("patronymic", sa.String(length=80), nullable=True),
+        sa.Column(
+            "role",
+            sa.Enum("user", "owner", "provider", "admin", name="usertype"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_table(
+        "grooming_services",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tools_required", sa.String(length=200), nullable=True),
+        sa.Column("coat_type", sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(["id"], ["services.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "owners",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("phone", sa.String(length=20), nullable=True),
+        sa.Column("address", sa.String(length=200), nullable=True),
+        sa.ForeignKeyConstraint(["id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("phone"),
+    )
+    op.create_table(
+        "providers",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("company_name", sa.String(length=100), nullable=True),
+        sa.Column(
+            "provider_type",
+            sa.Enum("vet", "groomer", "sitter", name="providertype"),
+            nullable=False,
+        ),
+        sa.Column("service_radius_km", sa.Integer(), nullable=True),
+        sa.Column("hourly_rate", sa.Float(precision=2), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "sitting_services",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("max_pets", sa.Integer(), nullable=True),
+        sa.Column("overnight_available", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(["id"], ["services.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "veterinary_services",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("animal_type", sa.String(length=50), nullable=True),
+        sa.Column("emergency_available", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(["id"], ["services.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "available_slots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("provider_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        sa.Column("is_available", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["provider_id"], ["providers.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "provider_id", "date", "start_time", name="uq_slot_provider_time"
+        ),
+    )
+    op.create_table(
+        "pets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column(
+            "animal_type",
+            sa.Enum("dog", "cat", name="animaltype"),
+            nullable=False,
+        ),
+        sa.Column("breed", sa.String(length=50), nullable=True),
+        sa.Column("birth_date", sa.Date(), nullable=True),
+        sa.Column("medical_notes", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["owner_id"], ["owners.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "provider_documents",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("provider_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "document_type",
+            sa.Enum("license", "certificate", name="documenttype"),
+            nullable=False,
+        ),
+        sa.Column("file_url", sa.String(length=200), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "approved", "rejected", name="documentstatus"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["provider_id"], ["providers.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "provider_id", "document_type", name="uq_provider_doc_type"
+        ),
+    )
+    op.create_table(
+        "provider_services",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("provider_id", sa.Integer(), nullable=False),
+        sa.Column("service_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "custom_price", sa.Numeric(precision=10, scale=2), nullable=False
+        ),
+        sa.Column("custom_duration", sa.Integer(), nullable=False),
+        sa.Column("extra_info", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["provider_id"], ["providers.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["service_id"], ["services.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "provider_id", "service_id", name="uq_provider_service"
+        ),
+    )
+    op.create_table(
+        "bookings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("pet_id", sa.Integer(), nullable=False),
+        sa.Column("slot_id", sa.Integer(), nullable=True),
+        sa.Column("service_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "confirmed", "completed", name="bookingstatus"),
+            nullable=True,
+        ),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["pet_id"],
+            ["pets.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["service_id"],
+            ["services.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["slot_id"],
+            ["available_slots.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "pet_id",
+            "slot_id",
+            "service_id",
+            name="uq_booking_pet_slot_service",
+        ),
+        sa.UniqueConstraint("slot_id", "pet_id", name="uq_booking_slot_pet"),
+    )
+    op.create_table(
+        "medical_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("pet_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "record_type",
+            sa.Enum("vaccine", "diagnosis", "allergy", name="recordtype"),
+            nullable=False,
+        ),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("date", sa.DateTime(), nullable=True),
+        sa.Column("document_url", sa.String(length=200), nullable=True),
+        sa.ForeignKeyConstraint(["pet_id"], ["pets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("medical_records")
+    op.drop_table("bookings")
+    op.drop_table("provider_services")
+    op.drop_table("provider_documents")
+    op.drop_table("pets")
+    op.drop_table("available_slots")
+    op.drop_table("veterinary_services")
+    op.drop_table("sitting_services")
+    op.drop_table("providers")
+    op.drop_table("owners")
+    op.drop_table("grooming_services")
+    op.drop_table("users")
+    op.drop_table("services")
+    for name in ENUMS:
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
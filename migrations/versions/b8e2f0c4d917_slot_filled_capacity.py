@@ -0,0 +1,48 @@
+"""slot filled capacity
+
+Revision ID: b8e2f0c4d917
+Revises: e7d4a91c3b58
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e2f0c4d917"
+down_revision: Union[str, None] = "e7d4a91c3b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "available_slots",
+        sa.Column("filled_capacity", sa.Integer(), nullable=True),
+    )
+    # Databases migrated before 3d9b2c4e8f10 closed full slots still have
+    # them open; close those and record the capacity of every full slot.
+    op.execute("""
+        UPDATE available_slots
+        SET is_available = false,
+            filled_capacity = booked.capacity
+        FROM (
+            SELECT bookings.slot_id,
+                   max(coalesce(sitting_services.max_pets, 1)) AS capacity
+            FROM bookings
+            LEFT JOIN sitting_services
+                ON sitting_services.id = bookings.service_id
+            GROUP BY bookings.slot_id
+        ) AS booked
+        WHERE booked.slot_id = available_slots.id
+          AND available_slots.booked_count >= booked.capacity
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("available_slots", "filled_capacity")
@@ -0,0 +1,33 @@
+"""refresh-token generation
+
+Revision ID: d3a6f1b8c520
+Revises: b8e2f0c4d917
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a6f1b8c520"
+down_revision: Union[str, None] = "b8e2f0c4d917"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_sessions",
+        sa.Column(
+            "generation", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_sessions", "generation")
@@ -9,10 +9,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from app.main import app
 from app.database.models import Base
 from app.core.settings import settings
+from app.database.connection import create_engine_from_profile
 
 
-engine_test = create_async_engine(
-    settings.test_database_url,
+engine_test = create_engine_from_profile(
+    settings.test_database_url, settings.db_engine_profiles["test"]
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -0,0 +1,208 @@
+import csv
+import io
+import os
+from datetime import date, time
+
+import orjson
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+
+from app.main import app
+from app.api.responses import encode_csv
+from app.core.principal import principal_cache
+from app.core.security import create_access_token
+from app.database.connection import get_db, get_stream_db
+from app.database.models import (
+    AvailableSlot,
+    Booking,
+    GroomingService,
+    MedicalRecord,
+    Owner,
+    Pet,
+    Provider,
+)
+from app.database.types import (
+    AnimalType,
+    ProviderType,
+    RecordType,
+    UserType,
+)
+from app.repositories import MedicalRecordRepo
+
+EXPORT_ROWS = 1_000_000
+RSS_CEILING_MB = 64
+
+
+@pytest.fixture
+async def owner(db_session):
+    owner = Owner(
+        email="export-owner@example.com",
+        password_hash="x",
+        phone="+79990000021",
+        role=UserType.owner,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+
+    pet = Pet(owner_id=owner.id, name="Рекс", animal_type=AnimalType.dog)
+    db_session.add(pet)
+    await db_session.flush()
+    return owner.id, pet.id
+
+
+class StreamSession:
+    """db_session for streaming routes that records close() instead."""
+
+    def __init__(self, session):
+        self._session = session
+        self.closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def stream_session(db_session):
+    return StreamSession(db_session)
+
+
+@pytest.fixture
+async def api(db_session, stream_session):
+    async def _get_db():
+        yield db_session
+
+    async def _get_stream_db():
+        return stream_session
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_stream_db] = _get_stream_db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as c:
+        yield c
+    app.dependency_overrides.clear()
+    principal_cache.clear()
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+@pytest.fixture
+async def records(db_session, owner):
+    owner_id, pet_id = owner
+    db_session.add_all(
+        MedicalRecord(
+            pet_id=pet_id, record_type=RecordType.vaccine, description=str(i)
+        )
+        for i in range(3)
+    )
+    await db_session.flush()
+    token = create_access_token(subject=str(owner_id), role="owner")
+    return pet_id, {"Authorization": f"Bearer {token}"}
+
+
+async def test_medical_export_csv(api, records, stream_session):
+    _, headers = records
+    response = await api.get("/api/v1/pet/medical/export", headers=headers)
+
+    assert response.status_code == 200
+    assert stream_session.closed
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["description"] for row in rows] == ["0", "1", "2"]
+    assert rows[0]["record_type"] == "vaccine"
+
+
+async def test_medical_export_ndjson(api, records):
+    pet_id, headers = records
+    response = await api.get(
+        f"/api/v1/pet/medical/export?format=ndjson&pet_id={pet_id}",
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    lines = response.content.splitlines()
+    assert len(lines) == 3
+    assert orjson.loads(lines[0])["pet_name"] == "Рекс"
+
+
+@pytest.fixture
+async def bookings(db_session, owner):
+    _, pet_id = owner
+    provider = Provider(
+        email="export-groomer@example.com",
+        password_hash="x",
+        company_name="Грум",
+        provider_type=ProviderType.groomer,
+        is_verified=True,
+        role=UserType.provider,
+    )
+    service = GroomingService(name="export-service", base_price=100)
+    db_session.add_all([provider, service])
+    await db_session.flush()
+
+    slots = [
+        AvailableSlot(
+            provider_id=provider.id,
+            date=date(2030, 1, day),
+            start_time=time(9),
+            end_time=time(10),
+        )
+        for day in (1, 2)
+    ]
+    db_session.add_all(slots)
+    await db_session.flush()
+    db_session.add_all(
+        Booking(pet_id=pet_id, slot_id=slot.id, service_id=service.id)
+        for slot in slots
+    )
+    await db_session.flush()
+    token = create_access_token(subject=str(provider.id), role="provider")
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_provider_booking_export_streams_and_closes(
+    api, bookings, stream_session
+):
+    response = await api.get(
+        "/api/v1/booking/provider/export?format=ndjson", headers=bookings
+    )
+
+    assert response.status_code == 200
+    rows = [orjson.loads(line) for line in response.content.splitlines()]
+    assert [row["date"] for row in rows] == ["2030-01-01", "2030-01-02"]
+    assert rows[0]["service_name"] == "export-service"
+    assert stream_session.closed
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/statm"), reason="needs /proc"
+)
+async def test_million_row_export_keeps_memory_flat(db_session, owner):
+    owner_id, pet_id = owner
+    await db_session.execute(
+        text(
+            "INSERT INTO medical_records (pet_id, record_type, description, date) "
+            "SELECT :pet_id, 'vaccine', 'record ' || n, "
+            "now() - n * interval '1 minute' "
+            "FROM generate_series(1, :rows) AS n"
+        ),
+        {"pet_id": pet_id, "rows": EXPORT_ROWS},
+    )
+
+    chunks = MedicalRecordRepo(db_session).stream_history(owner_id)
+    baseline = peak = _rss_mb()
+    size = 0
+    async for chunk in encode_csv(chunks):
+        size += chunk.count(b"\n")
+        peak = max(peak, _rss_mb())
+
+    assert size == EXPORT_ROWS + 1
+    assert peak - baseline < RSS_CEILING_MB
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.settings import settings
+from app.database.models import Job, Provider, ProviderService
+from app.database.types import JobStatus, ProviderType, UserType
+from app.repositories import JobRepository, ServiceRepository
+from app.schemas import GroomingServiceCreate
+from app.services import ServiceService
+from app.services.service_service import PS_FANOUT_JOB
+
+
+@pytest.fixture
+def jobs(db_session):
+    return JobRepository(db_session)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent(jobs, db_session):
+    assert await jobs.enqueue("test.job", {"n": 1}, idempotency_key="k")
+    assert not await jobs.enqueue("test.job", {"n": 2}, idempotency_key="k")
+    assert await jobs.enqueue("test.job", {"n": 3})
+
+    payloads = await db_session.scalars(select(Job.payload).order_by(Job.id))
+    assert payloads.all() == [{"n": 1}, {"n": 3}]
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_due_jobs_once(jobs):
+    now = datetime.utcnow()
+    await jobs.enqueue("test.job", {"n": 1}, run_at=now - timedelta(seconds=1))
+    await jobs.enqueue("test.job", {"n": 2}, run_at=now + timedelta(hours=1))
+
+    claimed = await jobs.claim("w1", 10, now)
+
+    assert [job.payload for job in claimed] == [{"n": 1}]
+    assert claimed[0].attempts == 1
+    assert await jobs.claim("w2", 10, now) == []
+
+
+@pytest.mark.asyncio
+async def test_stale_jobs_are_requeued_or_failed(jobs, db_session):
+    now = datetime.utcnow()
+    await jobs.enqueue("test.job", {"n": 1}, run_at=now)
+    await jobs.enqueue("test.job", {"n": 2}, run_at=now, max_attempts=1)
+    await jobs.claim("crashed", 10, now)
+
+    assert await jobs.requeue_stale(now + timedelta(seconds=1)) == 2
+
+    rows = await db_session.execute(
+        select(Job.payload, Job.status).order_by(Job.id)
+    )
+    assert rows.all() == [
+        ({"n": 1}, JobStatus.queued),
+        ({"n": 2}, JobStatus.failed),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_job_from_requeue(jobs, db_session):
+    now = datetime.utcnow()
+    await jobs.enqueue("test.job", {"n": 1}, run_at=now)
+    [job] = await jobs.claim("w1", 10, now)
+    later = now + timedelta(minutes=10)
+
+    assert not await jobs.heartbeat(job.id, "w2", later)
+    assert await jobs.heartbeat(job.id, "w1", later)
+
+    assert await jobs.requeue_stale(later - timedelta(seconds=1)) == 0
+    assert await db_session.scalar(select(Job.locked_at)) == later
+
+
+@pytest.mark.asyncio
+async def test_large_fan_out_is_enqueued_with_service(
+    db_session, jobs, monkeypatch
+):
+    monkeypatch.setattr(settings, "ps_fanout_background_threshold", 0)
+    db_session.add(
+        Provider(
+            email="groomer@example.com",
+            password_hash="x",
+            company_name="Грум",
+            provider_type=ProviderType.groomer,
+            hourly_rate=10,
+            role=UserType.provider,
+        )
+    )
+    await db_session.flush()
+    service = ServiceService(
+        repository=ServiceRepository(db_session), jobs=jobs
+    )
+
+    created = await service.create_grooming_service(
+        GroomingServiceCreate(
+            name="Стрижка",
+            base_price=100,
+            duration_min=30,
+            tools_required="ножницы",
+            coat_type="любая",
+        )
+    )
+
+    job = await db_session.scalar(select(Job))
+    assert job.kind == PS_FANOUT_JOB
+    assert job.idempotency_key == f"{PS_FANOUT_JOB}:{created.id}"
+    assert job.payload == {"provider_type": "groomer", "service_id": created.id}
+    assert (
+        await db_session.scalar(
+            select(func.count()).select_from(ProviderService)
+        )
+        == 0
+    )
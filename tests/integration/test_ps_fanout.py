@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.settings import settings
+from app.database.models import GroomingService, Provider, ProviderService
+from app.database.types import ProviderType, UserType
+from app.repositories import JobRepository, ServiceRepository
+from app.schemas import GroomingServiceCreate
+from app.services import ServiceService
+
+# A cartesian product in the fan-out SELECT shows up as an SAWarning
+pytestmark = pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+
+
+@pytest.fixture
+async def providers(db_session):
+    providers = [
+        Provider(
+            email=f"{kind.value}-{i}@example.com",
+            password_hash="x",
+            company_name="Компания",
+            provider_type=kind,
+            hourly_rate=10,
+            role=UserType.provider,
+        )
+        for i, kind in enumerate(
+            [ProviderType.groomer, ProviderType.groomer, ProviderType.vet]
+        )
+    ]
+    db_session.add_all(providers)
+    await db_session.flush()
+    return providers
+
+
+@pytest.fixture
+async def grooming(db_session):
+    service = GroomingService(
+        name="Стрижка",
+        base_price=100,
+        duration_min=30,
+        service_type=ProviderType.groomer,
+    )
+    db_session.add(service)
+    await db_session.flush()
+    return service
+
+
+async def count_ps(db_session) -> int:
+    return await db_session.scalar(
+        select(func.count()).select_from(ProviderService)
+    )
+
+
+@pytest.mark.asyncio
+async def test_fan_out_reaches_providers_of_the_type_once(
+    db_session, providers, grooming
+):
+    repo = ServiceRepository(db_session)
+
+    assert (
+        await repo.create_ps_for_service(ProviderType.groomer, grooming.id) == 2
+    )
+    assert (
+        await repo.create_ps_for_service(ProviderType.groomer, grooming.id) == 0
+    )
+
+    rows = await db_session.execute(
+        select(ProviderService.custom_price, ProviderService.custom_duration)
+    )
+    assert rows.all() == [(100, 30), (100, 30)]
+
+
+@pytest.mark.asyncio
+async def test_owner_fan_out_skips_existing_links(
+    db_session, providers, grooming
+):
+    repo = ServiceRepository(db_session)
+    groomer = providers[0]
+
+    assert await repo.create_ps_for_owner(groomer.id, ProviderType.groomer) == 1
+    assert await repo.create_ps_for_owner(groomer.id, ProviderType.groomer) == 0
+    assert await count_ps(db_session) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold, inline", [(10, True), (1, False)])
+async def test_threshold_switches_fan_out_to_queue(
+    db_session, providers, monkeypatch, threshold, inline
+):
+    monkeypatch.setattr(settings, "ps_fanout_background_threshold", threshold)
+    service = ServiceService(
+        repository=ServiceRepository(db_session),
+        jobs=JobRepository(db_session),
+    )
+
+    await service.create_grooming_service(
+        GroomingServiceCreate(
+            name="Стрижка",
+            base_price=100,
+            duration_min=30,
+            tools_required="ножницы",
+            coat_type="любая",
+        )
+    )
+
+    assert await count_ps(db_session) == (2 if inline else 0)
+    stats = await JobRepository(db_session).stats(datetime.utcnow())
+    assert stats["queued"] == (0 if inline else 1)
@@ -0,0 +1,328 @@
+from datetime import date, time
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from app.main import app
+from app.core.principal import principal_cache
+from app.core.response_cache import response_cache
+from app.core.security import create_access_token
+from app.core.sessions import session_cache
+from app.database.connection import get_db
+from app.database.models import (
+    Owner,
+    Provider,
+    Pet,
+    MedicalRecord,
+    GroomingService,
+    ProviderService,
+    AvailableSlot,
+    Booking,
+)
+from app.repositories import SessionRepository
+from app.services import SessionService
+from app.database.types import (
+    UserType,
+    ProviderType,
+    AnimalType,
+    RecordType,
+)
+
+
+@pytest.fixture
+async def api(db_session):
+    async def _get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = _get_db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as c:
+        yield c
+    app.dependency_overrides.clear()
+    principal_cache.clear()
+    response_cache.clear()
+    session_cache.clear()
+
+
+@pytest.fixture
+def queries(db_session):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+async def data(db_session):
+    owner = Owner(
+        email="owner@example.com",
+        password_hash="x",
+        first_name="Анна",
+        surname="Петрова",
+        phone="+79990000001",
+        role=UserType.owner,
+    )
+    provider = Provider(
+        email="groomer@example.com",
+        password_hash="x",
+        first_name="Олег",
+        surname="Смирнов",
+        company_name="Грум",
+        provider_type=ProviderType.groomer,
+        hourly_rate=10,
+        is_verified=True,
+        role=UserType.provider,
+    )
+    db_session.add_all([owner, provider])
+    await db_session.flush()
+
+    pets = []
+    for i in range(3):
+        pet = Pet(
+            owner_id=owner.id, name=f"pet-{i}", animal_type=AnimalType.dog
+        )
+        db_session.add(pet)
+        await db_session.flush()
+        pets.append(pet)
+        db_session.add_all(
+            MedicalRecord(
+                pet_id=pet.id,
+                record_type=RecordType.vaccine,
+                description="ok",
+            )
+            for _ in range(4)
+        )
+
+    for i in range(3):
+        service = GroomingService(
+            name=f"service-{i}",
+            base_price=100,
+            duration_min=30,
+            service_type=ProviderType.groomer,
+        )
+        db_session.add(service)
+        await db_session.flush()
+        db_session.add(
+            ProviderService(
+                provider_id=provider.id,
+                service_id=service.id,
+                custom_price=100,
+                custom_duration=30,
+            )
+        )
+
+    slots = [
+        AvailableSlot(
+            provider_id=provider.id,
+            date=date(2030, 1, 1 + i),
+            start_time=time(9),
+            end_time=time(10),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(slots)
+    await db_session.flush()
+
+    db_session.add_all(
+        Booking(pet_id=pet.id, slot_id=slot.id, service_id=service.id)
+        for pet, slot in zip(pets, slots)
+    )
+    await db_session.flush()
+
+    return {
+        "provider_id": provider.id,
+        "pet_id": pets[0].id,
+        "owner": _auth(owner.id, UserType.owner),
+        "provider": _auth(provider.id, UserType.provider),
+    }
+
+
+def _auth(user_id: int, role: UserType) -> dict:
+    token = create_access_token(subject=str(user_id), role=role.value)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.parametrize(
+    "method, url, who, expected",
+    [
+        ("GET", "/api/v1/auth/profile", "owner", 0),
+        ("POST", "/api/v1/pet/list_pets", "owner", 2),
+        ("GET", "/api/v1/pet/list_pets?limit=2", "owner", 1),
+        ("GET", "/api/v1/pet/list_pets?limit=2&summary=true", "owner", 2),
+        ("GET", "/api/v1/pet/{pet_id}/medical?limit=2", "owner", 2),
+        ("GET", "/api/v1/service/get/{provider_id}", None, 0),
+        ("POST", "/api/v1/slot/list", "provider", 2),
+        ("GET", "/api/v1/slot/list?limit=2", "provider", 2),
+        ("GET", "/api/v1/booking/provider/feed?limit=2", "provider", 2),
+        ("GET", "/api/v1/booking/provider/stats", "provider", 1),
+        ("GET", "/api/v1/booking/owner/timeline?limit=2", "owner", 3),
+    ],
+)
+async def test_endpoint_query_count(
+    api, queries, data, method, url, who, expected
+):
+    headers = data[who] if who else {}
+    url = url.format(provider_id=data["provider_id"], pet_id=data["pet_id"])
+
+    warmup = await api.request(method, url, headers=headers)
+    assert warmup.status_code == 200
+
+    queries.clear()
+    response = await api.request(method, url, headers=headers)
+
+    assert response.status_code == 200
+    assert len(queries) == expected, queries
+
+
+async def test_service_list_not_modified(api, queries, data):
+    url = f"/api/v1/service/get/{data['provider_id']}"
+    first = await api.get(url)
+    etag = first.headers["etag"]
+
+    queries.clear()
+    response = await api.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert queries == []
+
+
+@pytest.mark.parametrize(
+    "url, who",
+    [
+        ("/api/v1/service/get/{provider_id}", None),
+        ("/api/v1/booking/provider/feed", "provider"),
+        ("/api/v1/booking/owner/timeline", "owner"),
+    ],
+)
+async def test_service_listings_skip_subtype_tables(
+    api, queries, data, url, who
+):
+    headers = data[who] if who else {}
+    queries.clear()
+    response = await api.get(
+        url.format(provider_id=data["provider_id"]), headers=headers
+    )
+
+    assert response.status_code == 200
+    assert queries
+    subtype_tables = (
+        "veterinary_services",
+        "grooming_services",
+        "sitting_services",
+    )
+    assert not [
+        q for q in queries if any(table in q for table in subtype_tables)
+    ]
+
+
+async def test_slot_schedule_is_one_insert(api, queries, data):
+    schedule = {
+        "weekdays": [0, 1, 2, 3, 4],
+        "start_time": "09:00",
+        "end_time": "17:00",
+        "slot_minutes": 30,
+        "date_from": "2030-01-01",
+        "weeks": 2,
+    }
+
+    queries.clear()
+    response = await api.post(
+        "/api/v1/slot/create/schedule", json=schedule, headers=data["provider"]
+    )
+
+    assert response.status_code == 200
+    # The fixture already has 09:00 slots on 2030-01-01..04 (Tue-Fri).
+    assert response.json() == {
+        "requested": 160,
+        "created": 156,
+        "skipped": 4,
+        "date_from": "2030-01-01",
+        "date_to": "2030-01-14",
+    }
+    assert len([q for q in queries if q.startswith("INSERT")]) == 1
+
+
+async def test_pet_page_summary(api, data):
+    response = await api.get(
+        "/api/v1/pet/list_pets?limit=2&summary=true", headers=data["owner"]
+    )
+
+    page = response.json()
+    assert len(page["items"]) == 2
+    assert page["next_cursor"]
+    summary = page["items"][0]["medical_summary"]
+    assert summary["records_count"] == 4
+    assert [record["record_type"] for record in summary["latest"]] == [
+        "vaccine"
+    ]
+
+    response = await api.get(
+        f"/api/v1/pet/list_pets?limit=2&cursor={page['next_cursor']}",
+        headers=data["owner"],
+    )
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["items"][0]["medical_summary"] is None
+    assert page["next_cursor"] is None
+
+
+async def test_pet_page_backward_and_total(api, data):
+    first = (
+        await api.get(
+            "/api/v1/pet/list_pets?limit=1&with_total=true",
+            headers=data["owner"],
+        )
+    ).json()
+    assert first["prev_cursor"] is None
+    assert isinstance(first["total_estimate"], int)
+
+    second = (
+        await api.get(
+            f"/api/v1/pet/list_pets?limit=1&cursor={first['next_cursor']}",
+            headers=data["owner"],
+        )
+    ).json()
+    assert second["items"][0]["id"] > first["items"][0]["id"]
+    assert second["total_estimate"] is None
+
+    back = (
+        await api.get(
+            f"/api/v1/pet/list_pets?limit=1&cursor={second['prev_cursor']}",
+            headers=data["owner"],
+        )
+    ).json()
+    assert back["items"] == first["items"]
+    assert back["prev_cursor"] is None
+    assert back["next_cursor"]
+
+
+async def test_refresh_is_one_query(api, data, db_session, queries):
+    provider = await db_session.get(Provider, data["provider_id"])
+    login = await SessionService(
+        repository=SessionRepository(db_session), cache=session_cache
+    ).login(provider, "pytest")
+
+    queries.clear()
+    response = await api.post(
+        "/api/v1/auth/refresh", json={"refresh_token": login.refresh_token}
+    )
+
+    assert response.status_code == 200
+    assert len(queries) == 1
+    token = response.json()
+    assert token["role"] == "provider"
+    assert token["refresh_token"] != login.refresh_token
+
+    response = await api.get(
+        "/api/v1/auth/sessions",
+        headers={"Authorization": f"Bearer {token['access_token']}"},
+    )
+    assert [s["user_agent"] for s in response.json()] == ["pytest"]
@@ -0,0 +1,197 @@
+from datetime import date, datetime, time
+
+import pytest
+from sqlalchemy import event
+
+from app.database.models import (
+    Owner,
+    Provider,
+    Pet,
+    MedicalRecord,
+    GroomingService,
+    ProviderService,
+    AvailableSlot,
+    Booking,
+)
+from app.database.types import (
+    UserType,
+    ProviderType,
+    AnimalType,
+    RecordType,
+)
+from app.repositories import (
+    BookingRepository,
+    MedicalRecordRepo,
+    PetRepository,
+    ServiceRepository,
+    SlotRepository,
+    UserRepository,
+)
+
+
+@pytest.fixture
+async def data(db_session):
+    owner = Owner(
+        email="plan-owner@example.com",
+        password_hash="x",
+        phone="+79990000011",
+        role=UserType.owner,
+    )
+    provider = Provider(
+        email="plan-groomer@example.com",
+        password_hash="x",
+        company_name="Грум",
+        provider_type=ProviderType.groomer,
+        is_verified=True,
+        role=UserType.provider,
+    )
+    service = GroomingService(name="plan-service", base_price=100)
+    db_session.add_all([owner, provider, service])
+    await db_session.flush()
+
+    pet = Pet(owner_id=owner.id, name="Рекс", animal_type=AnimalType.dog)
+    slot = AvailableSlot(
+        provider_id=provider.id,
+        date=date(2030, 1, 1),
+        start_time=time(9),
+        end_time=time(10),
+    )
+    db_session.add_all(
+        [
+            pet,
+            slot,
+            ProviderService(
+                provider_id=provider.id,
+                service_id=service.id,
+                custom_price=100,
+                custom_duration=30,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    record = MedicalRecord(
+        pet_id=pet.id, record_type=RecordType.vaccine, description="ok"
+    )
+    db_session.add_all(
+        [
+            record,
+            Booking(pet_id=pet.id, slot_id=slot.id, service_id=service.id),
+        ]
+    )
+    await db_session.flush()
+    db_session.expunge_all()
+
+    return {
+        "owner_id": owner.id,
+        "provider_id": provider.id,
+        "pet_id": pet.id,
+        "record_id": record.id,
+        "email": owner.email,
+    }
+
+
+@pytest.fixture
+def statements(db_session):
+    captured = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield captured
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def explain(db_session, statement: str, parameters) -> str:
+    # Tiny test tables would always be seq-scanned; with seq scans priced
+    # out, a "Seq Scan" left in the plan means no index can serve the query.
+    conn = await db_session.connection()
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    result = await conn.exec_driver_sql("EXPLAIN " + statement, parameters)
+    return "\n".join(row[0] for row in result)
+
+
+@pytest.mark.parametrize(
+    "call, index",
+    [
+        (
+            lambda db, d: PetRepository(db).list(d["owner_id"]),
+            "ix_pets_owner_id",
+        ),
+        (
+            lambda db, d: PetRepository(db).list_page(d["owner_id"]),
+            "ix_pets_owner_id",
+        ),
+        (
+            lambda db, d: PetRepository(db).medical_summary([d["pet_id"]]),
+            "ix_medical_records_pet_date",
+        ),
+        (
+            lambda db, d: MedicalRecordRepo(db).list_page(d["pet_id"]),
+            "ix_medical_records_pet_date",
+        ),
+        (
+            lambda db, d: PetRepository(db).get_by_id(d["pet_id"]),
+            "ix_medical_records_pet_date",
+        ),
+        (
+            lambda db, d: MedicalRecordRepo(db).get_pet_by_id(d["record_id"]),
+            "ix_medical_records_pet_date",
+        ),
+        (
+            lambda db, d: ServiceRepository(db).list_by_provider(
+                d["provider_id"]
+            ),
+            "uq_provider_service",
+        ),
+        (
+            lambda db, d: ServiceRepository(db).list_page(d["provider_id"]),
+            "uq_provider_service",
+        ),
+        (
+            lambda db, d: BookingRepository(db).list(d["provider_id"]),
+            "uq_booking_slot_pet",
+        ),
+        (
+            lambda db, d: BookingRepository(db).provider_feed(d["provider_id"]),
+            "uq_booking_slot_pet",
+        ),
+        (
+            lambda db, d: BookingRepository(db).provider_stats(
+                d["provider_id"]
+            ),
+            "uq_provider_service",
+        ),
+        (
+            lambda db, d: BookingRepository(db).owner_timeline(
+                d["owner_id"], datetime(2029, 1, 1)
+            ),
+            "ix_pets_owner_id",
+        ),
+        (
+            lambda db, d: SlotRepository(db).list_page(d["provider_id"]),
+            "uq_slot_provider_time",
+        ),
+        (
+            lambda db, d: UserRepository(db).get_by_email(d["email"]),
+            "users_email_key",
+        ),
+    ],
+)
+async def test_repository_queries_use_indexes(
+    db_session, data, statements, call, index
+):
+    await call(db_session, data)
+    executed = list(statements)
+    assert executed
+
+    plans = [
+        await explain(db_session, statement, parameters)
+        for statement, parameters in executed
+    ]
+
+    for plan in plans:
+        assert "Seq Scan" not in plan, plan
+    assert any(index in plan for plan in plans), plans
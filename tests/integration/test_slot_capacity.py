@@ -0,0 +1,126 @@
+from datetime import date, time
+
+import pytest
+
+from fastapi import HTTPException
+
+from app.database.models import (
+    AvailableSlot,
+    Booking,
+    Owner,
+    Pet,
+    Provider,
+    ProviderService,
+    SittingService,
+)
+from app.database.types import ProviderType, UserType
+from app.repositories import BookingRepository, SlotRepository
+from app.services import BookingService
+
+
+@pytest.fixture
+async def sitter(db_session):
+    provider = Provider(
+        email="sitter@example.com",
+        password_hash="x",
+        company_name="Передержка",
+        provider_type=ProviderType.sitter,
+        hourly_rate=10,
+        role=UserType.provider,
+    )
+    services = [
+        SittingService(
+            name=f"Передержка на {pets}",
+            base_price=100,
+            duration_min=60,
+            max_pets=pets,
+            service_type=ProviderType.sitter,
+        )
+        for pets in (3, 2)
+    ]
+    db_session.add_all([provider, *services])
+    await db_session.flush()
+    db_session.add_all(
+        ProviderService(
+            provider_id=provider.id,
+            service_id=service.id,
+            custom_price=100,
+            custom_duration=60,
+        )
+        for service in services
+    )
+    slot = AvailableSlot(
+        provider_id=provider.id,
+        date=date(2030, 1, 1),
+        start_time=time(9),
+        end_time=time(10),
+    )
+    db_session.add(slot)
+    await db_session.flush()
+    return slot, services
+
+
+@pytest.mark.asyncio
+async def test_slot_reopens_when_any_booking_is_cancelled(db_session, sitter):
+    slot, (roomy, small) = sitter
+    repo = SlotRepository(db_session)
+
+    assert await repo.reserve(slot.id, roomy.id)
+    assert await repo.reserve(slot.id, small.id)
+    await db_session.refresh(slot)
+    assert (slot.booked_count, slot.is_available) == (2, False)
+    assert slot.filled_capacity == 2
+
+    await repo.release(slot.id)
+    await db_session.refresh(slot)
+
+    assert (slot.booked_count, slot.is_available) == (1, True)
+    assert slot.filled_capacity is None
+    assert await repo.reserve(slot.id, small.id)
+
+
+@pytest.mark.asyncio
+async def test_release_keeps_slot_closed_by_hand(db_session, sitter):
+    slot, (roomy, _) = sitter
+    repo = SlotRepository(db_session)
+    assert await repo.reserve(slot.id, roomy.id)
+    slot.is_available = False
+    await db_session.flush()
+
+    await repo.release(slot.id)
+    await db_session.refresh(slot)
+
+    assert (slot.booked_count, slot.is_available) == (0, False)
+
+
+@pytest.mark.asyncio
+async def test_cancel_frees_capacity_once(db_session, sitter):
+    slot, (roomy, _) = sitter
+    owner = Owner(
+        email="owner@example.com", password_hash="x", role=UserType.owner
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    pet = Pet(owner_id=owner.id, name="Барсик", animal_type="cat")
+    db_session.add(pet)
+    await db_session.flush()
+    assert await SlotRepository(db_session).reserve(slot.id, roomy.id)
+    booking = Booking(pet_id=pet.id, slot_id=slot.id, service_id=roomy.id)
+    db_session.add(booking)
+    await db_session.flush()
+    service = BookingService(
+        repository=BookingRepository(db_session),
+        slot_repository=SlotRepository(db_session),
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await service.delete_booking(booking.id, user_id=owner.id + 100)
+    assert exc.value.status_code == 403
+
+    await service.delete_booking(booking.id, user_id=owner.id)
+    with pytest.raises(HTTPException) as exc:
+        await service.delete_booking(booking.id, user_id=owner.id)
+    assert exc.value.detail == "Бронирование не найдено"
+
+    await db_session.refresh(slot)
+    assert slot.booked_count == 0
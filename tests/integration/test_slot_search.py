@@ -0,0 +1,78 @@
+from datetime import date, time
+
+import pytest
+
+from app.database.models import (
+    AvailableSlot,
+    GroomingService,
+    Provider,
+    ProviderService,
+)
+from app.database.types import ProviderType, UserType
+from app.repositories import SlotRepository
+
+DAY = date(2031, 3, 1)
+
+
+@pytest.fixture
+async def groomers(db_session):
+    providers = [
+        Provider(
+            email=f"search-{n}@example.com",
+            password_hash="x",
+            company_name=f"Грумер {n}",
+            provider_type=ProviderType.groomer,
+            is_verified=True,
+            role=UserType.provider,
+        )
+        for n in range(3)
+    ]
+    services = [
+        GroomingService(name=f"search-service-{n}", base_price=100)
+        for n in range(2)
+    ]
+    db_session.add_all([*providers, *services])
+    await db_session.flush()
+
+    prices = {
+        providers[0]: [900, 200],
+        providers[1]: [300],
+        providers[2]: [5000],
+    }
+    for provider, provider_prices in prices.items():
+        db_session.add_all(
+            ProviderService(
+                provider_id=provider.id,
+                service_id=service.id,
+                custom_price=price,
+                custom_duration=30,
+            )
+            for service, price in zip(services, provider_prices)
+        )
+        db_session.add(
+            AvailableSlot(
+                provider_id=provider.id,
+                date=DAY,
+                start_time=time(9),
+                end_time=time(10),
+            )
+        )
+    await db_session.flush()
+    return providers
+
+
+@pytest.mark.asyncio
+async def test_search_reports_cheapest_matching_price(db_session, groomers):
+    rows = await SlotRepository(db_session).search_available(
+        provider_type=ProviderType.groomer,
+        date_from=DAY,
+        date_to=DAY,
+        max_price=1000,
+    )
+
+    found = {row.provider_id: row.min_price for row in rows}
+    assert found == {groomers[0].id: 200, groomers[1].id: 300}
+    assert [row.provider_id for row in rows] == [
+        groomers[0].id,
+        groomers[1].id,
+    ]
@@ -0,0 +1,238 @@
+import base64
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.database.metrics import (
+    RequestDBStats,
+    request_db_stats,
+    _on_begin,
+    _on_cursor_execute,
+)
+from app.database.models import Pet
+from app.repositories import PetRepository, ServiceRepository
+from app.repositories.base_repo import _Explain, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def db():
+    session = MagicMock()
+    session.flush = AsyncMock()
+    session.refresh = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_flushes_without_commit(db):
+    repo = PetRepository(db)
+    pet = Pet(owner_id=1, name="Барсик", animal_type="cat")
+
+    result = await repo.create(pet)
+
+    db.add.assert_called_once_with(pet)
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+    db.refresh.assert_not_awaited()
+    assert result.medical_records == []
+
+
+@pytest.mark.asyncio
+async def test_create_loads_requested_relationships(db):
+    repo = PetRepository(db)
+    pet = Pet(owner_id=1, name="Барсик", animal_type="cat")
+
+    await repo.create(pet, load=("owner",))
+
+    db.refresh.assert_awaited_once_with(pet, attribute_names=["owner"])
+
+
+@pytest.mark.asyncio
+async def test_update_flushes_without_commit(db):
+    repo = PetRepository(db)
+    pet = Pet(id=1, owner_id=1, name="Old", animal_type="cat")
+
+    await repo.update(pet, {"name": "New"})
+
+    assert pet.name == "New"
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+def test_insert_ignore_uses_on_conflict(db):
+    db.get_bind.return_value.dialect.name = "postgresql"
+    repo = ServiceRepository(db)
+
+    stmt = repo._insert_ignore(("provider_id", "service_id"))
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (provider_id, service_id) DO NOTHING" in sql
+    assert sql.startswith("INSERT INTO provider_services")
+
+
+def test_insert_ignore_rejects_other_dialects(db):
+    db.get_bind.return_value.dialect.name = "mysql"
+
+    with pytest.raises(NotImplementedError):
+        ServiceRepository(db)._insert_ignore(("provider_id", "service_id"))
+
+
+def returning(db, rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    db.execute = AsyncMock(return_value=result)
+
+
+def executed_sql(db) -> str:
+    statement = db.execute.await_args.args[0]
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def test_cursor_round_trip():
+    token = encode_cursor([5, "2030-01-01"])
+
+    assert "=" not in token
+    assert decode_cursor(token) == (False, ["5", "2030-01-01"])
+    assert decode_cursor(encode_cursor([5], backward=True)) == (True, ["5"])
+
+
+def test_legacy_cursor_pages_forward():
+    token = base64.urlsafe_b64encode(json.dumps(["5"]).encode()).decode()
+
+    assert decode_cursor(token) == (False, ["5"])
+
+
+@pytest.mark.parametrize("token", ["!!!", "bnVsbA", "W10"])
+def test_invalid_cursor_rejected(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+@pytest.mark.asyncio
+async def test_paginate_forward(db):
+    returning(db, [("a", 1), ("b", 2), ("c", 3)])
+
+    page = await PetRepository(db).paginate(select(Pet), (Pet.id,), limit=2)
+
+    assert page.items == ["a", "b"]
+    assert decode_cursor(page.next_cursor) == (False, ["2"])
+    assert page.prev_cursor is None
+    sql = executed_sql(db)
+    assert "ORDER BY pets.id" in sql and "LIMIT 3" in sql
+
+
+@pytest.mark.asyncio
+async def test_paginate_backward(db):
+    # Paging back reads newest-first from the cursor, then flips the rows.
+    returning(db, [("c", 9), ("b", 8), ("a", 7)])
+
+    page = await PetRepository(db).paginate(
+        select(Pet),
+        (Pet.id,),
+        cursor=encode_cursor([10], backward=True),
+        limit=2,
+    )
+
+    assert page.items == ["b", "c"]
+    assert decode_cursor(page.next_cursor) == (False, ["9"])
+    assert decode_cursor(page.prev_cursor) == (True, ["8"])
+    sql = executed_sql(db)
+    assert "(pets.id) < (10)" in sql
+    assert "ORDER BY pets.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_paginate_first_backward_page_has_no_prev(db):
+    returning(db, [("b", 2), ("a", 1)])
+
+    page = await PetRepository(db).paginate(
+        select(Pet),
+        (Pet.id,),
+        cursor=encode_cursor([3], backward=True),
+        limit=2,
+    )
+
+    assert page.items == ["a", "b"]
+    assert page.prev_cursor is None
+    assert decode_cursor(page.next_cursor) == (False, ["2"])
+
+
+@pytest.mark.asyncio
+async def test_paginate_accepts_legacy_cursor(db):
+    returning(db, [])
+    token = base64.urlsafe_b64encode(json.dumps(["4"]).encode()).decode()
+
+    page = await PetRepository(db).paginate(select(Pet), (Pet.id,), token)
+
+    assert page.items == []
+    assert "(pets.id) > (4)" in executed_sql(db)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("values", [[1, 2], ["не число"]])
+async def test_paginate_rejects_mismatched_cursor(db, values):
+    db.execute = AsyncMock()
+
+    with pytest.raises(ValueError):
+        await PetRepository(db).paginate(
+            select(Pet), (Pet.id,), encode_cursor(values)
+        )
+    db.execute.assert_not_awaited()
+
+
+def test_explain_compiles_for_postgres():
+    sql = str(
+        _Explain(select(Pet.id).where(Pet.owner_id == 1)).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT pets.id")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "plan", [[{"Plan": {"Plan Rows": 42}}], '[{"Plan": {"Plan Rows": 42}}]']
+)
+async def test_estimate_count_reads_planner_rows(db, plan):
+    db.get_bind.return_value.dialect.name = "postgresql"
+    result = MagicMock()
+    result.scalar_one.return_value = plan
+    db.execute = AsyncMock(return_value=result)
+
+    assert await PetRepository(db).estimate_count(select(Pet)) == 42
+    assert isinstance(db.execute.await_args.args[0], _Explain)
+
+
+@pytest.mark.asyncio
+async def test_estimate_count_skipped_on_other_dialects(db):
+    db.get_bind.return_value.dialect.name = "sqlite"
+    db.execute = AsyncMock()
+
+    assert await PetRepository(db).estimate_count(select(Pet)) is None
+    db.execute.assert_not_awaited()
+
+
+def test_request_stats_counted_only_inside_request():
+    _on_begin(None)
+
+    stats = RequestDBStats()
+    token = request_db_stats.set(stats)
+    try:
+        _on_begin(None)
+        _on_cursor_execute(None, None, "SELECT 1", {}, None, False)
+        _on_cursor_execute(None, None, "SELECT 1", {}, None, False)
+    finally:
+        request_db_stats.reset(token)
+
+    assert stats.transactions == 1
+    assert stats.statements == 2
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import HTTPException
+
+from app.database.types import BookingStatus
+from app.schemas import BookingCreate
+from app.services import BookingService
+
+
+@pytest.fixture
+def booking_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def slot_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(booking_repo, slot_repo):
+    return BookingService(repository=booking_repo, slot_repository=slot_repo)
+
+
+@pytest.mark.asyncio
+async def test_create_booking_reserves_slot(service, booking_repo, slot_repo):
+    slot_repo.reserve.return_value = True
+    booking_repo.create.return_value = MagicMock(id=7)
+    booking_repo.get_with_details.return_value = "booking"
+
+    result = await service.create_booking(
+        BookingCreate(pet_id=1, slot_id=2, service_id=3)
+    )
+
+    slot_repo.reserve.assert_awaited_once_with(2, 3)
+    booking_repo.get_with_details.assert_awaited_once_with(7)
+    assert result == "booking"
+
+
+@pytest.mark.asyncio
+async def test_create_booking_full_slot(service, booking_repo, slot_repo):
+    slot_repo.reserve.return_value = False
+
+    with pytest.raises(HTTPException) as exc:
+        await service.create_booking(
+            BookingCreate(pet_id=1, slot_id=2, service_id=3)
+        )
+
+    assert exc.value.status_code == 400
+    booking_repo.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_booking_releases_slot(service, booking_repo, slot_repo):
+    booking_repo.cancel.return_value = MagicMock(slot_id=2)
+
+    await service.delete_booking(5, user_id=1)
+
+    booking_repo.cancel.assert_awaited_once_with(5, 1)
+    slot_repo.release.assert_awaited_once_with(2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "booking, status_code",
+    [
+        (None, 400),
+        (MagicMock(status=BookingStatus.completed), 400),
+        (MagicMock(status=BookingStatus.pending), 403),
+    ],
+)
+async def test_booking_not_cancelled_keeps_slot(
+    service, booking_repo, slot_repo, booking, status_code
+):
+    booking_repo.cancel.return_value = None
+    booking_repo.get_by_id.return_value = booking
+
+    with pytest.raises(HTTPException) as exc:
+        await service.delete_booking(5, user_id=1)
+
+    assert exc.value.status_code == status_code
+    slot_repo.release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_provider_feed_bad_cursor(service, booking_repo):
+    booking_repo.provider_feed.side_effect = ValueError("Некорректный курсор")
+
+    with pytest.raises(HTTPException) as exc:
+        await service.provider_feed(1, cursor="zzz")
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from app.core.geo import cell_ranges, grid_cell, haversine_km
+
+
+def _covered(cell: int, ranges: list[tuple[int, int]]) -> bool:
+    return any(start <= cell <= end for start, end in ranges)
+
+
+def test_haversine_known_distance():
+    moscow_to_spb = haversine_km(55.7558, 37.6173, 59.9343, 30.3351)
+    assert moscow_to_spb == pytest.approx(634, abs=5)
+
+
+@pytest.mark.parametrize(
+    "lat, lon, radius",
+    [
+        (55.75, 37.61, 10),
+        (55.75, 37.61, 100),
+        (0.0, 0.0, 50),
+        (64.7, 177.5, 80),
+        (-33.9, -179.95, 30),
+        (89.5, 10.0, 60),
+    ],
+)
+def test_cell_ranges_cover_every_point_in_radius(lat, lon, radius):
+    rng = random.Random(42)
+    ranges = cell_ranges(lat, lon, radius)
+
+    for _ in range(2000):
+        p_lat = lat + rng.uniform(-2, 2)
+        p_lon = lon + rng.uniform(-4, 4)
+        p_lat = max(min(p_lat, 90), -90)
+        p_lon = (p_lon + 180) % 360 - 180
+        if haversine_km(lat, lon, p_lat, p_lon) <= radius:
+            assert _covered(grid_cell(p_lat, p_lon), ranges)
+
+
+def test_grid_cell_encoding_is_stable():
+    # Values are stored in providers.geo_cell; changing them needs a reindex.
+    assert grid_cell(55.75, 37.61) == 5247376
+    assert grid_cell(-33.87, 151.21) == 2022912
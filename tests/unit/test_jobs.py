@@ -0,0 +1,177 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.api.depends import get_job_queue
+from app.core.settings import settings
+from app.database.connection import after_commit
+from app.jobs import Worker, get_handler, job_handler, retry_delay
+
+handled = []
+
+
+@job_handler("test.ok")
+async def ok_handler(db, value: int) -> None:
+    handled.append(value)
+
+
+@job_handler("test.hooked")
+async def hooked_handler(db) -> None:
+    async def hook():
+        handled.append(db.commit.await_count)
+
+    after_commit(db, hook)
+
+
+@job_handler("test.slow")
+async def slow_handler(db, seconds: float) -> None:
+    await asyncio.sleep(seconds)
+
+
+@job_handler("test.broken")
+async def broken_handler(db) -> None:
+    raise RuntimeError("boom")
+
+
+class FakeSession:
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.info = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_job(kind: str, attempts: int = 1, **payload):
+    return SimpleNamespace(
+        id=1, kind=kind, payload=payload, attempts=attempts, max_attempts=3
+    )
+
+
+@pytest.fixture
+def repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def worker(repo):
+    session = FakeSession()
+    return Worker(
+        session_factory=lambda: session,
+        repository_factory=lambda db: repo,
+        worker_id="test-worker",
+    )
+
+
+def test_retry_delay_grows_and_is_capped():
+    delays = [retry_delay(n, 5, 60, jitter=lambda: 1.0) for n in (1, 2, 3, 6)]
+    assert delays == [5, 10, 20, 60]
+    assert retry_delay(3, 5, 60, jitter=lambda: 0.0) == 10
+
+
+def test_duplicate_handler_rejected():
+    with pytest.raises(ValueError):
+        job_handler("test.ok")(broken_handler)
+    assert get_handler("test.ok") is ok_handler
+
+
+@pytest.mark.asyncio
+async def test_successful_job_is_completed(worker, repo):
+    repo.claim.return_value = [make_job("test.ok", value=42)]
+
+    assert await worker.run_once() == 1
+
+    assert handled[-1] == 42
+    repo.complete.assert_awaited_once()
+    assert worker.snapshot()["kinds"]["test.ok"]["done"] == 1
+
+
+@pytest.mark.asyncio
+async def test_after_commit_hooks_run_once_committed(worker, repo):
+    repo.claim.return_value = [make_job("test.hooked")]
+
+    await worker.run_once()
+
+    assert handled[-1] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(worker, repo):
+    repo.claim.return_value = [make_job("test.broken", attempts=2)]
+
+    before = datetime.utcnow()
+    await worker.run_once()
+
+    job_id, worker_id, run_at, error = repo.retry.await_args.args
+    assert (job_id, worker_id) == (1, "test-worker")
+    assert run_at > before
+    assert error == "RuntimeError: boom"
+    repo.fail.assert_not_awaited()
+    assert worker.snapshot()["kinds"]["test.broken"]["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_job_fails_after_last_attempt(worker, repo):
+    repo.claim.return_value = [make_job("test.broken", attempts=3)]
+
+    await worker.run_once()
+
+    repo.fail.assert_awaited_once()
+    repo.retry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unknown_kind_is_retried(worker, repo):
+    repo.claim.return_value = [make_job("test.missing")]
+
+    await worker.run_once()
+
+    assert "LookupError" in repo.retry.await_args.args[3]
+
+
+@pytest.mark.asyncio
+async def test_long_job_keeps_its_lease(worker, repo):
+    worker.lease = timedelta(seconds=0.03)
+    repo.claim.return_value = [make_job("test.slow", seconds=0.1)]
+
+    await worker.run_once()
+
+    assert repo.heartbeat.await_count >= 2
+    assert repo.heartbeat.await_args.args[:2] == (1, "test-worker")
+    repo.complete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_does_not_wait_out_long_jobs(worker, repo):
+    worker.shutdown_timeout = 0.01
+    repo.claim.side_effect = [[make_job("test.slow", seconds=60)], []]
+    stop = asyncio.Event()
+
+    running = asyncio.create_task(worker.run(stop))
+    await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(running, 1)
+
+    # The job keeps its lease and is requeued once it expires.
+    repo.complete.assert_not_awaited()
+    repo.retry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "in_process, external, queued",
+    [(True, False, True), (False, True, True), (False, False, False)],
+)
+async def test_jobs_queued_only_when_a_worker_runs(
+    monkeypatch, in_process, external, queued
+):
+    monkeypatch.setattr(settings, "jobs_run_in_process", in_process)
+    monkeypatch.setattr(settings, "jobs_external_worker", external)
+
+    assert (await get_job_queue(FakeSession()) is not None) == queued
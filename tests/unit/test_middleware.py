@@ -0,0 +1,95 @@
+import logging
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.responses import PlainTextResponse
+
+from app.api.middleware import DBStatsMiddleware
+from app.core.settings import settings
+from app.database import metrics
+from app.database.metrics import (
+    RequestDBStats,
+    request_db_stats,
+    _after_cursor_execute,
+    _on_cursor_execute,
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.info = {}
+
+
+def run_statement(conn, statement: str) -> None:
+    _on_cursor_execute(conn, None, statement, {}, None, False)
+    _after_cursor_execute(conn, None, statement, {}, None, False)
+
+
+def make_app(statements: list[str]):
+    async def endpoint(scope, receive, send):
+        conn = FakeConnection()
+        for statement in statements:
+            run_statement(conn, statement)
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    return DBStatsMiddleware(endpoint)
+
+
+def test_timing_and_slowest_statement(monkeypatch):
+    clock = iter([1.0, 1.002, 2.0, 2.010])
+    monkeypatch.setattr(metrics.time, "perf_counter", lambda: next(clock))
+    conn = FakeConnection()
+
+    stats = RequestDBStats()
+    token = request_db_stats.set(stats)
+    try:
+        run_statement(conn, "SELECT 1")
+        run_statement(conn, "SELECT 2")
+    finally:
+        request_db_stats.reset(token)
+
+    assert stats.statements == 2
+    assert stats.db_time == pytest.approx(0.012)
+    assert stats.slowest_time == pytest.approx(0.010)
+    assert stats.slowest_statement == "SELECT 2"
+    assert conn.info["query_started"] == []
+
+
+def test_outside_request_nothing_recorded():
+    conn = FakeConnection()
+    run_statement(conn, "SELECT 1")
+
+    assert conn.info == {}
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header():
+    app = make_app(["SELECT 1", "SELECT 2"])
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/")
+
+    assert response.headers["x-db-statements"] == "2"
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="2 queries"' in timing
+    assert "db-slowest;dur=" in timing
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_logged(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "db_n_plus_one_threshold", 3)
+    statement = "SELECT pets.id FROM pets WHERE pets.id = $1"
+    app = make_app([statement] * 4 + ["SELECT 1"] * 3)
+
+    with caplog.at_level(logging.WARNING, logger="app.api.middleware"):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            await client.get("/pets")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 1
+    assert "GET /pets" in messages[0]
+    assert "4 раз" in messages[0]
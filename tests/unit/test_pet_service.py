@@ -1,11 +1,14 @@
 import pytest
 from contextlib import nullcontext as does_not_raise
+from types import SimpleNamespace
+from fastapi import HTTPException
 from pydantic import ValidationError
 from unittest.mock import AsyncMock
 
 from app.services import PetService
 from app.schemas import PetCreate, PetUpdate
 from app.database.models import Pet
+from app.repositories.base_repo import Page
 
 @pytest.fixture
 def repo():
@@ -146,3 +149,42 @@ async def test_delete_pet_found(service, repo):
 
     repo.delete.assert_awaited_once_with(1)
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_list_pets_page_summary(service, repo):
+    pets = [
+        Pet(id=1, owner_id=42, name="Рекс", animal_type="dog"),
+        Pet(id=2, owner_id=42, name="Мурка", animal_type="cat"),
+    ]
+    repo.list_page.return_value = Page(items=pets, next_cursor="next")
+    repo.medical_summary.return_value = [
+        SimpleNamespace(
+            id=10,
+            pet_id=1,
+            record_type="vaccine",
+            description="Бешенство",
+            document_url=None,
+            date=None,
+            records_count=3,
+        )
+    ]
+
+    page = await service.list_pets_page(42, limit=2, summary=True)
+
+    repo.medical_summary.assert_awaited_once_with([1, 2])
+    assert page.next_cursor == "next"
+    assert page.items[0].medical_summary.records_count == 3
+    assert page.items[0].medical_summary.latest[0].id == 10
+    assert page.items[1].medical_summary.records_count == 0
+    assert page.items[1].medical_summary.latest == []
+
+
+@pytest.mark.asyncio
+async def test_list_pets_page_bad_cursor(service, repo):
+    repo.list_page.side_effect = ValueError("Некорректный курсор")
+
+    with pytest.raises(HTTPException) as exc:
+        await service.list_pets_page(42, cursor="bad")
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,161 @@
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.api.depends import (
+    get_current_active_provider,
+    validate_service_group,
+)
+from app.core import cache as cache_mod
+from app.core.cache import TTLCache
+from app.core import principal as principal_mod
+from app.core.principal import Principal, principal_cache
+from app.database.models import GroomingService, User, VeterinaryService
+from app.database.types import UserType, ProviderType
+from app.services import UserService
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(repo):
+    return UserService(repository=repo)
+
+
+def make_principal(**kwargs) -> Principal:
+    data = dict(
+        id=1,
+        email="vet@example.com",
+        first_name="Иван",
+        surname="Иванов",
+        patronymic=None,
+        role=UserType.provider,
+        provider_type=ProviderType.vet,
+        is_verified=True,
+    )
+    data.update(kwargs)
+    return Principal(**data)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert cache.get(1) == "a"
+    assert cache.get(2) is None
+    assert cache.get(3) == "c"
+
+
+def test_ttl_cache_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set(1, "a")
+
+    now[0] += 4
+    assert cache.get(1) == "a"
+    now[0] += 2
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_principal_by_id_hits_repository_once(service, repo):
+    repo.get_principal.return_value = make_principal()
+
+    first = await service.principal_by_id(1)
+    second = await service.principal_by_id(1)
+
+    repo.get_principal.assert_awaited_once_with(1)
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_principal_by_id_not_cached_when_missing(service, repo):
+    repo.get_principal.return_value = None
+
+    assert await service.principal_by_id(1) is None
+    assert await service.principal_by_id(1) is None
+    assert repo.get_principal.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload(service, repo):
+    repo.get_principal.return_value = make_principal(is_verified=False)
+    await service.principal_by_id(1)
+
+    principal_cache.invalidate(1)
+    repo.get_principal.return_value = make_principal(is_verified=True)
+    principal = await service.principal_by_id(1)
+
+    assert principal.is_verified is True
+    assert repo.get_principal.await_count == 2
+
+
+def test_user_update_invalidates_only_after_commit():
+    principal_cache.set(1, make_principal())
+    session = Session()
+    user = User(id=1, email="vet@example.com", password_hash="x")
+    session.add(user)
+
+    principal_mod._invalidate_user(None, None, user)
+    assert principal_cache.get(1) is not None
+
+    principal_mod._invalidate_committed(session)
+    assert principal_cache.get(1) is None
+
+
+def test_rollback_keeps_cached_principal():
+    principal_cache.set(1, make_principal())
+    session = Session()
+    user = User(id=1, email="vet@example.com", password_hash="x")
+    session.add(user)
+
+    principal_mod._invalidate_user(None, None, user)
+    principal_mod._discard_pending(session, SimpleNamespace(nested=False))
+    principal_mod._invalidate_committed(session)
+
+    assert principal_cache.get(1) is not None
+
+
+@pytest.mark.asyncio
+async def test_unverified_vet_rejected():
+    with pytest.raises(HTTPException) as exc:
+        await get_current_active_provider(make_principal(is_verified=False))
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_verified_vet_allowed():
+    principal = make_principal()
+    assert await get_current_active_provider(principal) is principal
+
+
+@pytest.mark.asyncio
+async def test_service_group_matches_provider_type():
+    vet_service = VeterinaryService(id=1, name="Осмотр")
+    db = SimpleNamespace(get=AsyncMock(return_value=vet_service))
+
+    assert await validate_service_group(1, make_principal(), db) is vet_service
+
+    db.get.return_value = GroomingService(id=2, name="Стрижка")
+    with pytest.raises(HTTPException) as exc:
+        await validate_service_group(2, make_principal(), db)
+    assert exc.value.status_code == 403
@@ -0,0 +1,35 @@
+import json
+from types import SimpleNamespace
+from typing import List
+
+from app.api.responses import PydanticResponse
+from app.core.serialization import type_adapter
+from app.schemas import SlotItem
+
+
+def test_pydantic_response_dumps_orm_like_objects():
+    slot = SimpleNamespace(
+        id=1,
+        date="2030-01-01",
+        start_time="09:00",
+        end_time="09:30",
+        is_available=True,
+        provider_id=5,
+    )
+
+    response = PydanticResponse(List[SlotItem], [slot])
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [
+        {
+            "date": "2030-01-01",
+            "start_time": "09:00:00",
+            "end_time": "09:30:00",
+            "is_available": True,
+            "id": 1,
+        }
+    ]
+
+
+def test_type_adapter_is_cached():
+    assert type_adapter(List[SlotItem]) is type_adapter(List[SlotItem])
@@ -0,0 +1,40 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_pool():
+    hashed = await security.get_password_hash_async("password123")
+
+    assert await security.verify_password_async("password123", hashed)
+    assert not await security.verify_password_async("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_returns_429(monkeypatch):
+    monkeypatch.setattr(
+        security, "_hash_pending", settings.password_hash_max_pending
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await security.verify_password_async("password123", "hash")
+    assert exc.value.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_rehash_when_rounds_change(monkeypatch):
+    old_context = security.CryptContext(
+        schemes=["bcrypt"], bcrypt__rounds=settings.bcrypt_rounds - 1
+    )
+    hashed = old_context.hash("password123")
+
+    valid, new_hash = await security.verify_and_update_password_async(
+        "password123", hashed
+    )
+
+    assert valid
+    assert new_hash is not None
+    assert security.pwd_context.verify("password123", new_hash)
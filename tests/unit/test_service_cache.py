@@ -0,0 +1,176 @@
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.api.responses import cached_response
+from app.core.response_cache import (
+    MemoryBackend,
+    RedisBackend,
+    ResponseCache,
+)
+from app.database import connection
+from app.database.connection import after_commit, get_db, run_after_commit
+from app.database.models import GroomingService, ProviderService
+from app.schemas import ProviderServiceUpdate
+from app.services import ServiceService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+def make_ps(price: float = 100) -> ProviderService:
+    return ProviderService(
+        id=1,
+        provider_id=1,
+        service_id=1,
+        custom_price=price,
+        custom_duration=30,
+        service=GroomingService(
+            id=1, name="Стрижка", base_price=100, duration_min=30
+        ),
+    )
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        backend = MemoryBackend(maxsize=100, ttl=60)
+    else:
+        backend = RedisBackend(FakeRedis())
+    return ResponseCache(backend, ttl=60)
+
+
+@pytest.fixture
+def repo():
+    repo = AsyncMock()
+    repo.db = SimpleNamespace(info={})
+    return repo
+
+
+@pytest.fixture
+def service(repo, cache):
+    return ServiceService(repository=repo, cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_cached_services_hits_repository_once(service, repo):
+    repo.list_by_provider.return_value = [make_ps()]
+
+    first = await service.cached_services(1)
+    second = await service.cached_services(1)
+
+    repo.list_by_provider.assert_awaited_once_with(1)
+    assert first == second
+    assert b'"custom_price":100.0' in first.body
+
+
+@pytest.mark.asyncio
+async def test_empty_list_not_cached(service, repo):
+    repo.list_by_provider.return_value = []
+
+    await service.cached_services(1)
+    await service.cached_services(1)
+
+    assert repo.list_by_provider.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_provider(service, repo):
+    repo.list_by_provider.return_value = [make_ps()]
+    first = await service.cached_services(1)
+
+    ps = make_ps()
+    repo.get_by_provider_and_id.return_value = ps
+    repo.update.return_value = ps
+    await service.update_service(1, 1, ProviderServiceUpdate(custom_price=150))
+
+    # Until the request commits, readers still get the cached list.
+    assert await service.cached_services(1) == first
+    await run_after_commit(repo.db)
+
+    repo.list_by_provider.return_value = [make_ps(150)]
+    second = await service.cached_services(1)
+
+    assert repo.list_by_provider.await_count == 2
+    assert first.etag != second.etag
+
+
+@pytest.mark.asyncio
+async def test_catalog_change_invalidates_all_providers(service, repo):
+    repo.list_by_provider.return_value = [make_ps()]
+    await service.cached_services(1)
+    await service.cached_services(2)
+
+    await service.invalidate_catalog()
+    await service.cached_services(1)
+    await service.cached_services(2)
+
+    assert repo.list_by_provider.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_304(service, repo):
+    repo.list_by_provider.return_value = [make_ps()]
+    cached = await service.cached_services(1)
+
+    fresh = cached_response(cached)
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] == cached.etag
+
+    not_modified = cached_response(cached, f'W/{cached.etag}, "other"')
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fail", [False, True])
+async def test_get_db_invalidates_only_after_commit(monkeypatch, fail):
+    session = FakeSession()
+    monkeypatch.setattr(connection, "AsyncSessionLocal", lambda: session)
+    calls = []
+
+    async def hook():
+        calls.append(session.commit.await_count)
+
+    # conftest swaps connection.get_db for a fake; use the one imported above
+    dependency = get_db()
+    db = await anext(dependency)
+    after_commit(db, hook)
+    with pytest.raises(RuntimeError if fail else StopAsyncIteration):
+        if fail:
+            await dependency.athrow(RuntimeError("boom"))
+        else:
+            await anext(dependency)
+
+    assert calls == ([] if fail else [1])
+    assert session.info == {}
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock
+
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.cache import TTLCache
+from app.core.sessions import SessionState
+from app.database.types import UserType
+from app.services import SessionService
+from app.services.session_service import (
+    RefreshTokenReused,
+    hash_secret,
+    refresh_secret,
+)
+
+
+@pytest.fixture
+def repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(maxsize=100, ttl=60)
+
+
+@pytest.fixture
+def service(repo, cache):
+    return SessionService(repository=repo, cache=cache)
+
+
+def later() -> datetime:
+    return datetime.utcnow() + timedelta(days=1)
+
+
+def session_row(generation: int, previous_hash=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        user_id=7,
+        revoked_at=None,
+        generation=generation,
+        previous_hash=previous_hash,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_secret(service, repo, cache):
+    repo.rotate.return_value = SimpleNamespace(
+        user_id=7, role=UserType.owner, expires_at=later()
+    )
+
+    token = await service.refresh(f"sid.3.{refresh_secret('sid', 3)}")
+
+    session_id, generation, presented, new_hash, _ = repo.rotate.await_args.args
+    assert (session_id, generation) == ("sid", 3)
+    assert presented == hash_secret(refresh_secret("sid", 3))
+    new_id, new_generation, new_secret = token.refresh_token.split(".")
+    assert (new_id, new_generation) == ("sid", "4")
+    assert new_secret == refresh_secret("sid", 4)
+    assert new_hash == hash_secret(new_secret)
+    assert security.decode_access_token(token.access_token).sid == "sid"
+    assert cache.get("sid").user_id == 7
+
+
+@pytest.mark.asyncio
+async def test_token_without_generation_rotates_from_zero(service, repo):
+    repo.rotate.return_value = SimpleNamespace(
+        user_id=7, role=UserType.owner, expires_at=later()
+    )
+
+    token = await service.refresh("sid.old-secret")
+
+    _, generation, presented, _, _ = repo.rotate.await_args.args
+    assert (generation, presented) == (0, hash_secret("old-secret"))
+    assert token.refresh_token == f"sid.1.{refresh_secret('sid', 1)}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("generation", [0, 3])
+async def test_reused_token_ends_session(service, repo, cache, generation):
+    # Replays are caught however many rotations ago the token was issued.
+    repo.rotate.return_value = None
+    repo.get_by_id.return_value = session_row(generation=4)
+    repo.revoke.return_value = ["sid-reused"]
+    token = (
+        f"sid-reused.{generation}.{refresh_secret('sid-reused', generation)}"
+    )
+
+    with pytest.raises(RefreshTokenReused) as exc:
+        await service.refresh(token)
+
+    assert exc.value.status_code == 401
+    assert "уже использован" in exc.value.detail
+    repo.db.commit.assert_not_awaited()
+    assert cache.get("sid-reused").revoked
+    assert security.revoked_tokens.is_revoked("sid-reused")
+
+
+@pytest.mark.asyncio
+async def test_reused_token_without_generation_ends_session(service, repo):
+    repo.rotate.return_value = None
+    repo.get_by_id.return_value = session_row(
+        generation=5, previous_hash=hash_secret("old-secret")
+    )
+    repo.revoke.return_value = ["sid"]
+
+    with pytest.raises(RefreshTokenReused):
+        await service.refresh("sid.old-secret")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token",
+    ["sid.3.guess", f"sid.4.{refresh_secret('sid', 4)}", "sid.guess"],
+)
+async def test_unknown_token_does_not_revoke(service, repo, token):
+    repo.rotate.return_value = None
+    repo.get_by_id.return_value = session_row(
+        generation=4, previous_hash=hash_secret("other")
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await service.refresh(token)
+
+    assert exc.value.detail == "Недействительный refresh-токен"
+    repo.revoke.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_revoked_session_rejected_from_cache(service, repo, cache):
+    cache.set("sid", SessionState(7, later(), revoked=True))
+
+    with pytest.raises(HTTPException) as exc:
+        await service.refresh("sid.secret")
+
+    assert exc.value.status_code == 401
+    repo.rotate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token", ["no-separator", "sid.x.secret", "sid.1."])
+async def test_malformed_token_rejected(service, repo, token):
+    with pytest.raises(HTTPException):
+        await service.refresh(token)
+
+    repo.rotate.assert_not_awaited()
@@ -0,0 +1,96 @@
+from datetime import date, time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from fastapi import HTTPException
+
+from app.schemas import SlotCreate, SlotSchedule
+from app.services import SlotService
+from app.services.slot_service import expand_schedule
+
+
+@pytest.fixture
+def repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(repo):
+    return SlotService(slot_repository=repo)
+
+
+def make_schedule(**kwargs) -> SlotSchedule:
+    data = dict(
+        weekdays=[0, 1, 2, 3, 4],
+        start_time=time(9),
+        end_time=time(17),
+        slot_minutes=30,
+        date_from=date(2030, 1, 7),
+        weeks=12,
+    )
+    data.update(kwargs)
+    return SlotSchedule(**data)
+
+
+def test_expand_schedule_working_weeks():
+    rows = expand_schedule(make_schedule())
+
+    assert len(rows) == 12 * 5 * 16
+    assert {row["date"].weekday() for row in rows} == {0, 1, 2, 3, 4}
+    assert rows[0]["start_time"] == time(9)
+    assert rows[-1]["end_time"] == time(17)
+
+
+def test_expand_schedule_drops_partial_slot():
+    rows = expand_schedule(
+        make_schedule(end_time=time(10, 45), slot_minutes=30, weeks=1)
+    )
+
+    assert [row["start_time"] for row in rows[:3]] == [
+        time(9),
+        time(9, 30),
+        time(10),
+    ]
+    assert len(rows) == 3 * 5
+
+
+@pytest.mark.asyncio
+async def test_create_schedule_inserts_once(service, repo):
+    repo.create_many_ignore.return_value = 900
+
+    summary = await service.create_schedule(make_schedule(), 7)
+
+    repo.create_many_ignore.assert_awaited_once()
+    rows = repo.create_many_ignore.await_args.args[0]
+    assert len(rows) == 960
+    assert all(row["provider_id"] == 7 for row in rows)
+    assert summary.requested == 960
+    assert summary.created == 900
+    assert summary.skipped == 60
+    assert summary.date_from == date(2030, 1, 7)
+
+
+@pytest.mark.asyncio
+async def test_create_schedule_rejects_bad_weekday(service, repo):
+    with pytest.raises(HTTPException) as exc:
+        await service.create_schedule(make_schedule(weekdays=[7]), 7)
+
+    assert exc.value.status_code == 400
+    repo.create_many_ignore.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_slots_rejects_inverted_times(service, repo):
+    slot = SlotCreate(
+        date=date(2030, 1, 1),
+        start_time=time(10),
+        end_time=time(9),
+        is_available=True,
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await service.create_slots([slot], 7)
+
+    assert exc.value.status_code == 400
+    repo.create_many_ignore.assert_not_awaited()
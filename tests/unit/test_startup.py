@@ -0,0 +1,35 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.exc import ProgrammingError
+
+from app.database.startup import SchemaRevisionError, verify_revision
+
+
+def make_conn(revision=None, error=None):
+    conn = AsyncMock()
+    if error is not None:
+        conn.execute.side_effect = error
+    else:
+        conn.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=revision)
+        )
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_verify_revision_matches():
+    await verify_revision(make_conn("abc"), "abc")
+
+
+@pytest.mark.asyncio
+async def test_verify_revision_mismatch():
+    with pytest.raises(SchemaRevisionError):
+        await verify_revision(make_conn("old"), "abc")
+
+
+@pytest.mark.asyncio
+async def test_verify_revision_without_alembic_table():
+    error = ProgrammingError("SELECT", {}, Exception("no alembic_version"))
+    with pytest.raises(SchemaRevisionError):
+        await verify_revision(make_conn(error=error), "abc")
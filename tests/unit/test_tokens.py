@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.settings import settings
+from app.core.tokens import Keyring, SigningKey, LEGACY_KID
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    security.token_cache.clear()
+    security.revoked_tokens.clear()
+    yield
+    security.token_cache.clear()
+    security.revoked_tokens.clear()
+
+
+def ed25519_pem() -> str:
+    return (
+        ed25519.Ed25519PrivateKey.generate()
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+@pytest.fixture
+def rotated(monkeypatch):
+    legacy = SigningKey.load(
+        LEGACY_KID, settings.algorithm, settings.secret_key
+    )
+    new = SigningKey.load("2026-10", "EdDSA", private_key=ed25519_pem())
+    ring = Keyring([legacy, new], active_kid="2026-10")
+    monkeypatch.setattr(security, "keyring", ring)
+    return ring
+
+
+def test_decode_is_cached(monkeypatch):
+    token = security.create_access_token("7", "owner")
+    calls = []
+    verify = security._verify
+    monkeypatch.setattr(
+        security, "_verify", lambda t: calls.append(t) or verify(t)
+    )
+
+    first = security.decode_access_token(token)
+    second = security.decode_access_token(token)
+
+    assert first.sub == second.sub == "7"
+    assert len(calls) == 1
+
+
+def test_cache_entry_does_not_outlive_exp():
+    token = security.create_access_token(
+        "7", "owner", expires_delta=timedelta(seconds=5)
+    )
+    security.decode_access_token(token)
+
+    digest = security.token_digest(token)
+    expires_at, _ = security.token_cache._data[digest]
+    assert expires_at - security.time.monotonic() <= 5
+
+
+def test_revoked_token_rejected_even_when_cached():
+    token = security.create_access_token("7", "owner")
+    security.decode_access_token(token)
+
+    security.revoke_access_token(token)
+
+    with pytest.raises(HTTPException) as exc:
+        security.decode_access_token(token)
+    assert exc.value.detail == "Токен отозван"
+
+
+def test_token_without_jti_can_be_revoked():
+    def legacy_token(sub: str) -> str:
+        return jwt.encode(
+            {"sub": sub, "exp": datetime.utcnow() + timedelta(minutes=5)},
+            settings.secret_key,
+            algorithm=settings.algorithm,
+        )
+
+    token = legacy_token("1")
+    security.revoke_access_token(token)
+
+    with pytest.raises(HTTPException) as exc:
+        security.decode_access_token(token)
+    assert exc.value.detail == "Токен отозван"
+    assert security.decode_access_token(legacy_token("2")).sub == "2"
+
+
+def test_rotation_keeps_old_tokens_valid(rotated):
+    legacy_token = jwt.encode(
+        {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=5)},
+        settings.secret_key,
+        algorithm=settings.algorithm,
+    )
+    token = security.create_access_token("2", "provider")
+
+    assert jwt.get_unverified_header(token)["kid"] == "2026-10"
+    assert security.decode_access_token(legacy_token).sub == "1"
+    assert security.decode_access_token(token).sub == "2"
+
+
+def test_unknown_kid_rejected(rotated):
+    token = jwt.encode(
+        {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=5)},
+        "other",
+        algorithm="HS256",
+        headers={"kid": "missing"},
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        security.decode_access_token(token)
+    assert exc.value.status_code == 403
+
+
+def test_jwks_verifies_offline(rotated):
+    token = security.create_access_token("2", "provider")
+    (jwk,) = rotated.jwks()["keys"]
+
+    public_key = jwt.PyJWK(jwk).key
+    payload = jwt.decode(token, public_key, algorithms=[jwk["alg"]])
+
+    assert jwk["kid"] == "2026-10"
+    assert payload["sub"] == "2"